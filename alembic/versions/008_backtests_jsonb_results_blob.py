@@ -0,0 +1,48 @@
+"""store backtest config/metrics as jsonb and results in a compressed blob
+
+Revision ID: 008
+Revises: 007
+Create Date: 2024-01-08 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Switch JSON columns to JSONB
+    op.alter_column(
+        'backtests', 'config',
+        type_=postgresql.JSONB(),
+        postgresql_using='config::jsonb'
+    )
+    op.alter_column(
+        'backtests', 'metrics',
+        type_=postgresql.JSONB(),
+        postgresql_using='metrics::jsonb'
+    )
+    
+    # Compressed trades/equity curve payload
+    op.add_column('backtests', sa.Column('results_blob', sa.LargeBinary(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('backtests', 'results_blob')
+    
+    op.alter_column(
+        'backtests', 'metrics',
+        type_=postgresql.JSON(),
+        postgresql_using='metrics::json'
+    )
+    op.alter_column(
+        'backtests', 'config',
+        type_=postgresql.JSON(),
+        postgresql_using='config::json'
+    )
@@ -0,0 +1,27 @@
+"""add backtests account/status/created_at index
+
+Revision ID: 009
+Revises: 008
+Create Date: 2024-01-09 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves account backtest lists filtered by status, newest first
+    op.create_index(
+        'idx_backtests_account_status_created',
+        'backtests',
+        ['account_id', 'status', 'created_at']
+    )
+
+
+def downgrade():
+    op.drop_index('idx_backtests_account_status_created', 'backtests')
@@ -0,0 +1,65 @@
+"""generate time-ordered uuid v7 primary keys in the database
+
+Revision ID: 010
+Revises: 009
+Create Date: 2024-01-10 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+# Tables with a generated UUID primary key named "id"
+TABLES = (
+    'users',
+    'user_accounts',
+    'investor_invitations',
+    'broker_connections',
+    'symbol_mappings',
+    'orders',
+    'trades',
+    'positions',
+    'backtests',
+    'notifications',
+)
+
+
+def upgrade():
+    # UUID v7: 48-bit Unix ms timestamp over a random v4 UUID, with the
+    # version nibble raised from 4 to 7 (variant bits are already RFC 4122)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+    """)
+    
+    # Rows inserted outside the ORM (COPY, raw SQL) get v7 keys as well
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_uuid_v7()")
+
+
+def downgrade():
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+    
+    op.execute("DROP FUNCTION IF EXISTS gen_uuid_v7()")
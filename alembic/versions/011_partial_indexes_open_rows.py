@@ -0,0 +1,59 @@
+"""partial indexes for open orders, open positions and unread notifications
+
+Revision ID: 011
+Revises: 010
+Create Date: 2024-01-11 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Working orders per account; symbol/quantity included for index-only scans
+    op.create_index(
+        'idx_orders_open',
+        'orders',
+        ['account_id', 'trading_mode'],
+        postgresql_where=sa.text("status IN ('pending', 'submitted', 'partial')"),
+        postgresql_include=['symbol', 'quantity']
+    )
+    # Superseded by idx_orders_open; status alone is too coarse to be useful
+    op.drop_index('idx_orders_status', 'orders')
+    
+    op.create_index(
+        'idx_positions_open',
+        'positions',
+        ['account_id', 'trading_mode'],
+        postgresql_where=sa.text('closed_at IS NULL')
+    )
+    
+    # Unread feed: only unread rows, ordered by recency
+    op.drop_index('idx_notifications_unread', table_name='notifications')
+    op.create_index(
+        'idx_notifications_unread',
+        'notifications',
+        ['user_id', 'created_at'],
+        postgresql_where=sa.text('read_at IS NULL')
+    )
+
+
+def downgrade():
+    op.drop_index('idx_notifications_unread', table_name='notifications')
+    op.create_index(
+        'idx_notifications_unread',
+        'notifications',
+        ['user_id', 'read_at'],
+        postgresql_using='btree'
+    )
+    
+    op.drop_index('idx_positions_open', 'positions')
+    
+    op.create_index('idx_orders_status', 'orders', ['status', 'trading_mode'])
+    op.drop_index('idx_orders_open', 'orders')
@@ -0,0 +1,98 @@
+"""store enum columns as smallint codes
+
+Revision ID: 012
+Revises: 011
+Create Date: 2024-01-12 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+# Labels in code order; a label's code is its position in the list and
+# must match the member order of the Python enum the column maps to
+ORDER_STATUS = ['pending', 'submitted', 'partial', 'filled', 'cancelled', 'rejected']
+ORDER_SIDE = ['buy', 'sell']
+USER_ROLE = ['admin', 'trader', 'investor']
+INVITATION_STATUS = ['pending', 'accepted', 'rejected', 'expired']
+NOTIFICATION_TYPE = [
+    'order_executed',
+    'strategy_error',
+    'threshold_alert',
+    'connection_lost',
+    'system_alert',
+    'trailing_stop_triggered',
+    'investor_invitation',
+    'account_access_granted',
+    'session_timeout_warning',
+    'account_locked',
+    'loss_limit_breached',
+    'strategy_paused',
+]
+NOTIFICATION_SEVERITY = ['info', 'warning', 'error', 'critical']
+
+# (table, column, enum type name, labels)
+COLUMNS = [
+    ('orders', 'status', 'orderstatus', ORDER_STATUS),
+    ('orders', 'side', 'orderside', ORDER_SIDE),
+    ('trades', 'side', 'orderside', ORDER_SIDE),
+    ('users', 'role', 'user_role', USER_ROLE),
+    ('investor_invitations', 'status', 'invitation_status', INVITATION_STATUS),
+    ('notifications', 'type', 'notification_type', NOTIFICATION_TYPE),
+    ('notifications', 'severity', 'notification_severity', NOTIFICATION_SEVERITY),
+]
+
+
+def _label_array(labels):
+    return "ARRAY[{}]".format(', '.join(f"'{label}'" for label in labels))
+
+
+def _create_open_orders_index(predicate):
+    op.create_index(
+        'idx_orders_open',
+        'orders',
+        ['account_id', 'trading_mode'],
+        postgresql_where=sa.text(predicate),
+        postgresql_include=['symbol', 'quantity']
+    )
+
+
+def upgrade():
+    # The partial index predicate references status and must be rebuilt
+    op.drop_index('idx_orders_open', 'orders')
+    
+    for table, column, _, labels in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE SMALLINT "
+            f"USING array_position({_label_array(labels)}, {column}::text) - 1"
+        )
+    
+    for type_name in dict.fromkeys(type_name for _, _, type_name, _ in COLUMNS):
+        op.execute(f'DROP TYPE IF EXISTS {type_name}')
+    
+    _create_open_orders_index('status IN (0, 1, 2)')
+
+
+def downgrade():
+    op.drop_index('idx_orders_open', 'orders')
+    
+    created = set()
+    for table, column, type_name, labels in COLUMNS:
+        if type_name not in created:
+            op.execute(
+                f"CREATE TYPE {type_name} AS ENUM "
+                f"({', '.join(repr(label) for label in labels)})"
+            )
+            created.add(type_name)
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} "
+            f"USING ({_label_array(labels)})[{column} + 1]::{type_name}"
+        )
+    
+    _create_open_orders_index("status IN ('pending', 'submitted', 'partial')")
@@ -0,0 +1,56 @@
+"""store money columns as bigint paise
+
+Revision ID: 013
+Revises: 012
+Create Date: 2024-01-13 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, original numeric type, has server default of zero)
+COLUMNS = [
+    ('orders', 'price', 'NUMERIC(10, 2)', False),
+    ('orders', 'stop_price', 'NUMERIC(10, 2)', False),
+    ('orders', 'average_price', 'NUMERIC(10, 2)', False),
+    ('trades', 'price', 'NUMERIC(10, 2)', False),
+    ('trades', 'commission', 'NUMERIC(10, 2)', True),
+    ('positions', 'entry_price', 'NUMERIC(10, 2)', False),
+    ('positions', 'current_price', 'NUMERIC(10, 2)', False),
+    ('positions', 'unrealized_pnl', 'NUMERIC(10, 2)', True),
+    ('positions', 'realized_pnl', 'NUMERIC(10, 2)', True),
+    ('positions', 'stop_loss', 'NUMERIC(10, 2)', False),
+    ('positions', 'take_profit', 'NUMERIC(10, 2)', False),
+    ('risk_limits', 'max_loss_limit', 'NUMERIC(15, 2)', False),
+    ('risk_limits', 'current_loss', 'NUMERIC(15, 2)', True),
+]
+
+
+def upgrade():
+    for table, column, _, has_default in COLUMNS:
+        if has_default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT "
+            f"USING round({column} * 100)::bigint"
+        )
+        if has_default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT 0")
+
+
+def downgrade():
+    for table, column, numeric_type, has_default in COLUMNS:
+        if has_default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {numeric_type} "
+            f"USING {column} / 100.0"
+        )
+        if has_default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT 0")
@@ -0,0 +1,43 @@
+"""trim trade indexes and make the broker order index partial
+
+Revision ID: 014
+Revises: 013
+Create Date: 2024-01-14 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # No query filters trades by symbol; every extra index slows fill inserts
+    op.drop_index('idx_trades_symbol', 'trades')
+    
+    # Order fills in time order; also backs the orders foreign key
+    op.drop_index('idx_trades_order', 'trades')
+    op.create_index('idx_trades_order', 'trades', ['order_id', 'executed_at'])
+    
+    # Orders only get a broker ID once submitted; skip the NULL entries
+    op.drop_index('idx_orders_broker', 'orders')
+    op.create_index(
+        'idx_orders_broker',
+        'orders',
+        ['broker_order_id'],
+        postgresql_where=sa.text('broker_order_id IS NOT NULL')
+    )
+
+
+def downgrade():
+    op.drop_index('idx_orders_broker', 'orders')
+    op.create_index('idx_orders_broker', 'orders', ['broker_order_id'])
+    
+    op.drop_index('idx_trades_order', 'trades')
+    op.create_index('idx_trades_order', 'trades', ['order_id'])
+    
+    op.create_index('idx_trades_symbol', 'trades', ['symbol', 'trading_mode'])
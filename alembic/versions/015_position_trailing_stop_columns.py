@@ -0,0 +1,69 @@
+"""replace positions.trailing_stop_config JSON with typed columns
+
+Revision ID: 015
+Revises: 014
+Create Date: 2024-01-15 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'positions',
+        sa.Column('trailing_enabled', sa.Boolean(), nullable=False, server_default=sa.false())
+    )
+    op.add_column('positions', sa.Column('trailing_percentage', sa.Float(), nullable=True))
+    # Prices in paise, like the other money columns
+    op.add_column('positions', sa.Column('trailing_stop_price', sa.BigInteger(), nullable=True))
+    op.add_column('positions', sa.Column('trailing_high', sa.BigInteger(), nullable=True))
+    op.add_column('positions', sa.Column('trailing_low', sa.BigInteger(), nullable=True))
+    
+    op.execute("""
+        UPDATE positions SET
+            trailing_enabled = COALESCE((trailing_stop_config->>'enabled')::boolean, false),
+            trailing_percentage = (trailing_stop_config->>'percentage')::double precision,
+            trailing_stop_price = round((trailing_stop_config->>'current_stop_price')::numeric * 100),
+            trailing_high = round((trailing_stop_config->>'highest_price')::numeric * 100),
+            trailing_low = round((trailing_stop_config->>'lowest_price')::numeric * 100)
+        WHERE trailing_stop_config IS NOT NULL
+    """)
+    
+    op.drop_column('positions', 'trailing_stop_config')
+    
+    op.create_index(
+        'idx_positions_trailing',
+        'positions',
+        ['symbol', 'trading_mode'],
+        postgresql_where=sa.text('trailing_enabled AND closed_at IS NULL')
+    )
+
+
+def downgrade():
+    op.drop_index('idx_positions_trailing', 'positions')
+    
+    op.add_column('positions', sa.Column('trailing_stop_config', postgresql.JSON(), nullable=True))
+    op.execute("""
+        UPDATE positions SET trailing_stop_config = json_build_object(
+            'enabled', trailing_enabled,
+            'percentage', trailing_percentage,
+            'current_stop_price', trailing_stop_price / 100.0,
+            'highest_price', trailing_high / 100.0,
+            'lowest_price', trailing_low / 100.0
+        )
+        WHERE trailing_percentage IS NOT NULL
+    """)
+    
+    op.drop_column('positions', 'trailing_low')
+    op.drop_column('positions', 'trailing_high')
+    op.drop_column('positions', 'trailing_stop_price')
+    op.drop_column('positions', 'trailing_percentage')
+    op.drop_column('positions', 'trailing_enabled')
@@ -0,0 +1,37 @@
+"""store session tokens as SHA-256 digests
+
+Revision ID: 016
+Revises: 015
+Create Date: 2024-01-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 32-byte digests instead of ~500-char JWTs shrink the primary key index;
+    # hashing in place keeps existing sessions valid (sha256() needs PG 11+)
+    op.alter_column(
+        'sessions',
+        'token',
+        type_=sa.LargeBinary(32),
+        postgresql_using="sha256(convert_to(token, 'UTF8'))"
+    )
+
+
+def downgrade():
+    # Digests cannot be turned back into tokens; everyone signs in again
+    op.execute('DELETE FROM sessions')
+    op.alter_column(
+        'sessions',
+        'token',
+        type_=sa.String(512),
+        postgresql_using="encode(token, 'hex')"
+    )
@@ -354,7 +354,7 @@ def get_monitoring_metrics():
         
         # Get monitoring metrics
         monitoring = get_monitoring_service()
-        metrics = monitoring.collect_all_metrics()
+        metrics = monitoring.refresh_metrics()
         
         return jsonify(metrics), 200
         
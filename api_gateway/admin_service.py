@@ -6,7 +6,7 @@ import logging
 import psutil
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, undefer
 from sqlalchemy import func, and_, or_
 
 from shared.models import (
@@ -575,7 +575,10 @@ class AdminService:
         # Get session creation logs as a proxy for audit logs
         from shared.models import Session as UserSession
         
-        query = self.db.query(UserSession).filter(
+        query = self.db.query(UserSession).options(
+            selectinload(UserSession.user),
+            undefer(UserSession.user_agent)
+        ).filter(
             UserSession.created_at >= start_date,
             UserSession.created_at <= end_date
         )
@@ -6,13 +6,16 @@ import logging
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
 
 from shared.config import get_settings
+from shared.database.types import token_digest
 from shared.models import User, Session as SessionModel, UserRole
 from shared.utils.password import hash_password, verify_password, validate_password_strength
 from shared.utils.jwt import generate_token, decode_token, get_token_expiration
+from shared.utils.ids import uuid7
 
 logger = logging.getLogger(__name__)
 
@@ -84,7 +87,7 @@ class AuthService:
         
         # Create user
         user = User(
-            id=uuid.uuid4(),
+            id=uuid7(),
             email=email.lower().strip(),
             password_hash=password_hash,
             role=role,
@@ -96,6 +99,8 @@ class AuthService:
             self.db.add(user)
             self.db.commit()
             self.db.refresh(user)
+            # Collections are raise-loaded; load the accounts callers inspect
+            self.db.refresh(user, ['trader_accounts'])
             logger.info(f"User registered: {user.email} with role {role.value}")
             return user
         except IntegrityError:
@@ -127,7 +132,9 @@ class AuthService:
             AccountLockedError: If account is locked
         """
         # Find user by email
-        user = self.db.query(User).filter(User.email == email.lower().strip()).first()
+        user = self.db.query(User).options(
+            selectinload(User.trader_accounts)
+        ).filter(User.email == email.lower().strip()).first()
         
         if not user:
             logger.warning(f"Login failed: User not found - {email}")
@@ -171,7 +178,7 @@ class AuthService:
         
         # Create session
         session = SessionModel(
-            token=token,
+            token=token_digest(token),
             user_id=user.id,
             created_at=datetime.utcnow(),
             expires_at=get_token_expiration(),
@@ -223,7 +230,9 @@ class AuthService:
             return None
         
         # Get user
-        user = self.db.query(User).filter(User.id == session.user_id).first()
+        user = self.db.query(User).options(
+            selectinload(User.trader_accounts)
+        ).filter(User.id == session.user_id).first()
         if not user:
             logger.warning("User not found for session")
             self.db.delete(session)
@@ -327,22 +336,41 @@ class AuthService:
         user.failed_login_attempts = 0
         self.db.commit()
     
-    def cleanup_expired_sessions(self) -> int:
+    def cleanup_expired_sessions(self, batch_size: int = 1000) -> int:
         """
         Remove expired sessions from database.
         Should be run periodically as a background task.
         
+        Rows are deleted in batches of ``batch_size``, each in its own
+        transaction, so a large backlog never holds locks for long. Rows
+        locked by a concurrent request are skipped and picked up next run.
+        
+        Args:
+            batch_size: Maximum sessions deleted per transaction
+        
         Returns:
             Number of sessions deleted
         """
-        expired_sessions = self.db.query(SessionModel).filter(
-            SessionModel.expires_at < datetime.utcnow()
-        ).all()
+        now = datetime.utcnow()
+        expired = (
+            select(SessionModel.token)
+            .where(SessionModel.expires_at < now)
+            .order_by(SessionModel.expires_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
         
-        count = len(expired_sessions)
-        for session in expired_sessions:
-            self.db.delete(session)
+        count = 0
+        while True:
+            result = self.db.execute(
+                delete(SessionModel)
+                .where(SessionModel.token.in_(expired.scalar_subquery()))
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+            count += result.rowcount
+            if result.rowcount < batch_size:
+                break
         
-        self.db.commit()
         logger.info(f"Cleaned up {count} expired sessions")
         return count
@@ -3,13 +3,13 @@ Backtest API Routes
 
 Provides REST API endpoints for backtesting functionality.
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 from datetime import datetime
 import logging
 
 from api_gateway.middleware import require_auth, require_role
 from backtesting_engine.backtest_service import BacktestService
-from shared.models.backtest import BacktestConfig
+from shared.models.backtest import BacktestConfig, BacktestStatus
 from shared.database.connection import get_db_session
 
 logger = logging.getLogger(__name__)
@@ -147,7 +147,7 @@ def get_backtest_results(backtest_id: str):
             if not result:
                 return jsonify({'error': 'Backtest not found or not completed'}), 404
             
-            return jsonify(result.to_dict()), 200
+            return Response(result.to_json(), status=200, mimetype='application/json')
         finally:
             db.close()
     
@@ -164,6 +164,7 @@ def list_backtests():
     
     Query parameters:
     - strategy_id: Filter by strategy ID (optional)
+    - status: Filter by status - running, completed or failed (optional)
     - limit: Maximum number of results (default: 50)
     
     Returns:
@@ -189,15 +190,23 @@ def list_backtests():
     try:
         user = request.user
         strategy_id = request.args.get('strategy_id')
+        status = request.args.get('status')
         limit = int(request.args.get('limit', 50))
         
+        if status:
+            try:
+                status = BacktestStatus(status)
+            except ValueError:
+                return jsonify({'error': f'Invalid status: {status}'}), 400
+        
         db = next(get_db())
         try:
             backtests = backtest_service.list_backtests(
                 strategy_id=strategy_id,
                 account_id=user['account_id'],
                 limit=limit,
-                db=db
+                db=db,
+                status=status
             )
             
             return jsonify({'backtests': backtests}), 200
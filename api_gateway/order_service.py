@@ -220,9 +220,11 @@ class OrderService:
         
         # Apply limit
         limit = filters.get('limit', 100)
-        orders = query.order_by(Order.created_at.desc()).limit(limit).all()
+        rows = query.with_entities(*OrderData.columns()).order_by(
+            Order.created_at.desc()
+        ).limit(limit).all()
         
-        return [OrderData.from_orm(o) for o in orders]
+        return [OrderData.from_mapping(row._mapping) for row in rows]
     
     def update_order_from_broker(
         self,
@@ -263,6 +263,8 @@ class PositionService:
         
         # Apply limit
         limit = filters.get('limit', 100)
-        positions = query.order_by(Position.closed_at.desc()).limit(limit).all()
+        rows = query.with_entities(*PositionData.columns()).order_by(
+            Position.closed_at.desc()
+        ).limit(limit).all()
         
-        return [PositionData.from_orm(p) for p in positions]
+        return [PositionData.from_mapping(row._mapping) for row in rows]
@@ -7,10 +7,11 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 from pydantic import BaseModel, Field
 
 from shared.database.connection import get_db_session
+from shared.models.risk_data import dump_json
 from api_gateway.risk_management_service import RiskManagementService
 from api_gateway.middleware import require_auth
 from shared.utils.logging_config import get_logger
@@ -68,10 +69,11 @@ def set_max_loss_limit():
             max_loss_limit=Decimal(str(data.max_loss_limit))
         )
         
-        return jsonify({
-            'success': True,
-            'data': risk_limits.to_dict()
-        }), 200
+        return Response(
+            dump_json({'success': True, 'data': risk_limits}),
+            status=200,
+            mimetype='application/json'
+        )
         
     except ValueError as e:
         logger.error(f"Validation error in set_max_loss_limit: {e}")
@@ -120,10 +122,11 @@ def get_risk_limits(account_id: str, trading_mode: str):
                 'error': 'Risk limits not found'
             }), 404
         
-        return jsonify({
-            'success': True,
-            'data': risk_limits.to_dict()
-        }), 200
+        return Response(
+            dump_json({'success': True, 'data': risk_limits}),
+            status=200,
+            mimetype='application/json'
+        )
         
     except ValueError as e:
         logger.error(f"Validation error in get_risk_limits: {e}")
@@ -166,10 +169,11 @@ def get_current_loss(account_id: str, trading_mode: str):
             trading_mode=trading_mode
         )
         
-        return jsonify({
-            'success': True,
-            'data': loss_calc.to_dict()
-        }), 200
+        return Response(
+            dump_json({'success': True, 'data': loss_calc}),
+            status=200,
+            mimetype='application/json'
+        )
         
     except ValueError as e:
         logger.error(f"Validation error in get_current_loss: {e}")
@@ -260,10 +264,11 @@ def acknowledge_limit_breach():
             new_limit=Decimal(str(data.new_limit)) if data.new_limit else None
         )
         
-        return jsonify({
-            'success': True,
-            'data': risk_limits.to_dict()
-        }), 200
+        return Response(
+            dump_json({'success': True, 'data': risk_limits}),
+            status=200,
+            mimetype='application/json'
+        )
         
     except ValueError as e:
         logger.error(f"Validation error in acknowledge_limit_breach: {e}")
@@ -6,13 +6,14 @@ import logging
 import uuid
 from datetime import datetime, timedelta
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
 
 from shared.models import (
     User, UserAccount, AccountAccess, InvestorInvitation,
     UserRole, InvitationStatus
 )
+from shared.utils.ids import uuid7
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +79,7 @@ class UserService:
         
         # Create account
         account = UserAccount(
-            id=uuid.uuid4(),
+            id=uuid7(),
             trader_id=trader_id,
             name=account_name,
             is_active=True
@@ -151,7 +152,7 @@ class UserService:
         
         # Create invitation
         invitation = InvestorInvitation(
-            id=uuid.uuid4(),
+            id=uuid7(),
             account_id=account_id,
             inviter_id=inviter_id,
             invitee_email=invitee_email.lower().strip(),
@@ -303,7 +304,9 @@ class UserService:
         Returns:
             List of user dictionaries with access info
         """
-        accesses = self.db.query(AccountAccess).filter(
+        accesses = self.db.query(AccountAccess).options(
+            selectinload(AccountAccess.user)
+        ).filter(
             AccountAccess.account_id == account_id
         ).all()
         
@@ -329,7 +332,9 @@ class UserService:
         Returns:
             List of user accounts
         """
-        accesses = self.db.query(AccountAccess).filter(
+        accesses = self.db.query(AccountAccess).options(
+            selectinload(AccountAccess.account)
+        ).filter(
             AccountAccess.user_id == investor_id
         ).all()
         
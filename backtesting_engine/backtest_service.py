@@ -14,6 +14,7 @@ from shared.models.backtest import (
     PerformanceMetrics
 )
 from shared.database.connection import get_db_session
+from shared.utils.ids import uuid7
 from backtesting_engine.data_loader import HistoricalDataLoader, MultiTimeframeDataSynchronizer
 from backtesting_engine.execution_engine import BacktestExecutionEngine
 from backtesting_engine.metrics_calculator import MetricsCalculator
@@ -44,7 +45,7 @@ class BacktestService:
         config.validate()
         
         # Create backtest record
-        backtest_id = str(uuid.uuid4())
+        backtest_id = str(uuid7())
         backtest = Backtest(
             id=uuid.UUID(backtest_id),
             strategy_id=uuid.UUID(config.strategy_id),
@@ -124,11 +125,7 @@ class BacktestService:
         if backtest:
             backtest.status = BacktestStatus.COMPLETED
             backtest.completed_at = datetime.utcnow()
-            backtest.metrics = {
-                'metrics': metrics.to_dict(),
-                'trades': [t.to_dict() for t in trades],
-                'equity_curve': [p.to_dict() for p in equity_curve]
-            }
+            backtest.store_results(metrics, trades, equity_curve)
             db.commit()
         
         logger.info(f"Backtest {backtest_id} completed successfully")
@@ -172,7 +169,7 @@ class BacktestService:
         if not backtest:
             return None
         
-        if backtest.status != BacktestStatus.COMPLETED:
+        if backtest.status is not BacktestStatus.COMPLETED:
             return None
         
         return BacktestResult.from_orm(backtest)
@@ -182,7 +179,8 @@ class BacktestService:
         strategy_id: Optional[str] = None,
         account_id: Optional[str] = None,
         limit: int = 50,
-        db: Session = None
+        db: Session = None,
+        status: Optional[BacktestStatus] = None
     ) -> List[Dict]:
         """
         List backtests with optional filters.
@@ -192,6 +190,7 @@ class BacktestService:
             account_id: Filter by account ID
             limit: Maximum number of results
             db: Database session
+            status: Filter by backtest status
             
         Returns:
             List of backtest summaries
@@ -204,6 +203,9 @@ class BacktestService:
         if account_id:
             query = query.filter(Backtest.account_id == uuid.UUID(account_id))
         
+        if status:
+            query = query.filter(Backtest.status == status)
+        
         query = query.order_by(Backtest.created_at.desc()).limit(limit)
         
         backtests = query.all()
@@ -220,7 +222,7 @@ class BacktestService:
             }
             
             # Add summary metrics if completed
-            if bt.status == BacktestStatus.COMPLETED and bt.metrics:
+            if bt.status is BacktestStatus.COMPLETED and bt.metrics:
                 metrics = bt.metrics.get('metrics', {})
                 result['summary'] = {
                     'total_return': metrics.get('total_return', 0),
@@ -258,7 +260,7 @@ class BacktestService:
         if not backtest:
             raise ValueError(f"Backtest {backtest_id} not found")
         
-        if backtest.status != BacktestStatus.COMPLETED:
+        if backtest.status is not BacktestStatus.COMPLETED:
             raise ValueError("Can only activate strategies from completed backtests")
         
         # In production, this would create an active strategy instance
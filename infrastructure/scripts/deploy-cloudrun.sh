@@ -64,6 +64,22 @@ gcloud run services replace infrastructure/cloudrun/analytics-service.yaml \
 echo "✓ Analytics Service deployed"
 echo ""
 
+# Deploy Notification Worker
+echo "Deploying Notification Worker..."
+replace_project_id infrastructure/cloudrun/notification-worker.yaml
+gcloud beta run worker-pools replace infrastructure/cloudrun/notification-worker.yaml \
+    --region=$REGION
+echo "✓ Notification Worker deployed"
+echo ""
+
+# Deploy Monitoring
+echo "Deploying Monitoring..."
+replace_project_id infrastructure/cloudrun/monitoring.yaml
+gcloud beta run worker-pools replace infrastructure/cloudrun/monitoring.yaml \
+    --region=$REGION
+echo "✓ Monitoring deployed"
+echo ""
+
 echo "All services deployed successfully!"
 echo ""
 echo "Service URLs:"
@@ -62,6 +62,7 @@ def main():
     
     # Initialize components
     symbol_mapping_service = SymbolMappingService(db_session)
+    symbol_mapping_service.start_invalidation_listener()
     paper_simulator = PaperTradingSimulator(db_session, redis_client)
     position_manager = PositionManager(db_session)
     trailing_stop_manager = TrailingStopManager(db_session)
@@ -114,6 +115,7 @@ def main():
         logger.info("Order Processing Service shutting down")
         if market_data_processor:
             market_data_processor.stop()
+        symbol_mapping_service.stop_invalidation_listener()
         redis_client.close()
         db_session.close()
 
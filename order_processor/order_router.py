@@ -9,6 +9,7 @@ from shared.models.trade import Trade, TradeData
 from shared.models.broker_connection import BrokerConnection
 from shared.brokers.base import IBrokerConnector, BrokerOrder, BrokerOrderResponse
 from shared.services.symbol_mapping_service import SymbolMappingService
+from shared.utils.ids import uuid7
 from shared.utils.logging_config import get_logger
 from order_processor.paper_trading_simulator import PaperTradingSimulator
 
@@ -86,7 +87,7 @@ class OrderRouter:
         
         # Create order record
         order = Order(
-            id=uuid.uuid4(),
+            id=uuid7(),
             account_id=uuid.UUID(account_id),
             strategy_id=uuid.UUID(strategy_id) if strategy_id else None,
             symbol=symbol,
@@ -468,6 +469,8 @@ class OrderRouter:
         if trading_mode:
             query = query.filter(Order.trading_mode == trading_mode)
         
-        orders = query.order_by(Order.created_at.desc()).limit(limit).all()
+        rows = query.with_entities(*OrderData.columns()).order_by(
+            Order.created_at.desc()
+        ).limit(limit).all()
         
-        return [OrderData.from_orm(o) for o in orders]
+        return [OrderData.from_mapping(row._mapping) for row in rows]
@@ -3,9 +3,9 @@
 from typing import Optional, Dict
 from decimal import Decimal
 from datetime import datetime
-import uuid
 from shared.models.order import OrderData, OrderStatus, OrderSide, OrderType, TradingMode
 from shared.models.trade import TradeData
+from shared.utils.ids import uuid7
 from shared.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -72,7 +72,7 @@ class PaperTradingSimulator:
         
         # Create trade
         trade = TradeData(
-            id=str(uuid.uuid4()),
+            id=str(uuid7()),
             order_id=order.id,
             account_id=order.account_id,
             symbol=order.symbol,
@@ -143,7 +143,7 @@ class PaperTradingSimulator:
         
         # Create trade
         trade = TradeData(
-            id=str(uuid.uuid4()),
+            id=str(uuid7()),
             order_id=order.id,
             account_id=order.account_id,
             symbol=order.symbol,
@@ -220,7 +220,7 @@ class PaperTradingSimulator:
         
         # Create trade
         trade = TradeData(
-            id=str(uuid.uuid4()),
+            id=str(uuid7()),
             order_id=order.id,
             account_id=order.account_id,
             symbol=order.symbol,
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from shared.models.position import Position, PositionData, PositionSide, TrailingStopConfig
 from shared.models.trade import TradeData
 from shared.models.order import TradingMode, OrderSide
+from shared.utils.ids import uuid7
 from shared.utils.logging_config import get_logger
 
 if TYPE_CHECKING:
@@ -55,21 +56,21 @@ class PositionManager:
         position_side = PositionSide.LONG if trade.side == OrderSide.BUY else PositionSide.SHORT
         
         # Initialize trailing stop config if percentage provided
-        trailing_stop_config = None
+        trailing_stop = None
         if trailing_stop_percentage:
-            trailing_stop_config = {
-                'enabled': True,
-                'percentage': trailing_stop_percentage,
-                'current_stop_price': self._calculate_initial_trailing_stop(
+            trailing_stop = TrailingStopConfig(
+                enabled=True,
+                percentage=trailing_stop_percentage,
+                current_stop_price=self._calculate_initial_trailing_stop(
                     trade.price, position_side, trailing_stop_percentage
                 ),
-                'highest_price': trade.price if position_side == PositionSide.LONG else 0,
-                'lowest_price': trade.price if position_side == PositionSide.SHORT else float('inf')
-            }
+                highest_price=trade.price if position_side == PositionSide.LONG else 0,
+                lowest_price=trade.price if position_side == PositionSide.SHORT else 0
+            )
         
         # Create position
         position = Position(
-            id=uuid.uuid4(),
+            id=uuid7(),
             account_id=uuid.UUID(trade.account_id),
             strategy_id=uuid.UUID(strategy_id) if strategy_id else None,
             symbol=trade.symbol,
@@ -82,7 +83,7 @@ class PositionManager:
             trading_mode=trade.trading_mode,
             stop_loss=stop_loss,
             take_profit=take_profit,
-            trailing_stop_config=trailing_stop_config,
+            trailing_stop=trailing_stop,
             opened_at=trade.executed_at
         )
         
@@ -286,9 +287,11 @@ class PositionManager:
         if not include_closed:
             query = query.filter(Position.closed_at.is_(None))
         
-        positions = query.order_by(Position.opened_at.desc()).all()
+        rows = query.with_entities(*PositionData.columns()).order_by(
+            Position.opened_at.desc()
+        ).all()
         
-        return [PositionData.from_orm(p) for p in positions]
+        return [PositionData.from_mapping(row._mapping) for row in rows]
     
     def get_position(self, position_id: str) -> Optional[PositionData]:
         """
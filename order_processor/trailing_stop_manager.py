@@ -62,15 +62,13 @@ class TrailingStopManager:
             lowest_price = min(current_price, float(position.entry_price))
         
         # Create trailing stop config
-        trailing_config = {
-            'enabled': True,
-            'percentage': percentage,
-            'current_stop_price': round(stop_price, 2),
-            'highest_price': round(highest_price, 2),
-            'lowest_price': round(lowest_price, 2)
-        }
-        
-        position.trailing_stop_config = trailing_config
+        position.trailing_stop = TrailingStopConfig(
+            enabled=True,
+            percentage=percentage,
+            current_stop_price=round(stop_price, 2),
+            highest_price=round(highest_price, 2),
+            lowest_price=round(lowest_price, 2)
+        )
         self.db.commit()
         self.db.refresh(position)
         
@@ -100,67 +98,67 @@ class TrailingStopManager:
         if not position:
             raise ValueError(f"Position {position_id} not found")
         
-        if not position.trailing_stop_config or not position.trailing_stop_config.get('enabled'):
+        config = position.trailing_stop
+        if not config or not config.enabled:
             return PositionData.from_orm(position), False
         
         if position.closed_at:
             return PositionData.from_orm(position), False
         
-        config = position.trailing_stop_config
-        percentage = config['percentage']
-        current_stop = config['current_stop_price']
+        percentage = config.percentage
+        current_stop = config.current_stop_price
         
         stop_triggered = False
         
         if position.side == PositionSide.LONG:
             # Update highest price
-            highest_price = max(current_price, config['highest_price'])
-            config['highest_price'] = round(highest_price, 2)
+            highest_price = max(current_price, config.highest_price)
+            config.highest_price = round(highest_price, 2)
             
             # Calculate new stop price
             new_stop = highest_price * (1 - percentage)
             
             # Only update if new stop is higher (trailing up)
             if new_stop > current_stop:
-                config['current_stop_price'] = round(new_stop, 2)
+                config.current_stop_price = round(new_stop, 2)
                 logger.debug(
                     f"Updated trailing stop for LONG position {position_id}: "
                     f"{current_stop:.2f} -> {new_stop:.2f}"
                 )
             
             # Check if stop is triggered
-            if current_price <= config['current_stop_price']:
+            if current_price <= config.current_stop_price:
                 stop_triggered = True
                 logger.info(
                     f"Trailing stop triggered for LONG position {position_id}: "
-                    f"price {current_price:.2f} <= stop {config['current_stop_price']:.2f}"
+                    f"price {current_price:.2f} <= stop {config.current_stop_price:.2f}"
                 )
         
         else:  # SHORT
             # Update lowest price
-            lowest_price = min(current_price, config['lowest_price'])
-            config['lowest_price'] = round(lowest_price, 2)
+            lowest_price = min(current_price, config.lowest_price)
+            config.lowest_price = round(lowest_price, 2)
             
             # Calculate new stop price
             new_stop = lowest_price * (1 + percentage)
             
             # Only update if new stop is lower (trailing down)
             if new_stop < current_stop:
-                config['current_stop_price'] = round(new_stop, 2)
+                config.current_stop_price = round(new_stop, 2)
                 logger.debug(
                     f"Updated trailing stop for SHORT position {position_id}: "
                     f"{current_stop:.2f} -> {new_stop:.2f}"
                 )
             
             # Check if stop is triggered
-            if current_price >= config['current_stop_price']:
+            if current_price >= config.current_stop_price:
                 stop_triggered = True
                 logger.info(
                     f"Trailing stop triggered for SHORT position {position_id}: "
-                    f"price {current_price:.2f} >= stop {config['current_stop_price']:.2f}"
+                    f"price {current_price:.2f} >= stop {config.current_stop_price:.2f}"
                 )
         
-        position.trailing_stop_config = config
+        position.trailing_stop = config
         self.db.commit()
         self.db.refresh(position)
         
@@ -186,8 +184,8 @@ class TrailingStopManager:
         if not position:
             raise ValueError(f"Position {position_id} not found")
         
-        if position.trailing_stop_config:
-            position.trailing_stop_config['enabled'] = False
+        if position.trailing_stop:
+            position.trailing_enabled = False
             self.db.commit()
             self.db.refresh(position)
             
@@ -216,20 +214,19 @@ class TrailingStopManager:
             Position.symbol == symbol,
             Position.trading_mode == trading_mode,
             Position.closed_at.is_(None),
-            Position.trailing_stop_config.isnot(None)
+            Position.trailing_enabled == True
         ).all()
         
         results = []
         for position in positions:
-            if position.trailing_stop_config and position.trailing_stop_config.get('enabled'):
-                try:
-                    position_data, triggered = self.update_trailing_stop(
-                        str(position.id),
-                        current_price
-                    )
-                    results.append((position_data, triggered))
-                except Exception as e:
-                    logger.error(f"Error updating trailing stop for position {position.id}: {e}")
+            try:
+                position_data, triggered = self.update_trailing_stop(
+                    str(position.id),
+                    current_price
+                )
+                results.append((position_data, triggered))
+            except Exception as e:
+                logger.error(f"Error updating trailing stop for position {position.id}: {e}")
         
         return results
     
@@ -244,17 +241,10 @@ class TrailingStopManager:
             TrailingStopConfig or None if not configured
         """
         position = self.db.query(Position).filter(Position.id == uuid.UUID(position_id)).first()
-        if not position or not position.trailing_stop_config:
+        if not position:
             return None
         
-        config = position.trailing_stop_config
-        return TrailingStopConfig(
-            enabled=config.get('enabled', False),
-            percentage=config.get('percentage', 0),
-            current_stop_price=config.get('current_stop_price', 0),
-            highest_price=config.get('highest_price', 0),
-            lowest_price=config.get('lowest_price', 0)
-        )
+        return position.trailing_stop
     
     def register_stop_triggered_callback(self, callback: Callable[[PositionData], None]) -> None:
         """
@@ -289,16 +279,11 @@ class TrailingStopManager:
         Returns:
             List of position data with trailing stops
         """
-        positions = self.db.query(Position).filter(
+        rows = self.db.query(*PositionData.columns()).filter(
             Position.account_id == uuid.UUID(account_id),
             Position.trading_mode == trading_mode,
             Position.closed_at.is_(None),
-            Position.trailing_stop_config.isnot(None)
+            Position.trailing_enabled == True
         ).all()
         
-        result = []
-        for position in positions:
-            if position.trailing_stop_config and position.trailing_stop_config.get('enabled'):
-                result.append(PositionData.from_orm(position))
-        
-        return result
+        return [PositionData.from_mapping(row._mapping) for row in rows]
@@ -7,13 +7,15 @@ Provides configuration profiles for different operating modes:
 - replay: Historical data replay for testing
 - simulated: Synthetic data generation for development
 """
-from enum import Enum
+from enum import StrEnum
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 import os
 
 
-class OperatingMode(Enum):
+class OperatingMode(StrEnum):
     """System operating modes"""
     LIVE = "live"
     PAPER = "paper"
@@ -21,7 +23,7 @@ class OperatingMode(Enum):
     SIMULATED = "simulated"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModeConfig:
     """Configuration for a specific operating mode"""
     mode: OperatingMode
@@ -33,8 +35,8 @@ class ModeConfig:
     description: str
 
 
-# Mode configurations
-MODE_CONFIGS = {
+# Mode configurations (read-only)
+MODE_CONFIGS = MappingProxyType({
     OperatingMode.LIVE: ModeConfig(
         mode=OperatingMode.LIVE,
         use_real_broker=True,
@@ -71,23 +73,34 @@ MODE_CONFIGS = {
         log_level="DEBUG",
         description="Synthetic data generation for development"
     )
-}
+})
+
+
+@lru_cache(maxsize=1)
+def _parse_operating_mode() -> OperatingMode:
+    """Load operating mode from environment variable (cached)"""
+    mode_str = os.getenv('OPERATING_MODE', 'paper').lower()
+    try:
+        return OperatingMode(mode_str)
+    except ValueError:
+        print(f"Invalid OPERATING_MODE: {mode_str}, defaulting to PAPER")
+        return OperatingMode.PAPER
 
 
 class ModeManager:
     """Manages operating mode configuration"""
     
     def __init__(self):
-        self._current_mode = self._load_mode_from_env()
+        self._set_mode_internal(_parse_operating_mode())
     
-    def _load_mode_from_env(self) -> OperatingMode:
-        """Load operating mode from environment variable"""
-        mode_str = os.getenv('OPERATING_MODE', 'paper').lower()
-        try:
-            return OperatingMode(mode_str)
-        except ValueError:
-            print(f"Invalid OPERATING_MODE: {mode_str}, defaulting to PAPER")
-            return OperatingMode.PAPER
+    def _set_mode_internal(self, mode: OperatingMode) -> None:
+        """Store mode and precompute the values derived from it"""
+        self._current_mode = mode
+        self._config = MODE_CONFIGS[mode]
+        self._is_live = mode is OperatingMode.LIVE
+        self._is_paper = mode is OperatingMode.PAPER
+        self._is_replay = mode is OperatingMode.REPLAY
+        self._is_simulated = mode is OperatingMode.SIMULATED
     
     @property
     def current_mode(self) -> OperatingMode:
@@ -97,44 +110,45 @@ class ModeManager:
     @property
     def config(self) -> ModeConfig:
         """Get configuration for current mode"""
-        return MODE_CONFIGS[self._current_mode]
+        return self._config
     
     def set_mode(self, mode: OperatingMode) -> None:
         """Set operating mode"""
-        self._current_mode = mode
+        self._set_mode_internal(mode)
         os.environ['OPERATING_MODE'] = mode.value
+        _parse_operating_mode.cache_clear()
     
     def is_live(self) -> bool:
         """Check if in live trading mode"""
-        return self._current_mode == OperatingMode.LIVE
+        return self._is_live
     
     def is_paper(self) -> bool:
         """Check if in paper trading mode"""
-        return self._current_mode == OperatingMode.PAPER
+        return self._is_paper
     
     def is_replay(self) -> bool:
         """Check if in replay mode"""
-        return self._current_mode == OperatingMode.REPLAY
+        return self._is_replay
     
     def is_simulated(self) -> bool:
         """Check if in simulated mode"""
-        return self._current_mode == OperatingMode.SIMULATED
+        return self._is_simulated
     
     def should_use_real_broker(self) -> bool:
         """Check if should use real broker connections"""
-        return self.config.use_real_broker
+        return self._config.use_real_broker
     
     def should_use_real_market_data(self) -> bool:
         """Check if should use real market data"""
-        return self.config.use_real_market_data
+        return self._config.use_real_market_data
     
     def can_execute_orders(self) -> bool:
         """Check if order execution is enabled"""
-        return self.config.enable_order_execution
+        return self._config.enable_order_execution
     
     def should_send_notifications(self) -> bool:
         """Check if notifications are enabled"""
-        return self.config.enable_notifications
+        return self._config.enable_notifications
 
 
 # Global mode manager instance
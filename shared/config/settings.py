@@ -2,90 +2,140 @@
 Configuration management for the trading platform.
 Handles environment variables and secrets.
 """
-from functools import lru_cache
-from typing import Optional
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Mapping, Optional
 
 
-class Settings(BaseSettings):
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value."""
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+# Coercion applied to raw environment strings, keyed by field type
+_COERCERS = {
+    int: int,
+    bool: _parse_bool,
+}
+
+
+@dataclass(frozen=True)
+class Settings:
     """Application settings loaded from environment variables."""
-    
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore"
-    )
-    
+
     # Application
-    app_name: str = Field(default="Trading Platform", alias="APP_NAME")
-    environment: str = Field(default="development", alias="ENVIRONMENT")
-    debug: bool = Field(default=False, alias="DEBUG")
-    
+    app_name: str = "Trading Platform"
+    environment: str = "development"
+    debug: bool = False
+
     # Database Configuration
-    db_host: str = Field(default="localhost", alias="DB_HOST")
-    db_port: int = Field(default=5432, alias="DB_PORT")
-    db_name: str = Field(default="trading_platform", alias="DB_NAME")
-    db_user: str = Field(default="postgres", alias="DB_USER")
-    db_password: str = Field(default="postgres", alias="DB_PASSWORD")
-    db_pool_size: int = Field(default=20, alias="DB_POOL_SIZE")
-    db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
-    db_pool_timeout: int = Field(default=30, alias="DB_POOL_TIMEOUT")
-    db_pool_recycle: int = Field(default=3600, alias="DB_POOL_RECYCLE")
-    
+    db_host: str = "localhost"
+    db_port: int = 5432
+    db_name: str = "trading_platform"
+    db_user: str = "postgres"
+    db_password: str = "postgres"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_jit: bool = False
+
     # PgBouncer Configuration
-    use_pgbouncer: bool = Field(default=False, alias="USE_PGBOUNCER")
-    pgbouncer_host: Optional[str] = Field(default=None, alias="PGBOUNCER_HOST")
-    pgbouncer_port: int = Field(default=6432, alias="PGBOUNCER_PORT")
-    
+    use_pgbouncer: bool = False
+    pgbouncer_host: Optional[str] = None
+    pgbouncer_port: int = 6432
+
     # Redis Configuration
-    redis_host: str = Field(default="localhost", alias="REDIS_HOST")
-    redis_port: int = Field(default=6379, alias="REDIS_PORT")
-    redis_password: Optional[str] = Field(default=None, alias="REDIS_PASSWORD")
-    redis_db: int = Field(default=0, alias="REDIS_DB")
-    redis_cluster_mode: bool = Field(default=False, alias="REDIS_CLUSTER_MODE")
-    redis_cluster_nodes: Optional[str] = Field(default=None, alias="REDIS_CLUSTER_NODES")
-    redis_max_connections: int = Field(default=50, alias="REDIS_MAX_CONNECTIONS")
-    redis_socket_timeout: int = Field(default=5, alias="REDIS_SOCKET_TIMEOUT")
-    redis_socket_connect_timeout: int = Field(default=5, alias="REDIS_SOCKET_CONNECT_TIMEOUT")
-    
+    redis_host: str = "localhost"
+    redis_port: int = 6379
+    redis_password: Optional[str] = None
+    redis_db: int = 0
+    redis_cluster_mode: bool = False
+    redis_cluster_nodes: Optional[str] = None
+    redis_max_connections: int = 50
+    redis_socket_timeout: int = 5
+    redis_socket_connect_timeout: int = 5
+
     # JWT Configuration
-    jwt_secret_key: str = Field(default="change-me-in-production", alias="JWT_SECRET_KEY")
-    jwt_algorithm: str = Field(default="HS256", alias="JWT_ALGORITHM")
-    jwt_expiration_hours: int = Field(default=24, alias="JWT_EXPIRATION_HOURS")
-    
+    jwt_secret_key: str = "change-me-in-production"
+    jwt_algorithm: str = "HS256"
+    jwt_expiration_hours: int = 24
+
     # Session Configuration
-    session_timeout_minutes: int = Field(default=30, alias="SESSION_TIMEOUT_MINUTES")
-    session_cleanup_interval_minutes: int = Field(default=5, alias="SESSION_CLEANUP_INTERVAL_MINUTES")
-    
+    session_timeout_minutes: int = 30
+    session_cleanup_interval_minutes: int = 5
+
     # Security
-    password_min_length: int = Field(default=8, alias="PASSWORD_MIN_LENGTH")
-    max_login_attempts: int = Field(default=3, alias="MAX_LOGIN_ATTEMPTS")
-    account_lock_duration_minutes: int = Field(default=15, alias="ACCOUNT_LOCK_DURATION_MINUTES")
-    
+    password_min_length: int = 8
+    max_login_attempts: int = 3
+    account_lock_duration_minutes: int = 15
+
     # Celery Configuration
-    celery_broker_url: str = Field(default="redis://localhost:6379/1", alias="CELERY_BROKER_URL")
-    celery_result_backend: str = Field(default="redis://localhost:6379/2", alias="CELERY_RESULT_BACKEND")
-    
+    # Unset means database 1 on the Redis server above (see celery_broker)
+    celery_broker_url: Optional[str] = None
+    celery_result_backend: str = "redis://localhost:6379/2"
+
     # InfluxDB Configuration
-    influxdb_url: str = Field(default="http://localhost:8086", alias="INFLUXDB_URL")
-    influxdb_token: Optional[str] = Field(default=None, alias="INFLUXDB_TOKEN")
-    influxdb_org: str = Field(default="trading-platform", alias="INFLUXDB_ORG")
-    influxdb_bucket: str = Field(default="market-data", alias="INFLUXDB_BUCKET")
-    
+    influxdb_url: str = "http://localhost:8086"
+    influxdb_token: Optional[str] = None
+    influxdb_org: str = "trading-platform"
+    influxdb_bucket: str = "market-data"
+
     # Google Cloud Configuration
-    gcp_project_id: Optional[str] = Field(default=None, alias="GCP_PROJECT_ID")
-    gcp_secret_manager_enabled: bool = Field(default=False, alias="GCP_SECRET_MANAGER_ENABLED")
-    
+    gcp_project_id: Optional[str] = None
+    gcp_secret_manager_enabled: bool = False
+
     # Service Ports
-    api_gateway_port: int = Field(default=8000, alias="API_GATEWAY_PORT")
-    websocket_service_port: int = Field(default=8001, alias="WEBSOCKET_SERVICE_PORT")
-    market_data_engine_port: int = Field(default=8002, alias="MARKET_DATA_ENGINE_PORT")
-    order_processor_port: int = Field(default=8003, alias="ORDER_PROCESSOR_PORT")
-    analytics_service_port: int = Field(default=8004, alias="ANALYTICS_SERVICE_PORT")
-    
-    @property
+    api_gateway_port: int = 8000
+    websocket_service_port: int = 8001
+    market_data_engine_port: int = 8002
+    order_processor_port: int = 8003
+    analytics_service_port: int = 8004
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        """
+        Build settings from environment variables.
+
+        Each field is read from the upper-cased variable of the same name
+        (e.g. ``db_port`` from ``DB_PORT``); names are matched
+        case-insensitively and unset variables keep the field default.
+
+        Args:
+            environ: Variables to read from (defaults to ``.env`` overlaid
+                with ``os.environ``)
+
+        Returns:
+            Settings instance
+
+        Raises:
+            ValueError: If a variable cannot be coerced to the field type
+        """
+        if environ is None:
+            environ = _load_environ()
+        env = {key.upper(): value for key, value in environ.items()}
+
+        values: Dict[str, Any] = {}
+        for f in fields(cls):
+            raw = env.get(f.name.upper())
+            if raw is None:
+                continue
+            coerce = _COERCERS.get(f.type)
+            values[f.name] = coerce(raw) if coerce else raw
+
+        return cls(**values)
+
+    @cached_property
     def database_url(self) -> str:
         """Construct database URL."""
         if self.use_pgbouncer and self.pgbouncer_host:
@@ -94,17 +144,39 @@ class Settings(BaseSettings):
         else:
             host = self.db_host
             port = self.db_port
-        
+
         return f"postgresql://{self.db_user}:{self.db_password}@{host}:{port}/{self.db_name}"
-    
-    @property
+
+    @cached_property
     def redis_url(self) -> str:
         """Construct Redis URL."""
         auth = f":{self.redis_password}@" if self.redis_password else ""
         return f"redis://{auth}{self.redis_host}:{self.redis_port}/{self.redis_db}"
 
+    @cached_property
+    def celery_broker(self) -> str:
+        """Celery broker URL, defaulting to database 1 on the configured Redis."""
+        if self.celery_broker_url:
+            return self.celery_broker_url
+        auth = f":{self.redis_password}@" if self.redis_password else ""
+        return f"redis://{auth}{self.redis_host}:{self.redis_port}/1"
+
+
+def _load_environ() -> Dict[str, str]:
+    """Read ``.env`` (if present) with process environment taking precedence."""
+    # Imported here so importing this module stays free of third-party deps
+    from dotenv import dotenv_values
+
+    environ = {
+        key: value
+        for key, value in dotenv_values(".env", encoding="utf-8").items()
+        if value is not None
+    }
+    environ.update(os.environ)
+    return environ
+
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    return Settings.from_env()
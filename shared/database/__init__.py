@@ -1,3 +1,4 @@
+from .base import Base
 from .connection import DatabaseManager, get_db_session, init_database
 
-__all__ = ['DatabaseManager', 'get_db_session', 'init_database']
+__all__ = ['Base', 'DatabaseManager', 'get_db_session', 'init_database']
@@ -0,0 +1,30 @@
+"""
+Declarative base for all ORM models.
+
+Kept separate from the connection module so that defining models does not
+require the engine, pool and session machinery.
+"""
+from typing import List
+
+from sqlalchemy import Table
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql.elements import ColumnElement
+
+# Base class for all models
+Base = declarative_base()
+
+
+def data_columns(table: Table) -> List[ColumnElement]:
+    """
+    Get the columns of a table for Core reads into data classes.
+    
+    Rows keep the column names as keys. Money columns are ``Paise``, which
+    already returns floats, so no column needs a cast.
+    
+    Args:
+        table: Table to read
+        
+    Returns:
+        Columns, in table order
+    """
+    return list(table.columns)
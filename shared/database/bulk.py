@@ -0,0 +1,134 @@
+"""
+Bulk write helpers for ORM tables.
+
+Each helper writes many rows per statement (or in a single COPY) on the
+caller's session and leaves committing to the caller.
+"""
+import io
+import uuid
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+from shared.utils.ids import uuid7
+
+# Characters that must be backslash-escaped in COPY's text format
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def bulk_insert(session: Session, table: Table, rows: Sequence[Dict[str, Any]]) -> List[uuid.UUID]:
+    """
+    Insert many rows into a table in a single executemany.
+    
+    Rows without an ``id`` get a UUIDv7 assigned client-side, so the new
+    IDs are known without a RETURNING round trip. Other Python-side column
+    defaults are applied as usual. All rows must set the same keys.
+    The session is not committed.
+    
+    Args:
+        session: Database session
+        table: Table to insert into (must have an ``id`` primary key)
+        rows: Column values per row
+        
+    Returns:
+        IDs of the inserted rows, in row order
+    """
+    if not rows:
+        return []
+    
+    rows = [row if 'id' in row else {**row, 'id': uuid7()} for row in rows]
+    session.execute(insert(table), rows)
+    return [row['id'] for row in rows]
+
+
+def bulk_copy(session: Session, table: Table, rows: Sequence[Dict[str, Any]]) -> List[uuid.UUID]:
+    """
+    Insert many rows into a table with PostgreSQL ``COPY ... FROM STDIN``.
+    
+    Much cheaper than an executemany for large batches. Values go through
+    each column's bind processing (enum codes, UUIDs) and are streamed as
+    tab-separated text on the session's own connection, so the copy is
+    part of the session's transaction. Rows without an ``id`` get a UUIDv7
+    assigned client-side. Python-side column defaults are NOT applied, so
+    rows must set every column that relies on one, and all rows must set
+    the same keys. The session is not committed.
+    
+    Args:
+        session: Database session on a psycopg2 connection
+        table: Table to insert into (must have an ``id`` primary key)
+        rows: Column values per row
+        
+    Returns:
+        IDs of the inserted rows, in row order
+    """
+    if not rows:
+        return []
+    
+    rows = [row if 'id' in row else {**row, 'id': uuid7()} for row in rows]
+    connection = session.connection()
+    dialect = connection.dialect
+    keys = list(rows[0])
+    processors = [table.c[key].type.bind_processor(dialect) for key in keys]
+    
+    buf = io.StringIO()
+    for row in rows:
+        fields = []
+        for key, processor in zip(keys, processors):
+            value = row[key]
+            if processor is not None:
+                value = processor(value)
+            fields.append('\\N' if value is None else str(value).translate(_COPY_ESCAPES))
+        buf.write('\t'.join(fields))
+        buf.write('\n')
+    buf.seek(0)
+    
+    preparer = dialect.identifier_preparer
+    columns = ', '.join(preparer.quote(key) for key in keys)
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {preparer.format_table(table)} ({columns}) FROM STDIN", buf)
+    return [row['id'] for row in rows]
+
+
+def bulk_upsert(
+    session: Session,
+    table: Table,
+    rows: Sequence[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str],
+    batch_size: int = 1000
+) -> None:
+    """
+    Insert rows, updating the existing row where a unique key already exists.
+    
+    Rows are sent as multi-row ``INSERT ... ON CONFLICT DO UPDATE``
+    statements of up to ``batch_size`` rows, so a large load costs one
+    statement per batch instead of a SELECT and a write per row. Rows
+    without an ``id`` get a UUIDv7 assigned client-side. Keys must be
+    unique within ``rows``, and all rows must set the same keys. The
+    session is not committed.
+    
+    Args:
+        session: Database session (PostgreSQL, or SQLite in tests)
+        table: Table to upsert into (must have an ``id`` primary key)
+        rows: Column values per row
+        conflict_columns: Columns of the unique index to match on
+        update_columns: Columns overwritten on existing rows
+        batch_size: Rows per statement
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"bulk_upsert does not support {dialect}")
+    
+    rows = [row if 'id' in row else {**row, 'id': uuid7()} for row in rows]
+    for start in range(0, len(rows), batch_size):
+        stmt = dialect_insert(table).values(rows[start:start + batch_size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_={column: stmt.excluded[column] for column in update_columns}
+        )
+        session.execute(stmt)
@@ -6,18 +6,17 @@ import logging
 from contextlib import contextmanager
 from typing import Generator, Optional
 
-from sqlalchemy import create_engine, event, pool
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, sessionmaker, declarative_base
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool
 
 from shared.config import get_settings
+# Re-exported for callers that still import Base from here
+from shared.database.base import Base  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
-# Base class for all models
-Base = declarative_base()
-
 
 class DatabaseManager:
     """Manages database connections with connection pooling."""
@@ -33,20 +32,31 @@ class DatabaseManager:
             logger.warning("Database already initialized")
             return
         
+        if self._behind_pgbouncer:
+            # PgBouncer already pools server connections; a second in-process
+            # pool and a pre-ping per checkout only add round trips
+            pool_options = {"poolclass": NullPool}
+        else:
+            pool_options = {
+                "poolclass": QueuePool,
+                "pool_size": self.settings.db_pool_size,
+                "max_overflow": self.settings.db_max_overflow,
+                "pool_timeout": self.settings.db_pool_timeout,
+                "pool_recycle": self.settings.db_pool_recycle,
+                "pool_pre_ping": True,  # Verify connections before using
+            }
+        
         # Create engine with connection pooling
         self._engine = create_engine(
             self.settings.database_url,
-            poolclass=QueuePool,
-            pool_size=self.settings.db_pool_size,
-            max_overflow=self.settings.db_max_overflow,
-            pool_timeout=self.settings.db_pool_timeout,
-            pool_recycle=self.settings.db_pool_recycle,
-            pool_pre_ping=True,  # Verify connections before using
             echo=self.settings.debug,
+            **pool_options,
         )
         
         # Configure connection pool events
         self._setup_pool_events()
+        if not self.settings.db_jit and not self._behind_pgbouncer:
+            self._disable_jit()
         
         # Create session factory
         self._session_factory = sessionmaker(
@@ -55,31 +65,69 @@ class DatabaseManager:
             autoflush=False,
             expire_on_commit=False
         )
+        # Shadow create_session with the factory itself so session creation
+        # skips the initialization check once the engine is ready
+        self.create_session = self._session_factory
         
         logger.info(
             f"Database initialized: {self.settings.db_host}:{self.settings.db_port}/{self.settings.db_name}"
         )
         
-        if self.settings.use_pgbouncer:
+        if self._behind_pgbouncer:
             logger.info(f"Using PgBouncer: {self.settings.pgbouncer_host}:{self.settings.pgbouncer_port}")
     
+    @property
+    def _behind_pgbouncer(self) -> bool:
+        """Whether connections go through PgBouncer (see Settings.database_url)."""
+        return bool(self.settings.use_pgbouncer and self.settings.pgbouncer_host)
+    
+    def _disable_jit(self) -> None:
+        """
+        Turn off Postgres JIT on every new pooled connection.
+        
+        OLTP queries here are short, so JIT compilation only adds latency.
+        The setting is per session, so it is applied once per physical
+        connection rather than on each checkout. Behind PgBouncer server
+        connections are shared, so JIT should be disabled on the database
+        instead (``ALTER DATABASE ... SET jit = off``).
+        """
+        @event.listens_for(self._engine, "connect")
+        def disable_jit(dbapi_conn, connection_record):
+            cursor = dbapi_conn.cursor()
+            try:
+                cursor.execute("SET jit = off")
+            finally:
+                cursor.close()
+            # Keep the SET out of the first transaction's rollback scope
+            dbapi_conn.commit()
+    
     def _setup_pool_events(self) -> None:
-        """Set up connection pool event listeners."""
+        """
+        Set up connection pool event listeners.
+        
+        Listeners only log, and they run on every checkout/checkin, so they
+        are registered in debug mode only.
+        """
+        if not self.settings.debug:
+            return
         
         @event.listens_for(self._engine, "connect")
         def receive_connect(dbapi_conn, connection_record):
             """Handle new connection creation."""
-            logger.debug("New database connection established")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("New database connection established")
         
         @event.listens_for(self._engine, "checkout")
         def receive_checkout(dbapi_conn, connection_record, connection_proxy):
             """Handle connection checkout from pool."""
-            logger.debug("Connection checked out from pool")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Connection checked out from pool")
         
         @event.listens_for(self._engine, "checkin")
         def receive_checkin(dbapi_conn, connection_record):
             """Handle connection return to pool."""
-            logger.debug("Connection returned to pool")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Connection returned to pool")
     
     @property
     def engine(self) -> Engine:
@@ -96,7 +144,12 @@ class DatabaseManager:
         return self._session_factory
     
     def create_session(self) -> Session:
-        """Create a new database session."""
+        """
+        Create a new database session.
+        
+        Replaced by the session factory on initialize(); this method only
+        runs while the database is not initialized.
+        """
         return self.session_factory()
     
     @contextmanager
@@ -126,12 +179,16 @@ class DatabaseManager:
             logger.info("Database connections disposed")
             self._engine = None
             self._session_factory = None
+            self.__dict__.pop('create_session', None)
     
     def get_pool_status(self) -> dict:
         """Get current connection pool status."""
         if self._engine is None:
             return {"status": "not_initialized"}
         
+        if self._behind_pgbouncer:
+            return {"status": "pooled_by_pgbouncer"}
+        
         pool = self._engine.pool
         return {
             "size": pool.size(),
@@ -0,0 +1,126 @@
+"""
+Custom column types shared by the ORM models.
+"""
+import hashlib
+from decimal import ROUND_HALF_EVEN, Decimal
+from enum import Enum
+from typing import Any, Optional, Type, Union
+
+from sqlalchemy import BigInteger, LargeBinary, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a Python enum as a SMALLINT code.
+
+    A member's code is its position in declaration order, so members must
+    only ever be appended to the enum, never inserted or reordered. Bound
+    values may be members or their raw values (e.g. ``"pending"``).
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def code(self, value: Any) -> int:
+        """
+        Get the stored code for an enum member or raw value.
+
+        Args:
+            value: Enum member or member value
+
+        Returns:
+            SMALLINT code
+        """
+        return self._codes[self.enum_class(value)]
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self.code(value)
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self._members[value]
+
+    @property
+    def python_type(self) -> Type[Enum]:
+        return self.enum_class
+
+
+class Paise(TypeDecorator):
+    """
+    Store a rupee amount as a BIGINT number of paise.
+
+    Callers keep working in rupees: bound values (float, int or Decimal)
+    are scaled by 100 and rounded half-even, and results are scaled back
+    to ``float``, or to ``Decimal`` when ``asdecimal`` is set. Sums and
+    comparisons in SQL stay exact integer arithmetic.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def __init__(self, asdecimal: bool = False):
+        super().__init__()
+        self.asdecimal = asdecimal
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if isinstance(value, Decimal):
+            return int(value.scaleb(2).to_integral_value(ROUND_HALF_EVEN))
+        return int(round(value * 100))
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[Union[float, Decimal]]:
+        if value is None:
+            return None
+        if self.asdecimal:
+            return Decimal(value).scaleb(-2)
+        return value / 100
+
+    @property
+    def python_type(self) -> type:
+        return Decimal if self.asdecimal else float
+
+
+def token_digest(token: str) -> bytes:
+    """
+    Get the SHA-256 digest stored in place of a session token.
+
+    Args:
+        token: Raw token string
+
+    Returns:
+        32-byte digest
+    """
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class TokenDigest(TypeDecorator):
+    """
+    Store a secret token as its 32-byte SHA-256 digest.
+
+    String values are hashed on bind, so ``Model.token == raw_token`` finds
+    the row without callers hashing first; bytes are taken to be a digest
+    already and pass through. Results are the digest, never the token.
+    """
+
+    impl = LargeBinary(32)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[bytes]:
+        if value is None or isinstance(value, bytes):
+            return value
+        return token_digest(value)
+
+    @property
+    def python_type(self) -> type:
+        return bytes
@@ -1,16 +1,37 @@
 """Backtest data models for backtesting engine."""
 
+import sys
+import zlib
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from typing import Optional, List, Dict, Any
-from sqlalchemy import Column, String, DateTime, JSON, Enum as SQLEnum, Index
-from sqlalchemy.dialects.postgresql import UUID
-import uuid
-from shared.database.connection import Base
+import orjson
+from sqlalchemy import Column, String, DateTime, JSON, LargeBinary, Enum as SQLEnum, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import deferred
+from shared.database.base import Base
+from shared.utils.ids import uuid7
 
 
-class BacktestStatus(str, Enum):
+# Stored as JSONB on PostgreSQL; plain JSON elsewhere (e.g. SQLite in tests)
+JSONType = JSON().with_variant(JSONB(), 'postgresql')
+
+# zlib level for the compressed results blob (favours speed over ratio)
+_RESULTS_COMPRESSION_LEVEL = 3
+
+
+def _parse_iso_datetimes(values: List[str]) -> List[datetime]:
+    """Parse a column of ISO 8601 strings in one vectorized pass."""
+    if not values:
+        return []
+
+    import pandas as pd
+
+    return pd.to_datetime(values, format='ISO8601', cache=True).to_pydatetime().tolist()
+
+
+class BacktestStatus(StrEnum):
     """Backtest status enumeration."""
     RUNNING = "running"
     COMPLETED = "completed"
@@ -21,11 +42,12 @@ class Backtest(Base):
     """SQLAlchemy model for backtests table."""
     __tablename__ = "backtests"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     strategy_id = Column(UUID(as_uuid=True), nullable=False)
     account_id = Column(UUID(as_uuid=True), nullable=False)
-    config = Column(JSON, nullable=False)
-    metrics = Column(JSON, nullable=True)
+    config = Column(JSONType, nullable=False)
+    metrics = Column(JSONType, nullable=True)
+    results_blob = deferred(Column(LargeBinary, nullable=True))
     status = Column(SQLEnum(BacktestStatus), nullable=False, default=BacktestStatus.RUNNING)
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
@@ -34,10 +56,57 @@ class Backtest(Base):
         Index('idx_backtests_strategy', 'strategy_id', 'created_at'),
         Index('idx_backtests_account', 'account_id', 'created_at'),
         Index('idx_backtests_status', 'status'),
+        Index('idx_backtests_account_status_created', 'account_id', 'status', 'created_at'),
     )
 
+    def store_results(
+        self,
+        metrics: 'PerformanceMetrics',
+        trades: List['BacktestTrade'],
+        equity_curve: List['EquityPoint']
+    ) -> None:
+        """
+        Store backtest results.
+
+        Summary metrics stay queryable in the ``metrics`` column; trades and
+        the equity curve, which can run to megabytes, are serialized with
+        orjson and zlib-compressed into ``results_blob``.
+        """
+        self.metrics = {'metrics': metrics.to_dict()}
+        self.results_blob = zlib.compress(
+            orjson.dumps({'trades': trades, 'equity_curve': equity_curve}),
+            _RESULTS_COMPRESSION_LEVEL
+        )
+
+    def load_results(self) -> Dict[str, Any]:
+        """
+        Load the full results payload.
+
+        Returns:
+            Dict with 'metrics', 'trades' and 'equity_curve'; rows written
+            before results_blob existed carry everything in ``metrics``
+        """
+        data = dict(self.metrics or {})
+        if self.results_blob is not None:
+            data.update(orjson.loads(zlib.decompress(self.results_blob)))
+        return data
+
+
+# Upper bound for slippage and commission rates (10%)
+_MAX_COST_RATE = 0.1
 
-@dataclass
+# Validation errors, indexed by the bit BacktestConfig.validate sets
+_CONFIG_ERRORS = (
+    "At least one symbol is required",
+    "At least one timeframe is required",
+    "Start date must be before end date",
+    "Initial capital must be positive",
+    "Slippage must be between 0 and 0.1 (10%)",
+    "Commission must be between 0 and 0.1 (10%)",
+)
+
+
+@dataclass(slots=True)
 class BacktestConfig:
     """Configuration for backtest execution."""
     strategy_id: str
@@ -52,22 +121,25 @@ class BacktestConfig:
     strategy_params: Dict[str, Any] = field(default_factory=dict)
 
     def validate(self) -> None:
-        """Validate backtest configuration."""
-        if not self.symbols:
-            raise ValueError("At least one symbol is required")
-        if not self.timeframes:
-            raise ValueError("At least one timeframe is required")
-        if self.start_date >= self.end_date:
-            raise ValueError("Start date must be before end date")
-        if self.initial_capital <= 0:
-            raise ValueError("Initial capital must be positive")
-        if self.slippage < 0 or self.slippage > 0.1:
-            raise ValueError("Slippage must be between 0 and 0.1 (10%)")
-        if self.commission < 0 or self.commission > 0.1:
-            raise ValueError("Commission must be between 0 and 0.1 (10%)")
-
-
-@dataclass
+        """
+        Validate backtest configuration.
+
+        All checks are evaluated into one bitmask; the lowest failing check
+        determines the error, matching the order of _CONFIG_ERRORS.
+        """
+        flags = (
+            (not self.symbols)
+            | (not self.timeframes) << 1
+            | (self.start_date >= self.end_date) << 2
+            | (self.initial_capital <= 0) << 3
+            | ((self.slippage < 0) | (self.slippage > _MAX_COST_RATE)) << 4
+            | ((self.commission < 0) | (self.commission > _MAX_COST_RATE)) << 5
+        )
+        if flags:
+            raise ValueError(_CONFIG_ERRORS[(flags & -flags).bit_length() - 1])
+
+
+@dataclass(slots=True)
 class BacktestTrade:
     """Trade executed during backtest."""
     entry_date: datetime
@@ -82,6 +154,11 @@ class BacktestTrade:
     commission: float
     holding_time_seconds: float
 
+    def __post_init__(self) -> None:
+        # Large results repeat a handful of symbols and two sides; share them
+        self.symbol = sys.intern(self.symbol)
+        self.side = sys.intern(self.side)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -115,8 +192,30 @@ class BacktestTrade:
             holding_time_seconds=data['holding_time_seconds']
         )
 
+    @classmethod
+    def from_dicts(cls, rows: List[Dict[str, Any]]) -> List['BacktestTrade']:
+        """Create many trades, parsing the date columns in bulk."""
+        entry_dates = _parse_iso_datetimes([row['entry_date'] for row in rows])
+        exit_dates = _parse_iso_datetimes([row['exit_date'] for row in rows])
+        return [
+            cls(
+                entry_date=entry_date,
+                exit_date=exit_date,
+                symbol=row['symbol'],
+                side=row['side'],
+                entry_price=row['entry_price'],
+                exit_price=row['exit_price'],
+                quantity=row['quantity'],
+                pnl=row['pnl'],
+                pnl_percent=row['pnl_percent'],
+                commission=row['commission'],
+                holding_time_seconds=row['holding_time_seconds']
+            )
+            for row, entry_date, exit_date in zip(rows, entry_dates, exit_dates)
+        ]
+
 
-@dataclass
+@dataclass(slots=True)
 class EquityPoint:
     """Point in equity curve."""
     timestamp: datetime
@@ -140,8 +239,17 @@ class EquityPoint:
             drawdown=data['drawdown']
         )
 
+    @classmethod
+    def from_dicts(cls, rows: List[Dict[str, Any]]) -> List['EquityPoint']:
+        """Create many equity points, parsing timestamps in bulk."""
+        timestamps = _parse_iso_datetimes([row['timestamp'] for row in rows])
+        return [
+            cls(timestamp=timestamp, equity=row['equity'], drawdown=row['drawdown'])
+            for row, timestamp in zip(rows, timestamps)
+        ]
+
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance metrics for backtest results."""
     total_return: float
@@ -202,7 +310,7 @@ class PerformanceMetrics:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     """Complete backtest results."""
     id: str
@@ -236,11 +344,21 @@ class BacktestResult:
             'status': self.status.value
         }
 
+    def to_json(self) -> bytes:
+        """
+        Serialize to JSON bytes.
+
+        Produces the same document as to_dict(), but orjson walks the
+        dataclasses natively instead of building an intermediate dict per
+        trade and equity point.
+        """
+        return orjson.dumps(self)
+
     @classmethod
     def from_orm(cls, backtest: Backtest) -> 'BacktestResult':
         """Create BacktestResult from SQLAlchemy Backtest model."""
         config_data = backtest.config
-        metrics_data = backtest.metrics or {}
+        metrics_data = backtest.load_results()
         
         config = BacktestConfig(
             strategy_id=config_data['strategy_id'],
@@ -256,8 +374,8 @@ class BacktestResult:
         )
         
         metrics = PerformanceMetrics.from_dict(metrics_data.get('metrics', {})) if metrics_data.get('metrics') else None
-        trades = [BacktestTrade.from_dict(t) for t in metrics_data.get('trades', [])]
-        equity_curve = [EquityPoint.from_dict(p) for p in metrics_data.get('equity_curve', [])]
+        trades = BacktestTrade.from_dicts(metrics_data.get('trades', []))
+        equity_curve = EquityPoint.from_dicts(metrics_data.get('equity_curve', []))
         
         return cls(
             id=str(backtest.id),
@@ -4,9 +4,9 @@ from sqlalchemy import Column, String, Boolean, DateTime, Text, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
-import uuid
 
-from shared.database.connection import Base
+from shared.database.base import Base
+from shared.utils.ids import uuid7
 
 
 class BrokerConnection(Base):
@@ -14,7 +14,7 @@ class BrokerConnection(Base):
     
     __tablename__ = 'broker_connections'
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     account_id = Column(UUID(as_uuid=True), ForeignKey('user_accounts.id'), nullable=False)
     broker_name = Column(String(50), nullable=False)
     credentials_encrypted = Column(Text, nullable=False)
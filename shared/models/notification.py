@@ -3,22 +3,25 @@ Notification data models for notification service.
 Implements Notification table and related data classes.
 """
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum as PyEnum
-from typing import Optional, List, Dict, Any
+from enum import StrEnum
+from typing import Optional, List, Dict, Any, Mapping, Sequence
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Enum, ForeignKey, 
-    String, Text, Index
+    Boolean, Column, DateTime, ForeignKey, 
+    String, Text, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, deferred, relationship
 
-from shared.database.connection import Base
+from shared.database.base import Base, data_columns
+from shared.database.bulk import bulk_copy, bulk_insert
+from shared.database.types import SmallIntEnum
+from shared.utils.ids import uuid7, uuid_str
 
 
-class NotificationType(PyEnum):
+class NotificationType(StrEnum):
     """Notification type enumeration."""
     ORDER_EXECUTED = "order_executed"
     STRATEGY_ERROR = "strategy_error"
@@ -34,7 +37,7 @@ class NotificationType(PyEnum):
     STRATEGY_PAUSED = "strategy_paused"
 
 
-class NotificationSeverity(PyEnum):
+class NotificationSeverity(StrEnum):
     """Notification severity enumeration."""
     INFO = "info"
     WARNING = "warning"
@@ -42,7 +45,7 @@ class NotificationSeverity(PyEnum):
     CRITICAL = "critical"
 
 
-class NotificationChannel(PyEnum):
+class NotificationChannel(StrEnum):
     """Notification delivery channel enumeration."""
     IN_APP = "in_app"
     EMAIL = "email"
@@ -54,16 +57,14 @@ class Notification(Base):
     
     __tablename__ = "notifications"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    type = Column(
-        Enum(NotificationType, name="notification_type", create_type=True),
-        nullable=False
-    )
+    type = Column(SmallIntEnum(NotificationType), nullable=False)
     title = Column(String(255), nullable=False)
-    message = Column(Text, nullable=False)
+    # Only loaded on access (or with undefer) so header-only reads stay narrow
+    message = deferred(Column(Text, nullable=False))
     severity = Column(
-        Enum(NotificationSeverity, name="notification_severity", create_type=True),
+        SmallIntEnum(NotificationSeverity),
         nullable=False,
         default=NotificationSeverity.INFO
     )
@@ -75,14 +76,41 @@ class Notification(Base):
     
     __table_args__ = (
         Index("idx_notifications_user", "user_id", "created_at"),
-        Index("idx_notifications_unread", "user_id", "read_at"),
+        Index(
+            "idx_notifications_unread", "user_id", "created_at",
+            postgresql_where=text("read_at IS NULL")
+        ),
     )
     
     def __repr__(self) -> str:
-        return f"<Notification(id={self.id}, user_id={self.user_id}, type={self.type.value}, severity={self.severity.value})>"
+        return f"<Notification(id={self.id}, user_id={self.user_id}, type={self.type}, severity={self.severity})>"
+
+
+# Batches larger than this are loaded with COPY on PostgreSQL
+COPY_THRESHOLD = 100
 
 
-@dataclass
+def bulk_insert_notifications(session: Session, rows: Sequence[Dict[str, Any]]) -> List[uuid.UUID]:
+    """
+    Insert a fan-out of notifications in one round trip.
+    
+    On PostgreSQL, batches over COPY_THRESHOLD rows are streamed with COPY;
+    smaller batches (and SQLite) use an executemany INSERT. Rows must set
+    every column with a Python-side default (severity, created_at).
+    
+    Args:
+        session: Database session (not committed)
+        rows: Notification column values per recipient
+        
+    Returns:
+        IDs of the inserted notifications, in row order
+    """
+    if len(rows) > COPY_THRESHOLD and session.get_bind().dialect.name == 'postgresql':
+        return bulk_copy(session, Notification.__table__, rows)
+    return bulk_insert(session, Notification.__table__, rows)
+
+
+@dataclass(slots=True)
 class NotificationData:
     """Data class for notification information."""
     id: str
@@ -99,7 +127,7 @@ class NotificationData:
         """Create NotificationData from SQLAlchemy Notification model."""
         return cls(
             id=str(notification.id),
-            user_id=str(notification.user_id),
+            user_id=uuid_str(notification.user_id),
             type=notification.type,
             title=notification.title,
             message=notification.message,
@@ -107,36 +135,93 @@ class NotificationData:
             read_at=notification.read_at,
             created_at=notification.created_at
         )
+    
+    @classmethod
+    def from_mapping(cls, row: Mapping[str, Any]) -> 'NotificationData':
+        """Create NotificationData from a Core row mapping selected with ``columns()``."""
+        return cls(
+            id=str(row['id']),
+            user_id=uuid_str(row['user_id']),
+            type=row['type'],
+            title=row['title'],
+            message=row['message'],
+            severity=row['severity'],
+            read_at=row['read_at'],
+            created_at=row['created_at']
+        )
+    
+    @staticmethod
+    def columns() -> List[Any]:
+        """Columns to select for ``from_mapping`` (including the deferred message)."""
+        return data_columns(Notification.__table__)
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationChannelConfig:
     """Configuration for notification delivery channels."""
     enabled: bool
     channels: List[NotificationChannel]
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationPreferences:
     """User notification preferences."""
     user_id: str
-    preferences: Dict[str, NotificationChannelConfig]
+    preferences: Mapping[str, NotificationChannelConfig]
+    # Channels of enabled types only, built once; NotificationType members
+    # hash and compare as their values, so they look up the string keys
+    _enabled_channels: Dict[str, List[NotificationChannel]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._enabled_channels = {
+            key: config.channels
+            for key, config in self.preferences.items()
+            if config.enabled
+        }
     
-    def get_channels_for_type(self, notification_type: NotificationType) -> List[NotificationChannel]:
+    def get_channels_for_type(self, notification_type: NotificationType) -> Sequence[NotificationChannel]:
         """Get enabled channels for a specific notification type."""
-        config = self.preferences.get(notification_type.value)
-        if config and config.enabled:
-            return config.channels
-        return []
+        return self._enabled_channels.get(notification_type, ())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotificationRequest:
-    """Request to send a notification."""
+    """
+    Request to send a notification.
+    
+    Frozen so one request can be shared between threads and fan-out
+    recipients without copying; channels may be a shared tuple.
+    """
     user_id: str
     type: NotificationType
     title: str
     message: str
     severity: NotificationSeverity
-    channels: Optional[List[NotificationChannel]] = None
+    channels: Optional[Sequence[NotificationChannel]] = None
     metadata: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization (e.g. a task payload)."""
+        return {
+            'user_id': self.user_id,
+            'type': self.type.value,
+            'title': self.title,
+            'message': self.message,
+            'severity': self.severity.value,
+            'channels': [channel.value for channel in self.channels] if self.channels is not None else None,
+            'metadata': self.metadata
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'NotificationRequest':
+        """Create from dictionary."""
+        channels = data.get('channels')
+        return cls(
+            user_id=data['user_id'],
+            type=NotificationType(data['type']),
+            title=data['title'],
+            message=data['message'],
+            severity=NotificationSeverity(data['severity']),
+            channels=tuple(NotificationChannel(channel) for channel in channels) if channels is not None else None,
+            metadata=data.get('metadata')
+        )
@@ -3,11 +3,12 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
-from sqlalchemy import Column, String, Integer, Numeric, DateTime, ForeignKey, Index, Enum as SQLEnum
+from typing import Any, List, Mapping, Optional
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
-from shared.database.connection import Base
+from shared.database.base import Base, data_columns
+from shared.database.types import Paise, SmallIntEnum
+from shared.utils.ids import uuid7, uuid_str
 
 
 class OrderStatus(str, Enum):
@@ -44,31 +45,42 @@ class Order(Base):
     """SQLAlchemy model for orders table."""
     __tablename__ = "orders"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     account_id = Column(UUID(as_uuid=True), nullable=False)
     strategy_id = Column(UUID(as_uuid=True), nullable=True)
     symbol = Column(String(50), nullable=False)
-    side = Column(SQLEnum(OrderSide), nullable=False)
+    side = Column(SmallIntEnum(OrderSide), nullable=False)
     quantity = Column(Integer, nullable=False)
     order_type = Column(String(20), nullable=False)
-    price = Column(Numeric(10, 2), nullable=True)
-    stop_price = Column(Numeric(10, 2), nullable=True)
+    price = Column(Paise(), nullable=True)
+    stop_price = Column(Paise(), nullable=True)
     trading_mode = Column(SQLEnum(TradingMode), nullable=False)
-    status = Column(SQLEnum(OrderStatus), nullable=False, default=OrderStatus.PENDING)
+    status = Column(SmallIntEnum(OrderStatus), nullable=False, default=OrderStatus.PENDING)
     filled_quantity = Column(Integer, default=0)
-    average_price = Column(Numeric(10, 2), nullable=True)
+    average_price = Column(Paise(), nullable=True)
     broker_order_id = Column(String(100), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     __table_args__ = (
         Index('idx_orders_account', 'account_id', 'created_at'),
-        Index('idx_orders_status', 'status', 'trading_mode'),
-        Index('idx_orders_broker', 'broker_order_id'),
+        # Open-order lookups only touch working orders; symbol/quantity are
+        # carried in the index so dashboards can use index-only scans
+        Index(
+            'idx_orders_open', 'account_id', 'trading_mode',
+            postgresql_where=status.in_(
+                [OrderStatus.PENDING, OrderStatus.SUBMITTED, OrderStatus.PARTIAL]
+            ),
+            postgresql_include=['symbol', 'quantity']
+        ),
+        Index(
+            'idx_orders_broker', 'broker_order_id',
+            postgresql_where=broker_order_id.isnot(None)
+        ),
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderData:
     """Data class for order information."""
     id: str
@@ -93,8 +105,8 @@ class OrderData:
         """Create OrderData from SQLAlchemy Order model."""
         return cls(
             id=str(order.id),
-            account_id=str(order.account_id),
-            strategy_id=str(order.strategy_id) if order.strategy_id else None,
+            account_id=uuid_str(order.account_id),
+            strategy_id=uuid_str(order.strategy_id) if order.strategy_id else None,
             symbol=order.symbol,
             side=order.side,
             quantity=order.quantity,
@@ -109,3 +121,31 @@ class OrderData:
             created_at=order.created_at,
             updated_at=order.updated_at
         )
+
+    @classmethod
+    def from_mapping(cls, row: Mapping[str, Any]) -> 'OrderData':
+        """Create OrderData from a Core row mapping selected with ``columns()``."""
+        strategy_id = row['strategy_id']
+        return cls(
+            id=str(row['id']),
+            account_id=uuid_str(row['account_id']),
+            strategy_id=uuid_str(strategy_id) if strategy_id else None,
+            symbol=row['symbol'],
+            side=row['side'],
+            quantity=row['quantity'],
+            order_type=row['order_type'],
+            price=row['price'],
+            stop_price=row['stop_price'],
+            trading_mode=row['trading_mode'],
+            status=row['status'],
+            filled_quantity=row['filled_quantity'],
+            average_price=row['average_price'],
+            broker_order_id=row['broker_order_id'],
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+
+    @staticmethod
+    def columns() -> List[Any]:
+        """Columns to select for ``from_mapping`` (prices come back as floats)."""
+        return data_columns(Order.__table__)
@@ -2,11 +2,12 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any
-from sqlalchemy import Column, String, Integer, Numeric, DateTime, Index, Enum as SQLEnum, JSON
+from typing import Optional, Dict, Any, List, Mapping
+from sqlalchemy import Boolean, Column, String, Integer, DateTime, Float, Index, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
-from shared.database.connection import Base
+from shared.database.base import Base, data_columns
+from shared.database.types import Paise
+from shared.utils.ids import uuid7, uuid_str
 from shared.models.order import TradingMode
 from enum import Enum
 
@@ -21,32 +22,74 @@ class Position(Base):
     """SQLAlchemy model for positions table."""
     __tablename__ = "positions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     account_id = Column(UUID(as_uuid=True), nullable=False)
     strategy_id = Column(UUID(as_uuid=True), nullable=True)
     symbol = Column(String(50), nullable=False)
     side = Column(SQLEnum(PositionSide), nullable=False)
     quantity = Column(Integer, nullable=False)
-    entry_price = Column(Numeric(10, 2), nullable=False)
-    current_price = Column(Numeric(10, 2), nullable=False)
-    unrealized_pnl = Column(Numeric(10, 2), nullable=False, default=0)
-    realized_pnl = Column(Numeric(10, 2), default=0)
+    entry_price = Column(Paise(), nullable=False)
+    current_price = Column(Paise(), nullable=False)
+    unrealized_pnl = Column(Paise(), nullable=False, default=0)
+    realized_pnl = Column(Paise(), default=0)
     trading_mode = Column(SQLEnum(TradingMode), nullable=False)
-    stop_loss = Column(Numeric(10, 2), nullable=True)
-    take_profit = Column(Numeric(10, 2), nullable=True)
-    trailing_stop_config = Column(JSON, nullable=True)
+    stop_loss = Column(Paise(), nullable=True)
+    take_profit = Column(Paise(), nullable=True)
+    # Trailing stop-loss, configured when trailing_percentage is set
+    trailing_enabled = Column(Boolean, nullable=False, default=False)
+    trailing_percentage = Column(Float, nullable=True)
+    trailing_stop_price = Column(Paise(), nullable=True)
+    trailing_high = Column(Paise(), nullable=True)
+    trailing_low = Column(Paise(), nullable=True)
     opened_at = Column(DateTime, default=datetime.utcnow)
     closed_at = Column(DateTime, nullable=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     __table_args__ = (
         Index('idx_positions_account', 'account_id', 'closed_at'),
+        Index(
+            'idx_positions_open', 'account_id', 'trading_mode',
+            postgresql_where=text('closed_at IS NULL')
+        ),
         Index('idx_positions_symbol', 'symbol', 'trading_mode'),
         Index('idx_positions_strategy', 'strategy_id'),
+        # Price ticks only look at open positions with an active trailing stop
+        Index(
+            'idx_positions_trailing', 'symbol', 'trading_mode',
+            postgresql_where=text('trailing_enabled AND closed_at IS NULL')
+        ),
     )
 
+    @property
+    def trailing_stop(self) -> Optional['TrailingStopConfig']:
+        """Trailing stop-loss configuration, or None if never configured."""
+        if self.trailing_percentage is None:
+            return None
+        return TrailingStopConfig(
+            enabled=self.trailing_enabled,
+            percentage=self.trailing_percentage,
+            current_stop_price=self.trailing_stop_price,
+            highest_price=self.trailing_high,
+            lowest_price=self.trailing_low
+        )
+
+    @trailing_stop.setter
+    def trailing_stop(self, config: Optional['TrailingStopConfig']) -> None:
+        if config is None:
+            self.trailing_enabled = False
+            self.trailing_percentage = None
+            self.trailing_stop_price = None
+            self.trailing_high = None
+            self.trailing_low = None
+            return
+        self.trailing_enabled = config.enabled
+        self.trailing_percentage = config.percentage
+        self.trailing_stop_price = config.current_stop_price
+        self.trailing_high = config.highest_price
+        self.trailing_low = config.lowest_price
+
 
-@dataclass
+@dataclass(slots=True)
 class TrailingStopConfig:
     """Configuration for trailing stop-loss."""
     enabled: bool
@@ -56,7 +99,7 @@ class TrailingStopConfig:
     lowest_price: float   # for short positions
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionData:
     """Data class for position information."""
     id: str
@@ -79,14 +122,10 @@ class PositionData:
     @classmethod
     def from_orm(cls, position: Position) -> 'PositionData':
         """Create PositionData from SQLAlchemy Position model."""
-        trailing_stop = None
-        if position.trailing_stop_config:
-            trailing_stop = TrailingStopConfig(**position.trailing_stop_config)
-        
         return cls(
             id=str(position.id),
-            account_id=str(position.account_id),
-            strategy_id=str(position.strategy_id) if position.strategy_id else None,
+            account_id=uuid_str(position.account_id),
+            strategy_id=uuid_str(position.strategy_id) if position.strategy_id else None,
             symbol=position.symbol,
             side=position.side,
             quantity=position.quantity,
@@ -97,7 +136,44 @@ class PositionData:
             trading_mode=position.trading_mode,
             stop_loss=float(position.stop_loss) if position.stop_loss else None,
             take_profit=float(position.take_profit) if position.take_profit else None,
-            trailing_stop_loss=trailing_stop,
+            trailing_stop_loss=position.trailing_stop,
             opened_at=position.opened_at,
             closed_at=position.closed_at
         )
+
+    @classmethod
+    def from_mapping(cls, row: Mapping[str, Any]) -> 'PositionData':
+        """Create PositionData from a Core row mapping selected with ``columns()``."""
+        strategy_id = row['strategy_id']
+        trailing_stop = None
+        if row['trailing_percentage'] is not None:
+            trailing_stop = TrailingStopConfig(
+                enabled=row['trailing_enabled'],
+                percentage=row['trailing_percentage'],
+                current_stop_price=row['trailing_stop_price'],
+                highest_price=row['trailing_high'],
+                lowest_price=row['trailing_low']
+            )
+        return cls(
+            id=str(row['id']),
+            account_id=uuid_str(row['account_id']),
+            strategy_id=uuid_str(strategy_id) if strategy_id else None,
+            symbol=row['symbol'],
+            side=row['side'],
+            quantity=row['quantity'],
+            entry_price=row['entry_price'],
+            current_price=row['current_price'],
+            unrealized_pnl=row['unrealized_pnl'],
+            realized_pnl=row['realized_pnl'],
+            trading_mode=row['trading_mode'],
+            stop_loss=row['stop_loss'],
+            take_profit=row['take_profit'],
+            trailing_stop_loss=trailing_stop,
+            opened_at=row['opened_at'],
+            closed_at=row['closed_at']
+        )
+
+    @staticmethod
+    def columns() -> List[Any]:
+        """Columns to select for ``from_mapping`` (prices come back as floats)."""
+        return data_columns(Position.__table__)
@@ -9,12 +9,13 @@ from typing import Optional
 
 from sqlalchemy import (
     Boolean, Column, DateTime, Integer, String, 
-    CheckConstraint, ForeignKey, DECIMAL
+    CheckConstraint, ForeignKey
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from shared.database.connection import Base
+from shared.database.base import Base
+from shared.database.types import Paise
 
 
 class RiskLimits(Base):
@@ -24,8 +25,8 @@ class RiskLimits(Base):
     
     account_id = Column(UUID(as_uuid=True), ForeignKey("user_accounts.id"), primary_key=True)
     trading_mode = Column(String(10), primary_key=True)
-    max_loss_limit = Column(DECIMAL(15, 2), nullable=False)
-    current_loss = Column(DECIMAL(15, 2), default=Decimal('0.00'), nullable=False)
+    max_loss_limit = Column(Paise(asdecimal=True), nullable=False)
+    current_loss = Column(Paise(asdecimal=True), default=Decimal('0.00'), nullable=False)
     is_breached = Column(Boolean, default=False, nullable=False)
     breached_at = Column(DateTime, nullable=True)
     acknowledged = Column(Boolean, default=False, nullable=False)
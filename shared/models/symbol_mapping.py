@@ -3,9 +3,9 @@ Symbol mapping data models.
 Implements SymbolMapping table for translating between standard NSE symbols 
 and broker-specific symbol tokens.
 """
-import uuid
+import sys
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from sqlalchemy import (
@@ -13,7 +13,8 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import UUID
 
-from shared.database.connection import Base
+from shared.database.base import Base
+from shared.utils.ids import uuid7
 
 
 class SymbolMapping(Base):
@@ -21,7 +22,7 @@ class SymbolMapping(Base):
     
     __tablename__ = "symbol_mappings"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     standard_symbol = Column(String(50), nullable=False)
     broker_name = Column(String(50), nullable=False)
     broker_symbol = Column(String(100), nullable=False)
@@ -49,37 +50,54 @@ class SymbolMapping(Base):
 class SymbolMappingCache:
     """In-memory cache for symbol mappings."""
     
-    # {broker_name: {standard_symbol: SymbolMapping}}
-    mappings: Dict[str, Dict[str, SymbolMapping]]
+    __slots__ = ("mappings", "_by_broker", "last_updated")
+    
+    # {(broker_name, standard_symbol): SymbolMapping}
+    mappings: Dict[Tuple[str, str], SymbolMapping]
+    # {broker_name: {standard_symbol}}, only used for per-broker operations
+    _by_broker: Dict[str, Set[str]]
     last_updated: datetime
     
     def __init__(self):
         self.mappings = {}
+        self._by_broker = {}
         self.last_updated = datetime.utcnow()
     
     def get_mapping(self, broker_name: str, standard_symbol: str) -> Optional[SymbolMapping]:
         """Get symbol mapping from cache."""
-        broker_mappings = self.mappings.get(broker_name, {})
-        return broker_mappings.get(standard_symbol)
+        return self.mappings.get((broker_name, standard_symbol))
     
     def set_mapping(self, broker_name: str, standard_symbol: str, mapping: SymbolMapping) -> None:
         """Set symbol mapping in cache."""
-        if broker_name not in self.mappings:
-            self.mappings[broker_name] = {}
-        self.mappings[broker_name][standard_symbol] = mapping
+        broker_name = sys.intern(broker_name)
+        standard_symbol = sys.intern(standard_symbol)
+        self.mappings[(broker_name, standard_symbol)] = mapping
+        self._by_broker.setdefault(broker_name, set()).add(standard_symbol)
         self.last_updated = datetime.utcnow()
     
+    def remove_mapping(self, broker_name: str, standard_symbol: str) -> None:
+        """Remove a symbol mapping from cache if present."""
+        if self.mappings.pop((broker_name, standard_symbol), None) is not None:
+            self._by_broker[broker_name].discard(standard_symbol)
+            self.last_updated = datetime.utcnow()
+    
     def get_broker_mappings(self, broker_name: str) -> Dict[str, SymbolMapping]:
         """Get all mappings for a broker."""
-        return self.mappings.get(broker_name, {})
+        return {
+            standard_symbol: self.mappings[(broker_name, standard_symbol)]
+            for standard_symbol in self._by_broker.get(broker_name, ())
+        }
     
     def clear(self) -> None:
         """Clear all cached mappings."""
         self.mappings = {}
+        self._by_broker = {}
         self.last_updated = datetime.utcnow()
     
     def clear_broker(self, broker_name: str) -> None:
         """Clear mappings for a specific broker."""
-        if broker_name in self.mappings:
-            del self.mappings[broker_name]
+        standard_symbols = self._by_broker.pop(broker_name, None)
+        if standard_symbols is not None:
+            for standard_symbol in standard_symbols:
+                del self.mappings[(broker_name, standard_symbol)]
             self.last_updated = datetime.utcnow()
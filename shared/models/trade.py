@@ -2,10 +2,12 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Numeric, DateTime, ForeignKey, Index, Enum as SQLEnum
+from typing import Any, List, Mapping
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
-from shared.database.connection import Base
+from shared.database.base import Base, data_columns
+from shared.database.types import Paise, SmallIntEnum
+from shared.utils.ids import uuid7, uuid_str
 from shared.models.order import OrderSide, TradingMode
 
 
@@ -13,25 +15,24 @@ class Trade(Base):
     """SQLAlchemy model for trades table."""
     __tablename__ = "trades"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     order_id = Column(UUID(as_uuid=True), ForeignKey('orders.id'), nullable=False)
     account_id = Column(UUID(as_uuid=True), nullable=False)
     symbol = Column(String(50), nullable=False)
-    side = Column(SQLEnum(OrderSide), nullable=False)
+    side = Column(SmallIntEnum(OrderSide), nullable=False)
     quantity = Column(Integer, nullable=False)
-    price = Column(Numeric(10, 2), nullable=False)
-    commission = Column(Numeric(10, 2), nullable=False, default=0)
+    price = Column(Paise(), nullable=False)
+    commission = Column(Paise(), nullable=False, default=0)
     trading_mode = Column(SQLEnum(TradingMode), nullable=False)
     executed_at = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
         Index('idx_trades_account', 'account_id', 'executed_at'),
-        Index('idx_trades_order', 'order_id'),
-        Index('idx_trades_symbol', 'symbol', 'trading_mode'),
+        Index('idx_trades_order', 'order_id', 'executed_at'),
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeData:
     """Data class for trade information."""
     id: str
@@ -50,8 +51,8 @@ class TradeData:
         """Create TradeData from SQLAlchemy Trade model."""
         return cls(
             id=str(trade.id),
-            order_id=str(trade.order_id),
-            account_id=str(trade.account_id),
+            order_id=uuid_str(trade.order_id),
+            account_id=uuid_str(trade.account_id),
             symbol=trade.symbol,
             side=trade.side,
             quantity=trade.quantity,
@@ -60,3 +61,24 @@ class TradeData:
             trading_mode=trade.trading_mode,
             executed_at=trade.executed_at
         )
+
+    @classmethod
+    def from_mapping(cls, row: Mapping[str, Any]) -> 'TradeData':
+        """Create TradeData from a Core row mapping selected with ``columns()``."""
+        return cls(
+            id=str(row['id']),
+            order_id=uuid_str(row['order_id']),
+            account_id=uuid_str(row['account_id']),
+            symbol=row['symbol'],
+            side=row['side'],
+            quantity=row['quantity'],
+            price=row['price'],
+            commission=row['commission'],
+            trading_mode=row['trading_mode'],
+            executed_at=row['executed_at']
+        )
+
+    @staticmethod
+    def columns() -> List[Any]:
+        """Columns to select for ``from_mapping`` (prices come back as floats)."""
+        return data_columns(Trade.__table__)
@@ -2,29 +2,30 @@
 User authentication and management data models.
 Implements User, UserAccount, AccountAccess, InvestorInvitation, and Session tables.
 """
-import uuid
 from datetime import datetime
-from enum import Enum as PyEnum
+from enum import StrEnum
 from typing import Optional
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Enum, ForeignKey, Integer, 
+    Boolean, Column, DateTime, ForeignKey, Integer, 
     String, Text, CheckConstraint, Index
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
-from shared.database.connection import Base
+from shared.database.base import Base
+from shared.database.types import SmallIntEnum, TokenDigest
+from shared.utils.ids import uuid7
 
 
-class UserRole(PyEnum):
+class UserRole(StrEnum):
     """User role enumeration."""
     ADMIN = "admin"
     TRADER = "trader"
     INVESTOR = "investor"
 
 
-class InvitationStatus(PyEnum):
+class InvitationStatus(StrEnum):
     """Investor invitation status enumeration."""
     PENDING = "pending"
     ACCEPTED = "accepted"
@@ -37,11 +38,11 @@ class User(Base):
     
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
     role = Column(
-        Enum(UserRole, name="user_role", create_type=True, values_callable=lambda x: [e.value for e in x]),
+        SmallIntEnum(UserRole),
         nullable=False,
         default=UserRole.TRADER
     )
@@ -52,23 +53,43 @@ class User(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
-    sessions = relationship("Session", back_populates="user", cascade="all, delete-orphan")
+    # Collections never load implicitly; callers must request them with
+    # selectinload() so listing users cannot fan out into N+1 queries.
+    # Deleting a user leaves child rows to the ON DELETE CASCADE foreign
+    # keys (passive_deletes) instead of loading each collection first
+    sessions = relationship(
+        "Session",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise"
+    )
     trader_accounts = relationship(
         "UserAccount", 
         back_populates="trader",
         foreign_keys="UserAccount.trader_id",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise"
+    )
+    account_accesses = relationship(
+        "AccountAccess",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise"
     )
-    account_accesses = relationship("AccountAccess", back_populates="user", cascade="all, delete-orphan")
     sent_invitations = relationship(
         "InvestorInvitation",
         back_populates="inviter",
         foreign_keys="InvestorInvitation.inviter_id",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise"
     )
     
     def __repr__(self) -> str:
-        return f"<User(id={self.id}, email={self.email}, role={self.role.value})>"
+        return f"<User(id={self.id}, email={self.email}, role={self.role})>"
 
 
 class UserAccount(Base):
@@ -76,17 +97,21 @@ class UserAccount(Base):
     
     __tablename__ = "user_accounts"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    trader_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    trader_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
-    trader = relationship("User", back_populates="trader_accounts", foreign_keys=[trader_id])
-    account_accesses = relationship("AccountAccess", back_populates="account", cascade="all, delete-orphan")
-    invitations = relationship("InvestorInvitation", back_populates="account", cascade="all, delete-orphan")
+    trader = relationship("User", back_populates="trader_accounts", foreign_keys=[trader_id], lazy="joined")
+    account_accesses = relationship(
+        "AccountAccess", back_populates="account", cascade="all, delete-orphan", passive_deletes=True
+    )
+    invitations = relationship(
+        "InvestorInvitation", back_populates="account", cascade="all, delete-orphan", passive_deletes=True
+    )
     
     def __repr__(self) -> str:
         return f"<UserAccount(id={self.id}, name={self.name}, trader_id={self.trader_id})>"
@@ -97,8 +122,8 @@ class AccountAccess(Base):
     
     __tablename__ = "account_access"
     
-    account_id = Column(UUID(as_uuid=True), ForeignKey("user_accounts.id"), primary_key=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    account_id = Column(UUID(as_uuid=True), ForeignKey("user_accounts.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
     role = Column(String(20), nullable=False)
     granted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
@@ -122,12 +147,12 @@ class InvestorInvitation(Base):
     
     __tablename__ = "investor_invitations"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    account_id = Column(UUID(as_uuid=True), ForeignKey("user_accounts.id"), nullable=False)
-    inviter_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    account_id = Column(UUID(as_uuid=True), ForeignKey("user_accounts.id", ondelete="CASCADE"), nullable=False)
+    inviter_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     invitee_email = Column(String(255), nullable=False)
     status = Column(
-        Enum(InvitationStatus, name="invitation_status", create_type=True, values_callable=lambda x: [e.value for e in x]),
+        SmallIntEnum(InvitationStatus),
         nullable=False,
         default=InvitationStatus.PENDING
     )
@@ -144,7 +169,7 @@ class InvestorInvitation(Base):
     )
     
     def __repr__(self) -> str:
-        return f"<InvestorInvitation(id={self.id}, invitee_email={self.invitee_email}, status={self.status.value})>"
+        return f"<InvestorInvitation(id={self.id}, invitee_email={self.invitee_email}, status={self.status})>"
 
 
 class Session(Base):
@@ -152,13 +177,14 @@ class Session(Base):
     
     __tablename__ = "sessions"
     
-    token = Column(String(512), primary_key=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    # SHA-256 of the JWT; a leaked table does not leak usable tokens
+    token = Column(TokenDigest, primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     expires_at = Column(DateTime, nullable=False)
     last_activity = Column(DateTime, default=datetime.utcnow, nullable=False)
     ip_address = Column(String(45), nullable=True)
-    user_agent = Column(Text, nullable=True)
+    user_agent = deferred(Column(Text, nullable=True))
     
     # Relationships
     user = relationship("User", back_populates="sessions")
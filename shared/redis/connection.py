@@ -3,11 +3,16 @@ Redis connection management with cluster support.
 Provides connection pooling and automatic failover.
 """
 import logging
-from typing import Optional, Union, List, Any
-import json
+import socket
+import threading
+from typing import Callable, Dict, Optional, Union, List, Any
 
+import orjson
 import redis
 from redis import Redis, ConnectionPool
+from redis.client import Pipeline, PubSub, PubSubWorkerThread
+from redis.connection import Connection
+from redis.utils import HIREDIS_AVAILABLE
 from redis.cluster import RedisCluster, ClusterNode
 from redis.exceptions import RedisError, ConnectionError as RedisConnectionError
 
@@ -15,14 +20,59 @@ from shared.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Kernel send/receive buffer size for Redis sockets, large enough for
+# multi-command pipelines and big replies (INFO, sorted set ranges)
+SOCKET_BUFFER_BYTES = 512 * 1024
+
+
+def _keepalive_options() -> Dict[int, int]:
+    """
+    TCP keepalive tuning for Redis sockets.
+    
+    Idle connections are probed after a minute so ones dropped by a NAT or
+    load balancer are noticed before a command stalls on them. Options the
+    platform lacks are skipped.
+    """
+    options = {}
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+        if hasattr(socket, name):
+            options[getattr(socket, name)] = value
+    return options
+
+
+class LargeBufferConnection(Connection):
+    """Redis connection with enlarged kernel socket buffers."""
+    
+    def _connect(self) -> socket.socket:
+        sock = super()._connect()
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_BYTES)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_BYTES)
+        return sock
+
 
 class RedisManager:
-    """Manages Redis connections with support for standalone and cluster modes."""
+    """
+    Manages Redis connections with support for standalone and cluster modes.
+    
+    The per-command wrappers (get, set, hget, ...) use the client attribute
+    directly rather than the checked ``client`` property, so they must only
+    be called on an initialized manager (as returned by init_redis()).
+    
+    Callers issuing more than one independent command should batch them with
+    mget/mset or pipeline() so they cost one round trip instead of one each.
+    """
     
     def __init__(self):
         self.settings = get_settings()
         self._client: Optional[Union[Redis, RedisCluster]] = None
         self._pool: Optional[ConnectionPool] = None
+        
+        # One PubSub connection per process; subscribe() fans its messages
+        # out to local handlers
+        self._pubsub: Optional[PubSub] = None
+        self._pubsub_thread: Optional[PubSubWorkerThread] = None
+        self._channel_handlers: Dict[str, List[Callable[[dict], None]]] = {}
+        self._pubsub_lock = threading.Lock()
     
     def initialize(self) -> None:
         """Initialize Redis client with appropriate configuration."""
@@ -39,6 +89,9 @@ class RedisManager:
             # Test connection
             self._client.ping()
             logger.info("Redis connection established successfully")
+            if not HIREDIS_AVAILABLE:
+                # redis-py picks the C parser automatically when installed
+                logger.warning("hiredis not installed; parsing Redis replies in pure Python")
             
         except RedisError as e:
             logger.error(f"Failed to initialize Redis: {e}")
@@ -47,6 +100,7 @@ class RedisManager:
     def _initialize_standalone(self) -> None:
         """Initialize standalone Redis connection."""
         self._pool = ConnectionPool(
+            connection_class=LargeBufferConnection,
             host=self.settings.redis_host,
             port=self.settings.redis_port,
             password=self.settings.redis_password,
@@ -54,6 +108,9 @@ class RedisManager:
             max_connections=self.settings.redis_max_connections,
             socket_timeout=self.settings.redis_socket_timeout,
             socket_connect_timeout=self.settings.redis_socket_connect_timeout,
+            # redis-py already sets TCP_NODELAY on every connection
+            socket_keepalive=True,
+            socket_keepalive_options=_keepalive_options(),
             decode_responses=True,
             health_check_interval=30
         )
@@ -76,10 +133,13 @@ class RedisManager:
         
         self._client = RedisCluster(
             startup_nodes=nodes,
+            connection_class=LargeBufferConnection,
             password=self.settings.redis_password,
             max_connections=self.settings.redis_max_connections,
             socket_timeout=self.settings.redis_socket_timeout,
             socket_connect_timeout=self.settings.redis_socket_connect_timeout,
+            socket_keepalive=True,
+            socket_keepalive_options=_keepalive_options(),
             decode_responses=True,
             skip_full_coverage_check=True
         )
@@ -96,7 +156,7 @@ class RedisManager:
     def get(self, key: str) -> Optional[str]:
         """Get value by key."""
         try:
-            return self.client.get(key)
+            return self._client.get(key)
         except RedisError as e:
             logger.error(f"Redis GET error for key '{key}': {e}")
             raise
@@ -122,15 +182,46 @@ class RedisManager:
             xx: Only set if key exists
         """
         try:
-            return self.client.set(key, value, ex=ex, px=px, nx=nx, xx=xx)
+            return self._client.set(key, value, ex=ex, px=px, nx=nx, xx=xx)
         except RedisError as e:
             logger.error(f"Redis SET error for key '{key}': {e}")
             raise
     
+    def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get values for several keys in one round trip."""
+        try:
+            return self._client.mget(keys)
+        except RedisError as e:
+            logger.error(f"Redis MGET error for {len(keys)} keys: {e}")
+            raise
+    
+    def mset(self, mapping: Dict[str, str]) -> bool:
+        """Set several keys in one round trip."""
+        try:
+            return self._client.mset(mapping)
+        except RedisError as e:
+            logger.error(f"Redis MSET error for {len(mapping)} keys: {e}")
+            raise
+    
+    def pipeline(self, transaction: bool = False) -> Pipeline:
+        """
+        Create a pipeline for batching commands into one round trip.
+        
+        Usage:
+            with redis_manager.pipeline() as pipe:
+                pipe.setex(key, 60, value)
+                pipe.sadd(index_key, key)
+                pipe.execute()
+        
+        Args:
+            transaction: Wrap the batch in MULTI/EXEC
+        """
+        return self._client.pipeline(transaction=transaction)
+    
     def delete(self, *keys: str) -> int:
         """Delete one or more keys."""
         try:
-            return self.client.delete(*keys)
+            return self._client.delete(*keys)
         except RedisError as e:
             logger.error(f"Redis DELETE error: {e}")
             raise
@@ -138,7 +229,7 @@ class RedisManager:
     def exists(self, *keys: str) -> int:
         """Check if keys exist."""
         try:
-            return self.client.exists(*keys)
+            return self._client.exists(*keys)
         except RedisError as e:
             logger.error(f"Redis EXISTS error: {e}")
             raise
@@ -146,7 +237,7 @@ class RedisManager:
     def expire(self, key: str, seconds: int) -> bool:
         """Set expiration on key."""
         try:
-            return self.client.expire(key, seconds)
+            return self._client.expire(key, seconds)
         except RedisError as e:
             logger.error(f"Redis EXPIRE error for key '{key}': {e}")
             raise
@@ -154,7 +245,7 @@ class RedisManager:
     def hget(self, name: str, key: str) -> Optional[str]:
         """Get hash field value."""
         try:
-            return self.client.hget(name, key)
+            return self._client.hget(name, key)
         except RedisError as e:
             logger.error(f"Redis HGET error for hash '{name}', key '{key}': {e}")
             raise
@@ -162,7 +253,7 @@ class RedisManager:
     def hset(self, name: str, key: str, value: str) -> int:
         """Set hash field value."""
         try:
-            return self.client.hset(name, key, value)
+            return self._client.hset(name, key, value)
         except RedisError as e:
             logger.error(f"Redis HSET error for hash '{name}': {e}")
             raise
@@ -170,7 +261,7 @@ class RedisManager:
     def hgetall(self, name: str) -> dict:
         """Get all hash fields and values."""
         try:
-            return self.client.hgetall(name)
+            return self._client.hgetall(name)
         except RedisError as e:
             logger.error(f"Redis HGETALL error for hash '{name}': {e}")
             raise
@@ -178,7 +269,7 @@ class RedisManager:
     def hdel(self, name: str, *keys: str) -> int:
         """Delete hash fields."""
         try:
-            return self.client.hdel(name, *keys)
+            return self._client.hdel(name, *keys)
         except RedisError as e:
             logger.error(f"Redis HDEL error for hash '{name}': {e}")
             raise
@@ -186,7 +277,7 @@ class RedisManager:
     def lpush(self, name: str, *values: str) -> int:
         """Push values to list head."""
         try:
-            return self.client.lpush(name, *values)
+            return self._client.lpush(name, *values)
         except RedisError as e:
             logger.error(f"Redis LPUSH error for list '{name}': {e}")
             raise
@@ -194,7 +285,7 @@ class RedisManager:
     def rpush(self, name: str, *values: str) -> int:
         """Push values to list tail."""
         try:
-            return self.client.rpush(name, *values)
+            return self._client.rpush(name, *values)
         except RedisError as e:
             logger.error(f"Redis RPUSH error for list '{name}': {e}")
             raise
@@ -202,7 +293,7 @@ class RedisManager:
     def lrange(self, name: str, start: int, end: int) -> List[str]:
         """Get list elements in range."""
         try:
-            return self.client.lrange(name, start, end)
+            return self._client.lrange(name, start, end)
         except RedisError as e:
             logger.error(f"Redis LRANGE error for list '{name}': {e}")
             raise
@@ -210,27 +301,85 @@ class RedisManager:
     def publish(self, channel: str, message: str) -> int:
         """Publish message to channel."""
         try:
-            return self.client.publish(channel, message)
+            return self._client.publish(channel, message)
         except RedisError as e:
             logger.error(f"Redis PUBLISH error for channel '{channel}': {e}")
             raise
     
-    def subscribe(self, *channels: str):
-        """Subscribe to channels."""
+    def subscribe(self, channel: str, handler: Callable[[dict], None]) -> Callable[[], None]:
+        """
+        Call handler with every message published to channel.
+        
+        All subscriptions in the process share one PubSub connection and
+        one listener thread; the channel is only subscribed on Redis for
+        its first handler. Handlers run on the listener thread and should
+        return quickly.
+        
+        Args:
+            channel: Channel name
+            handler: Called with each redis-py message dict
+            
+        Returns:
+            Function that removes this handler again
+        """
         try:
-            pubsub = self.client.pubsub()
-            pubsub.subscribe(*channels)
-            return pubsub
+            with self._pubsub_lock:
+                handlers = self._channel_handlers.get(channel)
+                if handlers is not None:
+                    handlers.append(handler)
+                else:
+                    if self._pubsub is None:
+                        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                    self._pubsub.subscribe(**{channel: self._dispatch_message})
+                    self._channel_handlers[channel] = [handler]
+                    if self._pubsub_thread is None:
+                        self._pubsub_thread = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
         except RedisError as e:
-            logger.error(f"Redis SUBSCRIBE error: {e}")
+            logger.error(f"Redis SUBSCRIBE error for channel '{channel}': {e}")
             raise
+        
+        return lambda: self.unsubscribe(channel, handler)
+    
+    def unsubscribe(self, channel: str, handler: Callable[[dict], None]) -> None:
+        """
+        Remove a handler added with subscribe().
+        
+        The channel is unsubscribed on Redis once its last handler is gone.
+        
+        Args:
+            channel: Channel name
+            handler: Handler passed to subscribe()
+        """
+        with self._pubsub_lock:
+            handlers = self._channel_handlers.get(channel)
+            if not handlers or handler not in handlers:
+                return
+            handlers.remove(handler)
+            if handlers:
+                return
+            del self._channel_handlers[channel]
+            try:
+                self._pubsub.unsubscribe(channel)
+            except RedisError as e:
+                logger.error(f"Redis UNSUBSCRIBE error for channel '{channel}': {e}")
+    
+    def _dispatch_message(self, message: dict) -> None:
+        """Fan a PubSub message out to the channel's local handlers."""
+        # Copy so handlers can unsubscribe while being called
+        handlers = tuple(self._channel_handlers.get(message['channel'], ()))
+        for handler in handlers:
+            try:
+                handler(message)
+            except Exception as e:
+                logger.error(f"Error in handler for channel '{message['channel']}': {e}", exc_info=True)
     
     def set_json(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
         """Set JSON-serialized value."""
         try:
-            json_value = json.dumps(value)
+            # orjson produces bytes, which redis-py sends without re-encoding
+            json_value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
             return self.set(key, json_value, ex=ex)
-        except (RedisError, json.JSONDecodeError) as e:
+        except (RedisError, orjson.JSONEncodeError) as e:
             logger.error(f"Redis SET_JSON error for key '{key}': {e}")
             raise
     
@@ -240,8 +389,8 @@ class RedisManager:
             value = self.get(key)
             if value is None:
                 return None
-            return json.loads(value)
-        except (RedisError, json.JSONDecodeError) as e:
+            return orjson.loads(value)
+        except (RedisError, orjson.JSONDecodeError) as e:
             logger.error(f"Redis GET_JSON error for key '{key}': {e}")
             raise
     
@@ -263,6 +412,15 @@ class RedisManager:
     
     def close(self) -> None:
         """Close Redis connection."""
+        with self._pubsub_lock:
+            if self._pubsub_thread is not None:
+                self._pubsub_thread.stop()
+                self._pubsub_thread = None
+            if self._pubsub is not None:
+                self._pubsub.close()
+                self._pubsub = None
+            self._channel_handlers.clear()
+        
         if self._client:
             self._client.close()
             logger.info("Redis connection closed")
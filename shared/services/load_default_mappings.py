@@ -4,9 +4,16 @@ Script to load default symbol mappings on first startup.
 import logging
 import os
 from pathlib import Path
+from typing import Optional
+
+from redis import Redis
+from sqlalchemy.orm import Session
 
 from shared.database.connection import get_db_session
-from shared.services.symbol_mapping_service import SymbolMappingService
+from shared.redis.connection import get_redis_client
+from shared.services.symbol_mapping_service import (
+    LOADED_FLAG_TTL_SECONDS, SymbolMappingService, loaded_flag_key
+)
 from shared.models.symbol_mapping import SymbolMapping
 
 
@@ -20,45 +27,79 @@ def load_default_angel_one_mappings() -> bool:
     Returns:
         True if mappings were loaded or already exist, False on error
     """
+    broker_name = "Angel One"
+    csv_path = Path(__file__).parent.parent / "data" / "angel_one_symbol_mappings.csv"
     try:
-        db = next(get_db_session())
-        service = SymbolMappingService(db)
-        
-        # Check if Angel One mappings already exist
-        existing_mappings = db.query(SymbolMapping).filter(
-            SymbolMapping.broker_name == "Angel One"
-        ).count()
-        
-        if existing_mappings > 0:
-            logger.info(f"Angel One mappings already loaded ({existing_mappings} symbols)")
+        redis_client = get_redis_client()
+    except RuntimeError:
+        # Redis not initialized; fall back to checking the table
+        redis_client = None
+    
+    try:
+        # Repeat starts skip the database entirely
+        if redis_client is not None and redis_client.get(loaded_flag_key(broker_name)):
+            logger.info("Angel One mappings already loaded")
             return True
+    except Exception as e:
+        logger.warning(f"Failed to read symbol mapping loaded flag: {e}")
+    
+    try:
+        with get_db_session() as db:
+            return _load_broker_defaults(db, broker_name, csv_path, redis_client)
+    except Exception as e:
+        logger.error(f"Error loading default mappings: {e}")
+        return False
+
+
+def _load_broker_defaults(
+    db: Session,
+    broker_name: str,
+    csv_path: Path,
+    redis_client: Optional[Redis]
+) -> bool:
+    """
+    Load a broker's default mappings unless the table already has some.
+    
+    Args:
+        db: Database session
+        broker_name: Name of the broker
+        csv_path: CSV file with the broker's default mappings
+        redis_client: Redis client for the loaded flag, or None
         
+    Returns:
+        True if mappings were loaded or already exist, False on error
+    """
+    # Existence only needs one index probe, not a count of every row
+    already_loaded = db.query(SymbolMapping.id).filter(
+        SymbolMapping.broker_name == broker_name
+    ).limit(1).first() is not None
+    
+    if not already_loaded:
         # Load from CSV file
-        csv_path = Path(__file__).parent.parent / "data" / "angel_one_symbol_mappings.csv"
-        
         if not csv_path.exists():
             logger.error(f"Default mappings CSV not found: {csv_path}")
             return False
         
-        logger.info(f"Loading default Angel One mappings from {csv_path}")
-        result = service.load_mappings_from_csv("Angel One", str(csv_path))
+        logger.info(f"Loading default {broker_name} mappings from {csv_path}")
+        result = SymbolMappingService(db).load_mappings_from_csv(broker_name, str(csv_path))
         
-        if result['success']:
-            logger.info(
-                f"Successfully loaded {result['loaded']} Angel One symbol mappings "
-                f"({result['failed']} failed)"
-            )
-            return True
-        else:
+        if not result['success']:
             logger.error(f"Failed to load default mappings: {result.get('error', 'Unknown error')}")
             return False
+        
+        logger.info(
+            f"Successfully loaded {result['loaded']} {broker_name} symbol mappings "
+            f"({result['failed']} failed)"
+        )
+    else:
+        logger.info(f"{broker_name} mappings already loaded")
     
-    except Exception as e:
-        logger.error(f"Error loading default mappings: {e}")
-        return False
-    finally:
-        if 'db' in locals():
-            db.close()
+    if redis_client is not None:
+        try:
+            redis_client.set(loaded_flag_key(broker_name), "1", ex=LOADED_FLAG_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Failed to set symbol mapping loaded flag: {e}")
+    return True
 
 
 def initialize_symbol_mappings() -> None:
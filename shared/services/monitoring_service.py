@@ -3,18 +3,37 @@ Monitoring service for system health checks and alerting.
 Tracks CPU, memory, database connections, and custom trading metrics.
 """
 import logging
+import orjson
 import psutil
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
+from redis.client import Pipeline
+
 from shared.database.connection import get_db_manager
 from shared.redis.connection import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Sorted set of live alert keys scored by alert time, so recent alerts can
+# be read without scanning the keyspace
+ALERT_INDEX_KEY = "alerts:index"
+ALERT_TTL_SECONDS = 3600
+
+# Metric samples are kept in Redis streams for this long
+METRIC_RETENTION_SECONDS = 3600
+
+# Error rates are counted in fixed buckets; the rate covers the buckets
+# spanning the last window
+ERROR_RATE_WINDOW_SECONDS = 300
+ERROR_RATE_BUCKET_SECONDS = 10
+ERROR_RATE_BUCKETS = ERROR_RATE_WINDOW_SECONDS // ERROR_RATE_BUCKET_SECONDS
+
 
 class AlertSeverity(Enum):
     """Alert severity levels."""
@@ -23,7 +42,7 @@ class AlertSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Alert:
     """Alert data structure."""
     metric_name: str
@@ -34,7 +53,7 @@ class Alert:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MetricThreshold:
     """Threshold configuration for a metric."""
     metric_name: str
@@ -44,6 +63,75 @@ class MetricThreshold:
     comparison: str  # 'gt' (greater than) or 'lt' (less than)
 
 
+class MonitoringThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor that keeps queueing and run-time statistics.
+    
+    Read them with stats_snapshot() and publish them with
+    MonitoringService.track_custom_metrics to see when the pool is too
+    small (queue latency grows) or its tasks slow down.
+    """
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._task_count = 0
+        self._completed_task_count = 0
+        self._active_count = 0
+        # Reset by each stats_snapshot()
+        self._max_task_latency = 0.0
+        self._queue_latency_total = 0.0
+        self._started_count = 0
+    
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future = super().submit(self._run, time.monotonic(), fn, *args, **kwargs)
+        with self._stats_lock:
+            self._task_count += 1
+        return future
+    
+    def _run(self, enqueued_at: float, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a task, recording its wait in the queue and its run time."""
+        started_at = time.monotonic()
+        with self._stats_lock:
+            self._active_count += 1
+            self._started_count += 1
+            self._queue_latency_total += started_at - enqueued_at
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            task_latency = time.monotonic() - started_at
+            with self._stats_lock:
+                self._active_count -= 1
+                self._completed_task_count += 1
+                self._max_task_latency = max(self._max_task_latency, task_latency)
+    
+    def stats_snapshot(self) -> Dict[str, float]:
+        """
+        Get pool statistics, resetting the per-interval latency figures.
+        
+        Returns:
+            Gauges: active, threads, queue_size, task_count,
+            completed_task_count, max_task_latency and avg_queue_latency
+            (latencies in seconds, since the previous snapshot)
+        """
+        with self._stats_lock:
+            stats = {
+                'active': self._active_count,
+                'threads': len(self._threads),
+                'queue_size': self._work_queue.qsize(),
+                'task_count': self._task_count,
+                'completed_task_count': self._completed_task_count,
+                'max_task_latency': self._max_task_latency,
+                'avg_queue_latency': (
+                    self._queue_latency_total / self._started_count if self._started_count else 0.0
+                )
+            }
+            self._max_task_latency = 0.0
+            self._queue_latency_total = 0.0
+            self._started_count = 0
+        return stats
+
+
 class MonitoringService:
     """Service for monitoring system health and generating alerts."""
     
@@ -52,6 +140,11 @@ class MonitoringService:
         self.redis = get_redis_client()
         self.alert_callbacks: List[Callable[[Alert], None]] = []
         
+        # Start psutil's CPU sampling window so the first collection
+        # reports usage since startup instead of blocking to take a sample
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._cpu_count = psutil.cpu_count()
+        
         # Default thresholds
         self.thresholds = {
             'cpu_percent': MetricThreshold(
@@ -100,12 +193,58 @@ class MonitoringService:
         """
         self.alert_callbacks.append(callback)
     
-    def _trigger_alert(self, alert: Alert) -> None:
+    def _batch(self, pipe: Optional[Pipeline]) -> Pipeline:
+        """
+        Get the pipeline to queue writes on.
+        
+        Args:
+            pipe: Caller's pipeline, if the write is part of a larger batch
+            
+        Returns:
+            The caller's pipeline, or a new non-transactional one
+        """
+        if pipe is not None:
+            return pipe
+        return self.redis.pipeline(transaction=False)
+    
+    def _flush(self, batch: Pipeline, pipe: Optional[Pipeline]) -> None:
+        """
+        Send queued writes unless the caller owns the pipeline.
+        
+        Args:
+            batch: Pipeline returned by _batch()
+            pipe: Pipeline the caller passed in, if any
+        """
+        if batch is not pipe:
+            batch.execute()
+    
+    def _store_sample(self, pipe: Pipeline, key: str, value: float, now: float) -> None:
+        """
+        Queue a metric sample, trimming the series to the retention window.
+        
+        Samples are stream entries, so equal readings never collide and the
+        append and the (approximate) trim are one command.
+        
+        Args:
+            pipe: Pipeline to queue the write on
+            key: Stream key of the series
+            value: Sampled value
+            now: Sample time in epoch seconds
+        """
+        pipe.xadd(
+            key,
+            {'value': value},
+            minid=int((now - METRIC_RETENTION_SECONDS) * 1000),
+            approximate=True
+        )
+    
+    def _trigger_alert(self, alert: Alert, pipe: Optional[Pipeline] = None) -> None:
         """
         Trigger an alert by calling all registered callbacks.
         
         Args:
             alert: Alert to trigger
+            pipe: Pipeline to queue the alert write on (sent immediately if None)
         """
         logger.warning(
             f"Alert triggered: {alert.metric_name} = {alert.current_value} "
@@ -113,11 +252,13 @@ class MonitoringService:
         )
         
         # Store alert in Redis
-        alert_key = f"alert:{alert.metric_name}:{int(alert.timestamp.timestamp())}"
-        self.redis.setex(
+        alert_time = alert.timestamp.timestamp()
+        alert_key = f"alert:{alert.metric_name}:{int(alert_time)}"
+        batch = self._batch(pipe)
+        batch.setex(
             alert_key,
-            3600,  # Keep for 1 hour
-            str({
+            ALERT_TTL_SECONDS,
+            orjson.dumps({
                 'metric': alert.metric_name,
                 'severity': alert.severity.value,
                 'message': alert.message,
@@ -126,6 +267,9 @@ class MonitoringService:
                 'timestamp': alert.timestamp.isoformat()
             })
         )
+        batch.zadd(ALERT_INDEX_KEY, {alert_key: alert_time})
+        batch.zremrangebyscore(ALERT_INDEX_KEY, 0, alert_time - ALERT_TTL_SECONDS)
+        self._flush(batch, pipe)
         
         # Call registered callbacks
         for callback in self.alert_callbacks:
@@ -137,7 +281,9 @@ class MonitoringService:
     def _check_threshold(
         self,
         metric_name: str,
-        current_value: float
+        current_value: float,
+        now: Optional[float] = None,
+        pipe: Optional[Pipeline] = None
     ) -> Optional[Alert]:
         """
         Check if a metric exceeds its threshold.
@@ -145,6 +291,8 @@ class MonitoringService:
         Args:
             metric_name: Name of the metric
             current_value: Current value of the metric
+            now: Sample time in epoch seconds (defaults to the current time)
+            pipe: Pipeline to queue breach resets on (sent immediately if None)
             
         Returns:
             Alert if threshold exceeded, None otherwise
@@ -160,26 +308,32 @@ class MonitoringService:
         elif threshold_config.comparison == 'lt':
             exceeded = current_value < threshold_config.threshold
         
+        breach_key = f"metric_breach:{metric_name}"
         if not exceeded:
-            # Clear any existing breach tracking
-            self.redis.delete(f"metric_breach:{metric_name}")
+            # Clear any breach clock, whichever process started it; on the
+            # caller's pipeline this costs no extra round trip
+            batch = self._batch(pipe)
+            batch.delete(breach_key)
+            self._flush(batch, pipe)
             return None
         
         # Track breach duration
-        breach_key = f"metric_breach:{metric_name}"
-        breach_start = self.redis.get(breach_key)
+        if now is None:
+            now = time.time()
+        
+        # Start the breach clock unless another sample or worker already
+        # has, and read back whichever start time won, in one round trip
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.set(breach_key, str(now), nx=True, ex=threshold_config.duration_seconds + 60)
+        pipe.get(breach_key)
+        started, breach_start = pipe.execute()
         
-        if not breach_start:
+        if started or not breach_start:
             # First time exceeding threshold
-            self.redis.setex(
-                breach_key,
-                threshold_config.duration_seconds + 60,
-                str(time.time())
-            )
             return None
         
         # Check if breach duration exceeded
-        breach_duration = time.time() - float(breach_start)
+        breach_duration = now - float(breach_start)
         if breach_duration >= threshold_config.duration_seconds:
             # Threshold exceeded for required duration
             alert = Alert(
@@ -189,119 +343,153 @@ class MonitoringService:
                         f"for {int(breach_duration)} seconds",
                 current_value=current_value,
                 threshold=threshold_config.threshold,
-                timestamp=datetime.utcnow()
+                timestamp=datetime.utcfromtimestamp(now)
             )
             
             # Reset breach tracking to avoid repeated alerts
-            self.redis.delete(breach_key)
+            batch = self._batch(pipe)
+            batch.delete(breach_key)
+            self._flush(batch, pipe)
             
             return alert
         
         return None
     
-    def collect_cpu_metrics(self) -> Dict[str, Any]:
+    def collect_cpu_metrics(
+        self,
+        pipe: Optional[Pipeline] = None,
+        now: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Collect CPU usage metrics.
         
+        Args:
+            pipe: Pipeline to queue Redis writes on (sent immediately if None)
+            now: Collection time in epoch seconds (defaults to the current time)
+        
         Returns:
             Dictionary with CPU metrics
         """
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_count = psutil.cpu_count()
-        cpu_per_core = psutil.cpu_percent(interval=1, percpu=True)
+        # Usage since the previous collection, without blocking; the
+        # overall figure is the mean across cores
+        cpu_per_core = psutil.cpu_percent(interval=None, percpu=True)
+        cpu_count = self._cpu_count
+        cpu_percent = sum(cpu_per_core) / len(cpu_per_core)
+        if now is None:
+            now = time.time()
         
         metrics = {
             'cpu_percent': cpu_percent,
             'cpu_count': cpu_count,
             'cpu_per_core': cpu_per_core,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcfromtimestamp(now).isoformat()
         }
         
+        batch = self._batch(pipe)
+        
         # Check threshold
-        alert = self._check_threshold('cpu_percent', cpu_percent)
+        alert = self._check_threshold('cpu_percent', cpu_percent, now, batch)
         if alert:
-            self._trigger_alert(alert)
+            self._trigger_alert(alert, batch)
         
         # Store in Redis for time series
-        self.redis.zadd(
-            'metrics:cpu_percent',
-            {str(cpu_percent): time.time()}
-        )
-        # Keep only last hour
-        self.redis.zremrangebyscore(
-            'metrics:cpu_percent',
-            0,
-            time.time() - 3600
-        )
+        self._store_sample(batch, 'metric_series:cpu_percent', cpu_percent, now)
+        self._flush(batch, pipe)
         
         return metrics
     
-    def collect_memory_metrics(self) -> Dict[str, Any]:
+    def collect_memory_metrics(
+        self,
+        pipe: Optional[Pipeline] = None,
+        now: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Collect memory usage metrics.
         
+        Args:
+            pipe: Pipeline to queue Redis writes on (sent immediately if None)
+            now: Collection time in epoch seconds (defaults to the current time)
+        
         Returns:
             Dictionary with memory metrics
         """
         memory = psutil.virtual_memory()
+        if now is None:
+            now = time.time()
         
         metrics = {
             'memory_percent': memory.percent,
             'memory_used_gb': memory.used / (1024 ** 3),
             'memory_total_gb': memory.total / (1024 ** 3),
             'memory_available_gb': memory.available / (1024 ** 3),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcfromtimestamp(now).isoformat()
         }
         
+        batch = self._batch(pipe)
+        
         # Check threshold
-        alert = self._check_threshold('memory_percent', memory.percent)
+        alert = self._check_threshold('memory_percent', memory.percent, now, batch)
         if alert:
-            self._trigger_alert(alert)
+            self._trigger_alert(alert, batch)
         
         # Store in Redis
-        self.redis.zadd(
-            'metrics:memory_percent',
-            {str(memory.percent): time.time()}
-        )
-        self.redis.zremrangebyscore(
-            'metrics:memory_percent',
-            0,
-            time.time() - 3600
-        )
+        self._store_sample(batch, 'metric_series:memory_percent', memory.percent, now)
+        self._flush(batch, pipe)
         
         return metrics
     
-    def collect_disk_metrics(self) -> Dict[str, Any]:
+    def collect_disk_metrics(
+        self,
+        pipe: Optional[Pipeline] = None,
+        now: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Collect disk usage metrics.
         
+        Args:
+            pipe: Pipeline to queue Redis writes on (sent immediately if None)
+            now: Collection time in epoch seconds (defaults to the current time)
+        
         Returns:
             Dictionary with disk metrics
         """
         disk = psutil.disk_usage('/')
+        if now is None:
+            now = time.time()
         
         metrics = {
             'disk_percent': disk.percent,
             'disk_used_gb': disk.used / (1024 ** 3),
             'disk_total_gb': disk.total / (1024 ** 3),
             'disk_free_gb': disk.free / (1024 ** 3),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcfromtimestamp(now).isoformat()
         }
         
         # Check threshold
-        alert = self._check_threshold('disk_percent', disk.percent)
+        alert = self._check_threshold('disk_percent', disk.percent, now, pipe)
         if alert:
-            self._trigger_alert(alert)
+            self._trigger_alert(alert, pipe)
         
         return metrics
     
-    def collect_database_metrics(self) -> Dict[str, Any]:
+    def collect_database_metrics(
+        self,
+        pipe: Optional[Pipeline] = None,
+        now: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Collect database connection pool metrics.
         
+        Args:
+            pipe: Pipeline to queue Redis writes on (sent immediately if None)
+            now: Collection time in epoch seconds (defaults to the current time)
+        
         Returns:
             Dictionary with database metrics
         """
+        if now is None:
+            now = time.time()
+        
         try:
             db_manager = get_db_manager()
             pool_status = db_manager.get_pool_status()
@@ -319,13 +507,13 @@ class MonitoringService:
                 'db_checked_out': checked_out,
                 'db_overflow': overflow,
                 'db_pool_utilization': utilization,
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.utcfromtimestamp(now).isoformat()
             }
             
             # Check threshold
-            alert = self._check_threshold('db_pool_utilization', utilization)
+            alert = self._check_threshold('db_pool_utilization', utilization, now, pipe)
             if alert:
-                self._trigger_alert(alert)
+                self._trigger_alert(alert, pipe)
             
             return metrics
             
@@ -333,16 +521,22 @@ class MonitoringService:
             logger.error(f"Error collecting database metrics: {e}")
             return {
                 'error': str(e),
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.utcfromtimestamp(now).isoformat()
             }
     
-    def collect_redis_metrics(self) -> Dict[str, Any]:
+    def collect_redis_metrics(self, now: Optional[float] = None) -> Dict[str, Any]:
         """
         Collect Redis metrics.
         
+        Args:
+            now: Collection time in epoch seconds (defaults to the current time)
+        
         Returns:
             Dictionary with Redis metrics
         """
+        if now is None:
+            now = time.time()
+        
         try:
             info = self.redis.info()
             
@@ -351,7 +545,7 @@ class MonitoringService:
                 'redis_connected_clients': info.get('connected_clients', 0),
                 'redis_total_commands': info.get('total_commands_processed', 0),
                 'redis_ops_per_sec': info.get('instantaneous_ops_per_sec', 0),
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.utcfromtimestamp(now).isoformat()
             }
             
             return metrics
@@ -360,7 +554,7 @@ class MonitoringService:
             logger.error(f"Error collecting Redis metrics: {e}")
             return {
                 'error': str(e),
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.utcfromtimestamp(now).isoformat()
             }
     
     def track_error_rate(self, service_name: str, is_error: bool) -> None:
@@ -371,28 +565,35 @@ class MonitoringService:
             service_name: Name of the service
             is_error: Whether this request was an error
         """
-        key = f"errors:{service_name}"
-        timestamp = time.time()
-        
-        # Add to sorted set with timestamp
-        self.redis.zadd(key, {f"{int(is_error)}:{timestamp}": timestamp})
-        
-        # Remove old entries (older than 5 minutes)
-        self.redis.zremrangebyscore(key, 0, timestamp - 300)
+        # The hash tag keeps a service's counters in one cluster slot so
+        # they can be read with a single MGET
+        prefix = f"errors:{{{service_name}}}"
+        now = time.time()
+        bucket = int(now // ERROR_RATE_BUCKET_SECONDS)
+        buckets = range(bucket - ERROR_RATE_BUCKETS + 1, bucket + 1)
+        ttl = ERROR_RATE_WINDOW_SECONDS + ERROR_RATE_BUCKET_SECONDS
+        
+        # Count this request and read the window back in one round trip
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.incr(f"{prefix}:req:{bucket}")
+        pipe.expire(f"{prefix}:req:{bucket}", ttl)
+        if is_error:
+            pipe.incr(f"{prefix}:err:{bucket}")
+            pipe.expire(f"{prefix}:err:{bucket}", ttl)
+        pipe.mget([f"{prefix}:req:{b}" for b in buckets])
+        pipe.mget([f"{prefix}:err:{b}" for b in buckets])
+        request_counts, error_counts = pipe.execute()[-2:]
         
         # Calculate error rate
-        all_requests = self.redis.zcard(key)
+        all_requests = sum(int(count) for count in request_counts if count)
         if all_requests > 0:
-            errors = len([
-                x for x in self.redis.zrange(key, 0, -1)
-                if x.decode().startswith('1:')
-            ])
+            errors = sum(int(count) for count in error_counts if count)
             error_rate = (errors / all_requests) * 100
             
             # Check threshold
-            alert = self._check_threshold('error_rate', error_rate)
+            alert = self._check_threshold('error_rate', error_rate, now)
             if alert:
-                alert.message = f"{service_name} error rate is {error_rate:.2f}%"
+                alert = replace(alert, message=f"{service_name} error rate is {error_rate:.2f}%")
                 self._trigger_alert(alert)
     
     def track_custom_metric(
@@ -409,15 +610,28 @@ class MonitoringService:
             value: Metric value
             tags: Optional tags for the metric
         """
-        key = f"custom_metric:{metric_name}"
+        key = f"custom_metric_series:{metric_name}"
         if tags:
             tag_str = ':'.join(f"{k}={v}" for k, v in tags.items())
             key = f"{key}:{tag_str}"
         
-        self.redis.zadd(key, {str(value): time.time()})
+        pipe = self.redis.pipeline(transaction=False)
+        self._store_sample(pipe, key, value, time.time())
+        pipe.execute()
+    
+    def track_custom_metrics(self, metrics: Dict[str, float], prefix: str = '') -> None:
+        """
+        Track several custom metrics sampled at the same time.
         
-        # Keep only last hour
-        self.redis.zremrangebyscore(key, 0, time.time() - 3600)
+        Args:
+            metrics: Metric name to value
+            prefix: Prepended to every metric name
+        """
+        now = time.time()
+        pipe = self.redis.pipeline(transaction=False)
+        for metric_name, value in metrics.items():
+            self._store_sample(pipe, f"custom_metric_series:{prefix}{metric_name}", value, now)
+        pipe.execute()
     
     def get_metric_history(
         self,
@@ -434,17 +648,18 @@ class MonitoringService:
         Returns:
             List of metric values with timestamps
         """
-        key = f"metrics:{metric_name}"
-        cutoff = time.time() - duration_seconds
+        key = f"metric_series:{metric_name}"
+        cutoff_ms = int((time.time() - duration_seconds) * 1000)
         
-        values = self.redis.zrangebyscore(key, cutoff, '+inf', withscores=True)
+        entries = self.redis.xrange(key, min=cutoff_ms, max='+')
         
+        # Entry IDs are "<milliseconds>-<sequence>"
         return [
             {
-                'value': float(value.decode()),
-                'timestamp': datetime.fromtimestamp(score).isoformat()
+                'value': float(fields['value']),
+                'timestamp': datetime.fromtimestamp(int(entry_id.split('-', 1)[0]) / 1000).isoformat()
             }
-            for value, score in values
+            for entry_id, fields in entries
         ]
     
     def get_recent_alerts(self, limit: int = 50) -> List[Dict[str, Any]]:
@@ -457,36 +672,45 @@ class MonitoringService:
         Returns:
             List of recent alerts
         """
-        # Scan for alert keys
+        # Most recent first; the index is trimmed on write, but entries can
+        # outlive their payload by up to one alert interval
+        keys = self.redis.zrevrangebyscore(ALERT_INDEX_KEY, '+inf', '-inf', start=0, num=limit)
+        if not keys:
+            return []
+        
         alerts = []
-        for key in self.redis.scan_iter("alert:*"):
-            alert_data = self.redis.get(key)
+        for alert_data in self.redis.mget(keys):
             if alert_data:
                 try:
-                    alerts.append(eval(alert_data.decode()))
-                except Exception as e:
+                    alerts.append(orjson.loads(alert_data))
+                except orjson.JSONDecodeError as e:
                     logger.error(f"Error parsing alert data: {e}")
         
-        # Sort by timestamp (most recent first)
-        alerts.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        
-        return alerts[:limit]
+        return alerts
     
-    def collect_all_metrics(self) -> Dict[str, Any]:
+    def refresh_metrics(self) -> Dict[str, Any]:
         """
-        Collect all system metrics.
+        Collect all system metrics, recording samples and firing alerts.
+        
+        Time-series and alert writes from every collector are queued on one
+        pipeline and sent in a single round trip, and every sample in the
+        cycle shares one timestamp.
         
         Returns:
             Dictionary with all metrics
         """
-        return {
-            'cpu': self.collect_cpu_metrics(),
-            'memory': self.collect_memory_metrics(),
-            'disk': self.collect_disk_metrics(),
-            'database': self.collect_database_metrics(),
-            'redis': self.collect_redis_metrics(),
-            'timestamp': datetime.utcnow().isoformat()
+        now = time.time()
+        pipe = self.redis.pipeline(transaction=False)
+        metrics = {
+            'cpu': self.collect_cpu_metrics(pipe, now),
+            'memory': self.collect_memory_metrics(pipe, now),
+            'disk': self.collect_disk_metrics(pipe, now),
+            'database': self.collect_database_metrics(pipe, now),
+            'redis': self.collect_redis_metrics(now),
+            'timestamp': datetime.utcfromtimestamp(now).isoformat()
         }
+        pipe.execute()
+        return metrics
 
 
 # Global monitoring service instance
@@ -494,7 +718,12 @@ _monitoring_service = None
 
 
 def get_monitoring_service() -> MonitoringService:
-    """Get or create the global monitoring service instance."""
+    """
+    Get or create the global monitoring service instance.
+    
+    Creating the instance starts nothing; the monitoring process drives
+    collection explicitly (see shared.services.monitoring_task).
+    """
     global _monitoring_service
     if _monitoring_service is None:
         _monitoring_service = MonitoringService()
@@ -2,17 +2,49 @@
 Background task for continuous system monitoring.
 Collects metrics at regular intervals and triggers alerts.
 """
+import asyncio
 import logging
+import signal
 import time
-import threading
-from typing import Optional
+from concurrent.futures import wait
+from contextlib import suppress
+from typing import List, Optional
 
-from shared.services.monitoring_service import get_monitoring_service, Alert
-from shared.services.notification_service import NotificationService
-from shared.database.connection import get_db_session
+from sqlalchemy.orm import Session
+
+from shared.models.notification import (
+    NotificationChannel, NotificationData, NotificationRequest,
+    NotificationSeverity, NotificationType
+)
+from shared.services.monitoring_service import (
+    Alert, MonitoringThreadPoolExecutor, get_monitoring_service
+)
+from shared.services.notification_service import UserContact, get_notification_service
+from shared.database.connection import get_db_session, init_database
+from shared.redis.connection import init_redis
+from shared.utils.logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
 
+# Workers delivering alert notifications to admins in parallel
+ALERT_SEND_WORKERS = 8
+
+# How long an alert waits for its admin notifications before moving on
+ALERT_SEND_TIMEOUT_SECONDS = 30
+
+# Admin user IDs are re-read at most this often
+ADMIN_IDS_TTL_SECONDS = 60
+
+# Longest the batch loop sleeps, so batches opened meanwhile are noticed
+BATCH_IDLE_SECONDS = 30
+
+# Interval between send pool statistics samples
+SEND_POOL_METRICS_SECONDS = 10
+
+# Channels for admin alerts; critical alerts are also emailed
+_ALERT_CHANNELS = (NotificationChannel.IN_APP,)
+_CRITICAL_ALERT_CHANNELS = (NotificationChannel.IN_APP, NotificationChannel.EMAIL)
+
 
 class MonitoringTask:
     """Background task for continuous monitoring."""
@@ -26,8 +58,16 @@ class MonitoringTask:
         """
         self.interval_seconds = interval_seconds
         self.running = False
-        self.thread: Optional[threading.Thread] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._pool_metrics_task: Optional[asyncio.Task] = None
         self.monitoring_service = get_monitoring_service()
+        self._send_executor = MonitoringThreadPoolExecutor(
+            max_workers=ALERT_SEND_WORKERS,
+            thread_name_prefix="notif-send"
+        )
+        self._admin_ids: List[str] = []
+        self._admin_ids_expire_at = 0.0
         
         # Register alert callback
         self.monitoring_service.register_alert_callback(self._handle_alert)
@@ -40,43 +80,112 @@ class MonitoringTask:
             alert: Alert that was triggered
         """
         try:
-            # Get database session
-            db = get_db_session()
+            severity = NotificationSeverity(alert.severity.value)
+            channels = _CRITICAL_ALERT_CHANNELS if severity == NotificationSeverity.CRITICAL else _ALERT_CHANNELS
             
-            # Get notification service
-            notification_service = NotificationService(db)
-            
-            # Get all admin users
-            from shared.models import User, UserRole
-            admins = db.query(User).filter(User.role == UserRole.ADMIN).all()
-            
-            # Send notification to each admin
-            for admin in admins:
-                try:
-                    notification_service.send_notification(
-                        user_id=str(admin.id),
-                        notification_type='system_alert',
+            # Store one notification per admin user in a single insert
+            with get_db_session() as db:
+                requests = [
+                    NotificationRequest(
+                        user_id=admin_id,
+                        type=NotificationType.SYSTEM_ALERT,
                         title=f"System Alert: {alert.metric_name}",
                         message=alert.message,
-                        severity=alert.severity.value,
-                        channels=['in_app', 'email'] if alert.severity.value == 'critical' else ['in_app']
+                        severity=severity,
+                        channels=channels
                     )
-                except Exception as e:
-                    logger.error(f"Error sending alert notification to admin {admin.id}: {e}")
+                    for admin_id in self._get_admin_ids(db)
+                ]
+                notifications = get_notification_service().bulk_create_notifications(
+                    db, requests, deliver=False
+                )
+            
+            # Deliver to each admin in parallel
+            futures = [
+                self._send_executor.submit(self._notify_admin, request, notification_data)
+                for request, notification_data in zip(requests, notifications)
+            ]
             
-            db.close()
+            _, pending = wait(futures, timeout=ALERT_SEND_TIMEOUT_SECONDS)
+            if pending:
+                logger.warning(
+                    f"{len(pending)} of {len(futures)} admin notifications for "
+                    f"{alert.metric_name} still pending after {ALERT_SEND_TIMEOUT_SECONDS}s"
+                )
             
         except Exception as e:
             logger.error(f"Error handling alert: {e}", exc_info=True)
     
-    def _monitoring_loop(self) -> None:
-        """Main monitoring loop that runs in background thread."""
+    def _get_admin_ids(self, db: Session) -> List[str]:
+        """
+        Get IDs of all admin users, cached for ADMIN_IDS_TTL_SECONDS.
+        
+        Admin contact details are read in the same query and handed to
+        the notification service's contact cache.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Admin user IDs
+        """
+        now = time.monotonic()
+        if now >= self._admin_ids_expire_at:
+            from shared.models import User, UserRole
+            contacts = {
+                str(row.id): UserContact(email=row.email, phone_number=None)
+                for row in db.query(User.id, User.email).filter(User.role == UserRole.ADMIN)
+            }
+            # Deliveries then find every admin's address without a query
+            get_notification_service().cache_user_contacts(contacts)
+            self._admin_ids = list(contacts)
+            self._admin_ids_expire_at = now + ADMIN_IDS_TTL_SECONDS
+        return self._admin_ids
+    
+    def _notify_admin(self, request: NotificationRequest, notification_data: NotificationData) -> None:
+        """
+        Deliver one stored admin notification on a worker thread.
+        
+        Args:
+            request: Notification request for the admin
+            notification_data: Stored notification for the admin
+        """
+        try:
+            with get_db_session() as db:
+                get_notification_service().deliver_notification(db, request, notification_data)
+        except Exception as e:
+            logger.error(f"Error sending alert notification to admin {request.user_id}: {e}")
+    
+    async def _pool_metrics_loop(self) -> None:
+        """Publish send pool statistics every SEND_POOL_METRICS_SECONDS."""
+        loop = asyncio.get_running_loop()
+        
+        while self.running:
+            await asyncio.sleep(SEND_POOL_METRICS_SECONDS)
+            try:
+                await loop.run_in_executor(
+                    None,
+                    self.monitoring_service.track_custom_metrics,
+                    self._send_executor.stats_snapshot(),
+                    'notif_send_pool.'
+                )
+            except Exception as e:
+                logger.error(f"Error publishing send pool metrics: {e}")
+    
+    async def _monitoring_loop(self) -> None:
+        """Main monitoring loop that runs as a task on the event loop."""
         logger.info("Monitoring task started")
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic()
         
         while self.running:
             try:
-                # Collect all metrics
-                metrics = self.monitoring_service.collect_all_metrics()
+                # Collect, record samples and fire threshold alerts. psutil
+                # and Redis calls block, so they run on the default executor
+                # instead of the event loop
+                metrics = await loop.run_in_executor(
+                    None, self.monitoring_service.refresh_metrics
+                )
                 
                 logger.debug(f"Collected metrics: CPU={metrics['cpu']['cpu_percent']}%, "
                            f"Memory={metrics['memory']['memory_percent']}%")
@@ -84,31 +193,69 @@ class MonitoringTask:
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}", exc_info=True)
             
-            # Sleep until next interval
-            time.sleep(self.interval_seconds)
+            # Sleep until next interval, less the time collection took
+            deadline = max(deadline + self.interval_seconds, time.monotonic())
+            await asyncio.sleep(deadline - time.monotonic())
         
         logger.info("Monitoring task stopped")
     
+    async def _batch_loop(self) -> None:
+        """Deliver batched notifications as their deadlines come due."""
+        loop = asyncio.get_running_loop()
+        notification_service = get_notification_service()
+        
+        while self.running:
+            deadline = notification_service.next_batch_deadline()
+            now = time.monotonic()
+            if deadline is None or deadline > now:
+                delay = BATCH_IDLE_SECONDS if deadline is None else deadline - now
+                await asyncio.sleep(min(delay, BATCH_IDLE_SECONDS))
+                continue
+            
+            try:
+                await loop.run_in_executor(None, self._process_batches)
+            except Exception as e:
+                logger.error(f"Error processing notification batches: {e}", exc_info=True)
+    
+    @staticmethod
+    def _process_batches() -> None:
+        """Deliver due notification batches with a fresh session."""
+        with get_db_session() as db:
+            get_notification_service().process_batches(db)
+    
     def start(self) -> None:
-        """Start the monitoring task in a background thread."""
+        """
+        Start the monitoring task on the running event loop.
+        
+        Must be called from a coroutine or callback on that loop.
+        """
         if self.running:
             logger.warning("Monitoring task is already running")
             return
         
         self.running = True
-        self.thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        self.thread.start()
+        self._task = asyncio.create_task(self._monitoring_loop(), name="velox:monitoring")
+        self._batch_task = asyncio.create_task(self._batch_loop(), name="velox:notification-batches")
+        self._pool_metrics_task = asyncio.create_task(
+            self._pool_metrics_loop(), name="velox:notif-send-pool-metrics"
+        )
         logger.info(f"Monitoring task started with {self.interval_seconds}s interval")
     
-    def stop(self) -> None:
-        """Stop the monitoring task."""
+    async def stop(self) -> None:
+        """Stop the monitoring task and wait for it to finish."""
         if not self.running:
             logger.warning("Monitoring task is not running")
             return
         
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=5)
+        for task in (self._task, self._batch_task, self._pool_metrics_task):
+            if task:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+        self._task = None
+        self._batch_task = None
+        self._pool_metrics_task = None
         logger.info("Monitoring task stopped")
 
 
@@ -133,12 +280,48 @@ def get_monitoring_task(interval_seconds: int = 60) -> MonitoringTask:
 
 
 def start_monitoring() -> None:
-    """Start the global monitoring task."""
+    """Start the global monitoring task on the running event loop."""
     task = get_monitoring_task()
     task.start()
 
 
-def stop_monitoring() -> None:
+async def stop_monitoring() -> None:
     """Stop the global monitoring task."""
     task = get_monitoring_task()
-    task.stop()
+    await task.stop()
+
+
+async def run_monitoring(interval_seconds: int = 60) -> None:
+    """
+    Run the global monitoring task until cancelled or sent SIGTERM.
+    
+    Meant as a process's main coroutine, e.g.
+    ``asyncio.run(run_monitoring())``; the web services run no event loop,
+    so monitoring runs as its own process (see main()).
+    
+    Args:
+        interval_seconds: Interval between metric collections
+    """
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    
+    task = get_monitoring_task(interval_seconds)
+    task.start()
+    try:
+        await asyncio.Event().wait()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await task.stop()
+
+
+def main() -> None:
+    """Entry point of the monitoring process."""
+    setup_logging("monitoring")
+    init_database()
+    init_redis()
+    asyncio.run(run_monitoring())
+
+
+if __name__ == "__main__":
+    main()
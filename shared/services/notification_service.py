@@ -2,43 +2,205 @@
 Notification Service - Handles notification creation and delivery.
 Implements multi-channel notification delivery (in-app, email, SMS).
 """
+import heapq
+import itertools
 import logging
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
-from collections import defaultdict
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, FrozenSet, Iterator, List, Mapping, NamedTuple, Optional, Dict, Any, Tuple
+from datetime import datetime
 import uuid
 
+import jinja2
+from sqlalchemy import func, literal, select
 from sqlalchemy.orm import Session
 
-try:
-    from twilio.rest import Client as TwilioClient
-    TWILIO_AVAILABLE = True
-except ImportError:
-    TwilioClient = None
-    TWILIO_AVAILABLE = False
+# smtplib, email.mime and twilio are imported where email or SMS is sent,
+# so processes that only deliver in-app notifications never load them
+if TYPE_CHECKING:
+    import smtplib
 
 from shared.models.notification import (
     Notification, NotificationData, NotificationRequest,
     NotificationType, NotificationSeverity, NotificationChannel,
-    NotificationPreferences, NotificationChannelConfig
+    NotificationPreferences, NotificationChannelConfig, bulk_insert_notifications
 )
 from shared.database.connection import get_db_session
 from shared.config import get_settings
+from shared.utils.ids import uuid7
 
 logger = logging.getLogger(__name__)
 
+# Authenticated SMTP connections kept open for reuse
+SMTP_POOL_SIZE = 4
+
+# Idle connections older than this are closed instead of reused, since
+# servers typically drop idle sessions after about five minutes
+SMTP_IDLE_TIMEOUT_SECONDS = 300
+
+# Delivery contact details are cached per user for this long
+USER_CONTACT_CACHE_TTL_SECONDS = 300
+USER_CONTACT_CACHE_SIZE = 10_000
+
+# Unread badges stop counting here; the UI shows "99+" beyond 99
+UNREAD_BADGE_CAP = 100
+
+
+_SEVERITY_COLORS = {
+    NotificationSeverity.INFO: '#2196F3',
+    NotificationSeverity.WARNING: '#FF9800',
+    NotificationSeverity.ERROR: '#F44336',
+    NotificationSeverity.CRITICAL: '#D32F2F'
+}
+_DEFAULT_COLOR = _SEVERITY_COLORS[NotificationSeverity.INFO]
+
+# Email bodies are compiled once; autoescape keeps titles and messages
+# from injecting markup
+_templates = jinja2.Environment(autoescape=True)
+
+_EMAIL_TEMPLATE = _templates.from_string("""
+        <html>
+        <body style="font-family: Arial, sans-serif; padding: 20px;">
+            <div style="border-left: 4px solid {{ color }}; padding-left: 15px;">
+                <h2 style="color: {{ color }}; margin: 0;">{{ title }}</h2>
+                <p style="color: #666; margin: 5px 0;">{{ created_at.strftime('%Y-%m-%d %H:%M:%S') }}</p>
+                <p style="margin: 15px 0;">{{ message }}</p>
+            </div>
+            <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
+            <p style="color: #999; font-size: 12px;">
+                This is an automated notification from your Trading Platform.
+            </p>
+        </body>
+        </html>
+        """)
+
+_BATCHED_EMAIL_TEMPLATE = _templates.from_string("""
+        <html>
+        <body style="font-family: Arial, sans-serif; padding: 20px;">
+            <h1>Trading Platform Notifications</h1>
+            <p>You have {{ notifications | length }} new notifications:</p>
+            {% for notification in notifications %}
+            {% set color = colors.get(notification.severity, default_color) %}
+            <div style="border-left: 4px solid {{ color }}; padding-left: 15px; margin-bottom: 20px;">
+                <h3 style="color: {{ color }}; margin: 0;">{{ notification.title }}</h3>
+                <p style="color: #666; margin: 5px 0;">{{ notification.created_at.strftime('%Y-%m-%d %H:%M:%S') }}</p>
+                <p style="margin: 10px 0;">{{ notification.message }}</p>
+            </div>
+            {% endfor %}
+            <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
+            <p style="color: #999; font-size: 12px;">
+                This is an automated notification from your Trading Platform.
+            </p>
+        </body>
+        </html>
+        """)
+
+
+# Batched notifications are grouped by recipient and channel set
+BatchKey = Tuple[str, FrozenSet[NotificationChannel]]
+BatchItem = Tuple[NotificationData, Optional[Dict[str, Any]]]
+
+
+# Channels per notification type until per-user preferences are stored;
+# built once and shared read-only by every NotificationPreferences
+_DEFAULT_PREFERENCES: Mapping[str, NotificationChannelConfig] = MappingProxyType({
+    NotificationType.ORDER_EXECUTED.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
+    ),
+    NotificationType.STRATEGY_ERROR.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL, NotificationChannel.SMS]
+    ),
+    NotificationType.THRESHOLD_ALERT.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP, NotificationChannel.SMS]
+    ),
+    NotificationType.CONNECTION_LOST.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
+    ),
+    NotificationType.SYSTEM_ALERT.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP]
+    ),
+    NotificationType.TRAILING_STOP_TRIGGERED.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP, NotificationChannel.SMS]
+    ),
+    NotificationType.INVESTOR_INVITATION.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
+    ),
+    NotificationType.ACCOUNT_ACCESS_GRANTED.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
+    ),
+    NotificationType.SESSION_TIMEOUT_WARNING.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP]
+    ),
+    NotificationType.ACCOUNT_LOCKED.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
+    ),
+    NotificationType.LOSS_LIMIT_BREACHED.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL, NotificationChannel.SMS]
+    ),
+    NotificationType.STRATEGY_PAUSED.value: NotificationChannelConfig(
+        enabled=True,
+        channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
+    ),
+})
+
+
+@lru_cache(maxsize=1024)
+def _render_email_html(
+    title: str,
+    message: str,
+    severity: NotificationSeverity,
+    created_at: datetime
+) -> str:
+    """
+    Render the single-notification email body.
+    
+    Cached on its inputs: notifications fanned out with
+    bulk_create_notifications share a created_at, so every recipient
+    after the first reuses the rendered body.
+    """
+    return _EMAIL_TEMPLATE.render(
+        title=title,
+        message=message,
+        created_at=created_at,
+        color=_SEVERITY_COLORS.get(severity, _DEFAULT_COLOR)
+    )
+
+
+class UserContact(NamedTuple):
+    """Delivery addresses of a user."""
+    email: str
+    phone_number: Optional[str]
+
 
 class NotificationService:
     """Service for creating and delivering notifications."""
     
     def __init__(self):
         self.settings = get_settings()
-        self._notification_batch = defaultdict(list)
-        self._last_batch_time = defaultdict(lambda: datetime.utcnow())
-        self._batch_interval = timedelta(minutes=5)  # Batch notifications every 5 minutes
+        self._notification_batch: Dict[BatchKey, List[BatchItem]] = {}
+        # (due_at, seq, batch key) per open batch, earliest first; due_at is
+        # on the time.monotonic() clock and seq breaks ties between keys
+        self._batch_heap: List[Tuple[float, int, BatchKey]] = []
+        self._batch_seq = itertools.count()
+        # Guards the batch dict and heap; held for a lookup and an append or
+        # a pop, never while delivering, so adds don't wait on SMTP
+        self._batch_lock = threading.Lock()
+        self._batch_interval = 300.0  # Batch notifications every 5 minutes (seconds)
         
         # Initialize email client
         self._smtp_host = getattr(self.settings, 'smtp_host', 'smtp.gmail.com')
@@ -46,23 +208,30 @@ class NotificationService:
         self._smtp_user = getattr(self.settings, 'smtp_user', None)
         self._smtp_password = getattr(self.settings, 'smtp_password', None)
         self._from_email = getattr(self.settings, 'from_email', 'noreply@trading-platform.com')
+        self._smtp_pool: "queue.Queue[Tuple[smtplib.SMTP, float]]" = queue.Queue(maxsize=SMTP_POOL_SIZE)
+        # user_id -> (expires_at, contact)
+        self._user_contact_cache: Dict[str, Tuple[float, UserContact]] = {}
+        # Guards the contact cache; never held across the database lookup
+        self._contact_lock = threading.Lock()
         
         # Initialize Twilio client for SMS
         self._twilio_account_sid = getattr(self.settings, 'twilio_account_sid', None)
         self._twilio_auth_token = getattr(self.settings, 'twilio_auth_token', None)
         self._twilio_from_number = getattr(self.settings, 'twilio_from_number', None)
         
-        if TWILIO_AVAILABLE and self._twilio_account_sid and self._twilio_auth_token:
-            self._twilio_client = TwilioClient(
-                self._twilio_account_sid,
-                self._twilio_auth_token
-            )
+        self._twilio_client = None
+        if not self._twilio_account_sid or not self._twilio_auth_token:
+            logger.warning("Twilio credentials not configured. SMS notifications will be disabled.")
         else:
-            self._twilio_client = None
-            if not TWILIO_AVAILABLE:
+            try:
+                from twilio.rest import Client as TwilioClient
+            except ImportError:
                 logger.warning("Twilio library not installed. SMS notifications will be disabled.")
             else:
-                logger.warning("Twilio credentials not configured. SMS notifications will be disabled.")
+                self._twilio_client = TwilioClient(
+                    self._twilio_account_sid,
+                    self._twilio_auth_token
+                )
     
     def create_notification(
         self,
@@ -81,7 +250,7 @@ class NotificationService:
         """
         # Create notification in database
         notification = Notification(
-            id=uuid.uuid4(),
+            id=uuid7(),
             user_id=uuid.UUID(request.user_id),
             type=request.type,
             title=request.title,
@@ -96,6 +265,83 @@ class NotificationService:
         
         notification_data = NotificationData.from_orm(notification)
         
+        self.deliver_notification(db, request, notification_data)
+        
+        logger.info(
+            f"Created notification {notification.id} for user {request.user_id}: "
+            f"{request.type.value} - {request.severity.value}"
+        )
+        
+        return notification_data
+    
+    def bulk_create_notifications(
+        self,
+        db: Session,
+        requests: List[NotificationRequest],
+        deliver: bool = True
+    ) -> List[NotificationData]:
+        """
+        Create many notifications with one insert and one commit.
+        
+        Args:
+            db: Database session
+            requests: Notification requests, e.g. one per recipient
+            deliver: If False, only store them; the caller delivers each
+                with deliver_notification
+            
+        Returns:
+            Created notification data, in request order
+        """
+        created_at = datetime.utcnow()
+        ids = bulk_insert_notifications(db, [
+            {
+                'user_id': uuid.UUID(request.user_id),
+                'type': request.type,
+                'title': request.title,
+                'message': request.message,
+                'severity': request.severity,
+                'created_at': created_at
+            }
+            for request in requests
+        ])
+        db.commit()
+        
+        notifications = [
+            NotificationData(
+                id=str(notification_id),
+                user_id=request.user_id,
+                type=request.type,
+                title=request.title,
+                message=request.message,
+                severity=request.severity,
+                read_at=None,
+                created_at=created_at
+            )
+            for notification_id, request in zip(ids, requests)
+        ]
+        
+        if deliver:
+            for request, notification_data in zip(requests, notifications):
+                self.deliver_notification(db, request, notification_data)
+        
+        logger.info(f"Created {len(notifications)} notifications in bulk")
+        
+        return notifications
+    
+    def deliver_notification(
+        self,
+        db: Session,
+        request: NotificationRequest,
+        notification_data: NotificationData
+    ):
+        """
+        Deliver a stored notification through its channels.
+        
+        Args:
+            db: Database session
+            request: Request the notification was created from
+            notification_data: Stored notification data
+        """
         # Determine delivery channels
         channels = request.channels
         if not channels:
@@ -111,13 +357,6 @@ class NotificationService:
             channels=channels,
             metadata=request.metadata
         )
-        
-        logger.info(
-            f"Created notification {notification.id} for user {request.user_id}: "
-            f"{request.type.value} - {request.severity.value}"
-        )
-        
-        return notification_data
     
     def _deliver_notification(
         self,
@@ -184,42 +423,56 @@ class NotificationService:
             channels: Delivery channels
             metadata: Additional metadata
         """
-        batch_key = f"{user_id}:{','.join(c.value for c in channels)}"
-        self._notification_batch[batch_key].append({
-            'notification': notification_data,
-            'metadata': metadata
-        })
+        batch_key = (user_id, frozenset(channels))
+        with self._batch_lock:
+            batch = self._notification_batch.get(batch_key)
+            if batch is None:
+                batch = self._notification_batch[batch_key] = []
+                due_at = time.monotonic() + self._batch_interval
+                heapq.heappush(self._batch_heap, (due_at, next(self._batch_seq), batch_key))
+            batch.append((notification_data, metadata))
         
         logger.debug(f"Added notification to batch for user {user_id}")
     
     def process_batches(self, db: Session):
         """
-        Process batched notifications and deliver them.
-        Should be called periodically (e.g., every 5 minutes).
+        Deliver the batched notifications that are due.
+        
+        Only due batches are touched; call again at next_batch_deadline().
         
         Args:
             db: Database session
         """
-        current_time = datetime.utcnow()
-        
-        for batch_key, notifications in list(self._notification_batch.items()):
-            if current_time - self._last_batch_time[batch_key] >= self._batch_interval:
-                # Parse batch key
-                user_id, channels_str = batch_key.split(':', 1)
-                channels = [NotificationChannel(c) for c in channels_str.split(',')]
-                
-                # Deliver batched notifications
-                if NotificationChannel.EMAIL in channels:
-                    self._deliver_batched_email(db, user_id, notifications)
-                
-                if NotificationChannel.SMS in channels:
-                    self._deliver_batched_sms(db, user_id, notifications)
-                
-                # Clear batch
-                del self._notification_batch[batch_key]
-                self._last_batch_time[batch_key] = current_time
-                
-                logger.info(f"Processed batch of {len(notifications)} notifications for user {user_id}")
+        now = time.monotonic()
+        
+        while True:
+            # Close the batch under the lock; later adds open a new one, so
+            # the closed list can be delivered without holding the lock
+            with self._batch_lock:
+                if not self._batch_heap or self._batch_heap[0][0] > now:
+                    break
+                _, _, batch_key = heapq.heappop(self._batch_heap)
+                notifications = self._notification_batch.pop(batch_key)
+            user_id, channels = batch_key
+            
+            # Deliver batched notifications
+            if NotificationChannel.EMAIL in channels:
+                self._deliver_batched_email(db, user_id, notifications)
+            
+            if NotificationChannel.SMS in channels:
+                self._deliver_batched_sms(db, user_id, notifications)
+            
+            logger.info(f"Processed batch of {len(notifications)} notifications for user {user_id}")
+    
+    def next_batch_deadline(self) -> Optional[float]:
+        """
+        Get when the earliest open batch is due.
+        
+        Returns:
+            time.monotonic() deadline, or None if no batch is open
+        """
+        with self._batch_lock:
+            return self._batch_heap[0][0] if self._batch_heap else None
     
     def _deliver_in_app(self, user_id: str, notification_data: NotificationData):
         """
@@ -261,29 +514,23 @@ class NotificationService:
         
         try:
             # Get user email
-            from shared.models import User
-            user = db.query(User).filter(User.id == user_id).first()
-            if not user:
+            contact = self._get_user_contact(db, user_id)
+            if not contact:
                 logger.error(f"User {user_id} not found for email notification")
                 return
             
             # Create email message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = f"[{notification_data.severity.value.upper()}] {notification_data.title}"
-            msg['From'] = self._from_email
-            msg['To'] = user.email
-            
-            # Create HTML body
-            html_body = self._create_email_html(notification_data, metadata)
-            msg.attach(MIMEText(html_body, 'html'))
+            message = self._build_message_bytes(
+                subject=f"[{notification_data.severity.value.upper()}] {notification_data.title}",
+                to=contact.email,
+                html_body=self._create_email_html(notification_data, metadata)
+            )
             
             # Send email
-            with smtplib.SMTP(self._smtp_host, self._smtp_port) as server:
-                server.starttls()
-                server.login(self._smtp_user, self._smtp_password)
-                server.send_message(msg)
+            with self._smtp_conn() as server:
+                server.sendmail(self._from_email, [contact.email], message)
             
-            logger.info(f"Delivered email notification to {user.email}")
+            logger.info(f"Delivered email notification to {contact.email}")
             
         except Exception as e:
             logger.error(f"Failed to deliver email notification: {e}")
@@ -292,7 +539,7 @@ class NotificationService:
         self,
         db: Session,
         user_id: str,
-        notifications: List[Dict[str, Any]]
+        notifications: List[BatchItem]
     ):
         """
         Deliver batched email notifications.
@@ -300,7 +547,7 @@ class NotificationService:
         Args:
             db: Database session
             user_id: User ID
-            notifications: List of notification dictionaries
+            notifications: Batched (notification, metadata) pairs
         """
         if not self._smtp_user or not self._smtp_password:
             logger.warning("SMTP credentials not configured. Batched email skipped.")
@@ -308,33 +555,175 @@ class NotificationService:
         
         try:
             # Get user email
-            from shared.models import User
-            user = db.query(User).filter(User.id == user_id).first()
-            if not user:
+            contact = self._get_user_contact(db, user_id)
+            if not contact:
                 logger.error(f"User {user_id} not found for batched email")
                 return
             
-            # Create email message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = f"Trading Platform - {len(notifications)} New Notifications"
-            msg['From'] = self._from_email
-            msg['To'] = user.email
-            
-            # Create HTML body with all notifications
-            html_body = self._create_batched_email_html(notifications)
-            msg.attach(MIMEText(html_body, 'html'))
+            # Create email message with all notifications
+            message = self._build_message_bytes(
+                subject=f"Trading Platform - {len(notifications)} New Notifications",
+                to=contact.email,
+                html_body=self._create_batched_email_html(notifications)
+            )
             
             # Send email
-            with smtplib.SMTP(self._smtp_host, self._smtp_port) as server:
-                server.starttls()
-                server.login(self._smtp_user, self._smtp_password)
-                server.send_message(msg)
+            with self._smtp_conn() as server:
+                server.sendmail(self._from_email, [contact.email], message)
             
-            logger.info(f"Delivered batched email with {len(notifications)} notifications to {user.email}")
+            logger.info(f"Delivered batched email with {len(notifications)} notifications to {contact.email}")
             
         except Exception as e:
             logger.error(f"Failed to deliver batched email: {e}")
     
+    def _get_user_contact(self, db: Session, user_id: str) -> Optional[UserContact]:
+        """
+        Get a user's delivery addresses, cached for a few minutes.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            
+        Returns:
+            User contact, or None if the user does not exist
+        """
+        now = time.monotonic()
+        with self._contact_lock:
+            cached = self._user_contact_cache.get(user_id)
+        if cached and cached[0] > now:
+            return cached[1]
+        
+        from shared.models import User
+        row = db.query(User.email).filter(User.id == user_id).first()
+        if not row:
+            return None
+        
+        # Users have no phone number column yet, so SMS stays skipped
+        contact = UserContact(email=row.email, phone_number=None)
+        
+        with self._contact_lock:
+            if len(self._user_contact_cache) >= USER_CONTACT_CACHE_SIZE:
+                # Drop expired entries, or everything if they are all live
+                live = {
+                    key: entry for key, entry in self._user_contact_cache.items()
+                    if entry[0] > now
+                }
+                self._user_contact_cache = live if len(live) < USER_CONTACT_CACHE_SIZE else {}
+            self._user_contact_cache[user_id] = (now + USER_CONTACT_CACHE_TTL_SECONDS, contact)
+        return contact
+    
+    def _build_message_bytes(self, subject: str, to: str, html_body: str) -> bytes:
+        """
+        Serialize an HTML email for SMTP.
+        
+        Builds a single-part EmailMessage rather than a one-part
+        MIMEMultipart and serializes it once with the SMTP policy, so
+        sendmail can send the bytes without re-flattening the message.
+        
+        Args:
+            subject: Subject line
+            to: Recipient address
+            html_body: HTML body
+            
+        Returns:
+            Message bytes with CRLF line endings
+        """
+        from email import policy
+        from email.message import EmailMessage
+        
+        msg = EmailMessage(policy=policy.SMTP)
+        msg['Subject'] = subject
+        msg['From'] = self._from_email
+        msg['To'] = to
+        # Quoted-printable stays 7-bit clean for servers without 8BITMIME
+        msg.set_content(html_body, subtype='html', cte='quoted-printable')
+        return msg.as_bytes()
+    
+    def cache_user_contacts(self, contacts: Dict[str, UserContact]) -> None:
+        """
+        Seed the contact cache with details the caller already read.
+        
+        Args:
+            contacts: User ID to contact details
+        """
+        expires_at = time.monotonic() + USER_CONTACT_CACHE_TTL_SECONDS
+        with self._contact_lock:
+            for user_id, contact in contacts.items():
+                self._user_contact_cache[user_id] = (expires_at, contact)
+    
+    def _open_smtp(self) -> "smtplib.SMTP":
+        """
+        Open an SMTP connection with STARTTLS and login done.
+        
+        Returns:
+            Authenticated SMTP connection
+        """
+        import smtplib
+        
+        server = smtplib.SMTP(self._smtp_host, self._smtp_port)
+        try:
+            server.starttls()
+            server.login(self._smtp_user, self._smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    @staticmethod
+    def _close_smtp(server: "smtplib.SMTP") -> None:
+        """Close an SMTP connection, politely if the server still listens."""
+        import smtplib
+        
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    
+    @staticmethod
+    def _smtp_alive(server: "smtplib.SMTP") -> bool:
+        """Check a pooled SMTP connection with NOOP."""
+        import smtplib
+        
+        try:
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+    
+    @contextmanager
+    def _smtp_conn(self) -> Iterator["smtplib.SMTP"]:
+        """
+        Borrow an authenticated SMTP connection from the pool.
+        
+        Idle connections past SMTP_IDLE_TIMEOUT_SECONDS or failing NOOP are
+        closed and replaced. A connection that raises while borrowed is
+        closed rather than returned.
+        
+        Yields:
+            Authenticated SMTP connection
+        """
+        server = None
+        while server is None:
+            try:
+                server, last_used = self._smtp_pool.get_nowait()
+            except queue.Empty:
+                server = self._open_smtp()
+                break
+            
+            if time.monotonic() - last_used > SMTP_IDLE_TIMEOUT_SECONDS or not self._smtp_alive(server):
+                self._close_smtp(server)
+                server = None
+        
+        try:
+            yield server
+        except Exception:
+            self._close_smtp(server)
+            raise
+        
+        try:
+            self._smtp_pool.put_nowait((server, time.monotonic()))
+        except queue.Full:
+            self._close_smtp(server)
+    
     def _deliver_sms(
         self,
         db: Session,
@@ -357,9 +746,8 @@ class NotificationService:
         
         try:
             # Get user phone number
-            from shared.models import User
-            user = db.query(User).filter(User.id == user_id).first()
-            if not user or not hasattr(user, 'phone_number') or not user.phone_number:
+            contact = self._get_user_contact(db, user_id)
+            if not contact or not contact.phone_number:
                 logger.warning(f"User {user_id} has no phone number for SMS notification")
                 return
             
@@ -370,10 +758,10 @@ class NotificationService:
             message = self._twilio_client.messages.create(
                 body=sms_body,
                 from_=self._twilio_from_number,
-                to=user.phone_number
+                to=contact.phone_number
             )
             
-            logger.info(f"Delivered SMS notification to {user.phone_number}: {message.sid}")
+            logger.info(f"Delivered SMS notification to {contact.phone_number}: {message.sid}")
             
         except Exception as e:
             logger.error(f"Failed to deliver SMS notification: {e}")
@@ -382,7 +770,7 @@ class NotificationService:
         self,
         db: Session,
         user_id: str,
-        notifications: List[Dict[str, Any]]
+        notifications: List[BatchItem]
     ):
         """
         Deliver batched SMS notifications.
@@ -390,7 +778,7 @@ class NotificationService:
         Args:
             db: Database session
             user_id: User ID
-            notifications: List of notification dictionaries
+            notifications: Batched (notification, metadata) pairs
         """
         if not self._twilio_client:
             logger.warning("Twilio not configured. Batched SMS skipped.")
@@ -398,9 +786,8 @@ class NotificationService:
         
         try:
             # Get user phone number
-            from shared.models import User
-            user = db.query(User).filter(User.id == user_id).first()
-            if not user or not hasattr(user, 'phone_number') or not user.phone_number:
+            contact = self._get_user_contact(db, user_id)
+            if not contact or not contact.phone_number:
                 logger.warning(f"User {user_id} has no phone number for batched SMS")
                 return
             
@@ -411,10 +798,10 @@ class NotificationService:
             message = self._twilio_client.messages.create(
                 body=sms_body,
                 from_=self._twilio_from_number,
-                to=user.phone_number
+                to=contact.phone_number
             )
             
-            logger.info(f"Delivered batched SMS to {user.phone_number}: {message.sid}")
+            logger.info(f"Delivered batched SMS to {contact.phone_number}: {message.sid}")
             
         except Exception as e:
             logger.error(f"Failed to deliver batched SMS: {e}")
@@ -434,78 +821,28 @@ class NotificationService:
         Returns:
             HTML string
         """
-        severity_colors = {
-            NotificationSeverity.INFO: '#2196F3',
-            NotificationSeverity.WARNING: '#FF9800',
-            NotificationSeverity.ERROR: '#F44336',
-            NotificationSeverity.CRITICAL: '#D32F2F'
-        }
-        
-        color = severity_colors.get(notification_data.severity, '#2196F3')
-        
-        html = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; padding: 20px;">
-            <div style="border-left: 4px solid {color}; padding-left: 15px;">
-                <h2 style="color: {color}; margin: 0;">{notification_data.title}</h2>
-                <p style="color: #666; margin: 5px 0;">{notification_data.created_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
-                <p style="margin: 15px 0;">{notification_data.message}</p>
-            </div>
-            <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
-            <p style="color: #999; font-size: 12px;">
-                This is an automated notification from your Trading Platform.
-            </p>
-        </body>
-        </html>
-        """
-        
-        return html
+        return _render_email_html(
+            notification_data.title,
+            notification_data.message,
+            notification_data.severity,
+            notification_data.created_at
+        )
     
-    def _create_batched_email_html(self, notifications: List[Dict[str, Any]]) -> str:
+    def _create_batched_email_html(self, notifications: List[BatchItem]) -> str:
         """
         Create HTML email body for batched notifications.
         
         Args:
-            notifications: List of notification dictionaries
+            notifications: Batched (notification, metadata) pairs
             
         Returns:
             HTML string
         """
-        severity_colors = {
-            NotificationSeverity.INFO: '#2196F3',
-            NotificationSeverity.WARNING: '#FF9800',
-            NotificationSeverity.ERROR: '#F44336',
-            NotificationSeverity.CRITICAL: '#D32F2F'
-        }
-        
-        notifications_html = ""
-        for item in notifications:
-            notification = item['notification']
-            color = severity_colors.get(notification.severity, '#2196F3')
-            
-            notifications_html += f"""
-            <div style="border-left: 4px solid {color}; padding-left: 15px; margin-bottom: 20px;">
-                <h3 style="color: {color}; margin: 0;">{notification.title}</h3>
-                <p style="color: #666; margin: 5px 0;">{notification.created_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
-                <p style="margin: 10px 0;">{notification.message}</p>
-            </div>
-            """
-        
-        html = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; padding: 20px;">
-            <h1>Trading Platform Notifications</h1>
-            <p>You have {len(notifications)} new notifications:</p>
-            {notifications_html}
-            <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
-            <p style="color: #999; font-size: 12px;">
-                This is an automated notification from your Trading Platform.
-            </p>
-        </body>
-        </html>
-        """
-        
-        return html
+        return _BATCHED_EMAIL_TEMPLATE.render(
+            notifications=[notification for notification, _ in notifications],
+            colors=_SEVERITY_COLORS,
+            default_color=_DEFAULT_COLOR
+        )
     
     def _get_user_preferences(
         self,
@@ -524,60 +861,9 @@ class NotificationService:
         """
         # TODO: Implement user preferences storage and retrieval
         # For now, return default preferences
-        default_preferences = {
-            NotificationType.ORDER_EXECUTED.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
-            ),
-            NotificationType.STRATEGY_ERROR.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL, NotificationChannel.SMS]
-            ),
-            NotificationType.THRESHOLD_ALERT.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP, NotificationChannel.SMS]
-            ),
-            NotificationType.CONNECTION_LOST.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
-            ),
-            NotificationType.SYSTEM_ALERT.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP]
-            ),
-            NotificationType.TRAILING_STOP_TRIGGERED.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP, NotificationChannel.SMS]
-            ),
-            NotificationType.INVESTOR_INVITATION.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
-            ),
-            NotificationType.ACCOUNT_ACCESS_GRANTED.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
-            ),
-            NotificationType.SESSION_TIMEOUT_WARNING.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP]
-            ),
-            NotificationType.ACCOUNT_LOCKED.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
-            ),
-            NotificationType.LOSS_LIMIT_BREACHED.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL, NotificationChannel.SMS]
-            ),
-            NotificationType.STRATEGY_PAUSED.value: NotificationChannelConfig(
-                enabled=True,
-                channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL]
-            ),
-        }
-        
         return NotificationPreferences(
             user_id=user_id,
-            preferences=default_preferences
+            preferences=_DEFAULT_PREFERENCES
         )
     
     def get_notification_history(
@@ -606,11 +892,11 @@ class NotificationService:
         if unread_only:
             query = query.filter(Notification.read_at.is_(None))
         
-        notifications = query.order_by(
+        rows = query.with_entities(*NotificationData.columns()).order_by(
             Notification.created_at.desc()
         ).limit(limit).offset(offset).all()
         
-        return [NotificationData.from_orm(n) for n in notifications]
+        return [NotificationData.from_mapping(row._mapping) for row in rows]
     
     def mark_as_read(
         self,
@@ -679,10 +965,39 @@ class NotificationService:
         Returns:
             Number of unread notifications
         """
-        return db.query(Notification).filter(
+        return db.scalar(
+            select(func.count()).select_from(Notification).where(
+                Notification.user_id == user_id,
+                Notification.read_at.is_(None)
+            )
+        )
+    
+    def get_unread_count_capped(
+        self,
+        db: Session,
+        user_id: str,
+        cap: int = UNREAD_BADGE_CAP
+    ) -> int:
+        """
+        Get count of unread notifications for a badge, up to a cap.
+        
+        Stops reading the unread partial index after ``cap`` entries, so
+        users with a large backlog cost no more than anyone else.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            cap: Highest count returned
+            
+        Returns:
+            Number of unread notifications, at most ``cap``
+        """
+        unread = select(literal(1)).select_from(Notification).where(
             Notification.user_id == user_id,
             Notification.read_at.is_(None)
-        ).count()
+        ).limit(cap).subquery()
+        
+        return db.scalar(select(func.count()).select_from(unread))
 
 
 # Global notification service instance
@@ -0,0 +1,220 @@
+"""
+Notification Tasks - Celery tasks for creating notifications off the caller's thread.
+Trading event handlers enqueue requests here so they never wait on the
+database insert or on email/SMS delivery.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from celery import Celery
+from celery.signals import worker_process_init
+from kombu import Queue
+
+from shared.config import get_settings
+from shared.database.connection import get_db_session, init_database
+from shared.models.notification import NotificationRequest, NotificationSeverity
+from shared.services.notification_service import get_notification_service
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATIONS_QUEUE = "notifications"
+
+# Errors and critical alerts (strategy errors, loss limit breaches) get their
+# own queue so a backlog of routine notifications cannot delay them
+URGENT_NOTIFICATIONS_QUEUE = "notifications_urgent"
+URGENT_SEVERITIES = frozenset({NotificationSeverity.ERROR, NotificationSeverity.CRITICAL})
+
+# Queued requests are coalesced and sent to workers in batches of up to
+# BATCH_SIZE, so a burst of triggers costs one task and one insert per batch
+BATCH_SIZE = 1000
+
+# How long a request may wait in the buffer before it is sent
+FLUSH_INTERVAL_SECONDS = 0.2
+
+# Longest a worker's batch thread sleeps, so batches opened meanwhile are noticed
+BATCH_IDLE_SECONDS = 30
+
+_settings = get_settings()
+
+celery_app = Celery("notifications", broker=_settings.celery_broker)
+celery_app.conf.update(
+    task_queues=(
+        Queue(URGENT_NOTIFICATIONS_QUEUE, routing_key=URGENT_NOTIFICATIONS_QUEUE),
+        Queue(NOTIFICATIONS_QUEUE, routing_key=NOTIFICATIONS_QUEUE),
+    ),
+    task_default_queue=NOTIFICATIONS_QUEUE,
+    task_serializer="json",
+    accept_content=["json"],
+    # Fire and forget: nothing reads the results
+    task_ignore_result=True,
+    # Redeliver if a worker dies before the notification is stored
+    task_acks_late=True,
+)
+
+
+@celery_app.task(name="notifications.create_notification")
+def create_notification_task(payload: Dict[str, Any]) -> None:
+    """
+    Create and deliver a notification on a worker.
+    
+    Args:
+        payload: NotificationRequest.to_dict() of the request
+    """
+    request = NotificationRequest.from_dict(payload)
+    init_database()
+    with get_db_session() as db:
+        get_notification_service().create_notification(db, request)
+
+
+@celery_app.task(name="notifications.create_notifications")
+def create_notifications_task(payloads: List[Dict[str, Any]]) -> None:
+    """
+    Create and deliver a batch of notifications on a worker.
+    
+    Args:
+        payloads: NotificationRequest.to_dict() of each request
+    """
+    requests = [NotificationRequest.from_dict(payload) for payload in payloads]
+    init_database()
+    with get_db_session() as db:
+        get_notification_service().bulk_create_notifications(db, requests)
+
+
+def _deliver_batches() -> None:
+    """Deliver this process's notification batches as they come due."""
+    notification_service = get_notification_service()
+    while True:
+        deadline = notification_service.next_batch_deadline()
+        now = time.monotonic()
+        if deadline is None or deadline > now:
+            delay = BATCH_IDLE_SECONDS if deadline is None else deadline - now
+            time.sleep(min(delay, BATCH_IDLE_SECONDS))
+            continue
+        
+        try:
+            with get_db_session() as db:
+                notification_service.process_batches(db)
+        except Exception as e:
+            logger.error(f"Error processing notification batches: {e}", exc_info=True)
+
+
+@worker_process_init.connect
+def _start_batch_delivery(**kwargs: Any) -> None:
+    """
+    Start delivering batches in each worker process.
+    
+    Non-urgent notifications are batched in the memory of the process that
+    created them, so every (prefork) worker process needs its own driver.
+    """
+    init_database()
+    threading.Thread(target=_deliver_batches, name="notification-batches", daemon=True).start()
+
+
+_buffer: Deque[NotificationRequest] = deque()
+_buffer_lock = threading.Lock()
+_flush_timer: Optional[threading.Timer] = None
+
+
+def _queue_for(request: NotificationRequest) -> str:
+    """Get the queue a request is routed to."""
+    return URGENT_NOTIFICATIONS_QUEUE if request.severity in URGENT_SEVERITIES else NOTIFICATIONS_QUEUE
+
+
+def _schedule_flush() -> None:
+    """Start the flush timer unless one is pending. Caller holds _buffer_lock."""
+    global _flush_timer
+    if _flush_timer is None:
+        _flush_timer = threading.Timer(FLUSH_INTERVAL_SECONDS, _on_flush_timer)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def _on_flush_timer() -> None:
+    """Send buffered requests, rescheduling while more remain."""
+    global _flush_timer
+    try:
+        flush_notifications()
+    except Exception as e:
+        logger.error(f"Error flushing notification buffer: {e}", exc_info=True)
+    with _buffer_lock:
+        _flush_timer = None
+        if _buffer:
+            _schedule_flush()
+
+
+def flush_notifications() -> int:
+    """
+    Send up to BATCH_SIZE buffered requests to the workers now.
+    
+    If the broker call fails, the requests not yet sent go back to the
+    front of the buffer, in order, and the error is re-raised.
+    
+    Returns:
+        Number of requests sent
+    """
+    with _buffer_lock:
+        count = min(len(_buffer), BATCH_SIZE)
+        batch = [_buffer.popleft() for _ in range(count)]
+    
+    batches: Dict[str, List[NotificationRequest]] = {}
+    for request in batch:
+        batches.setdefault(_queue_for(request), []).append(request)
+    
+    sent = 0
+    queued = list(batches.items())
+    for index, (queue, requests) in enumerate(queued):
+        try:
+            create_notifications_task.apply_async(
+                args=([request.to_dict() for request in requests],),
+                queue=queue,
+                routing_key=queue
+            )
+        except Exception:
+            unsent = [request for _, pending in queued[index:] for request in pending]
+            with _buffer_lock:
+                _buffer.extendleft(reversed(unsent))
+            raise
+        sent += len(requests)
+        logger.debug(f"Queued batch of {len(requests)} notifications on {queue}")
+    
+    return sent
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    """Send everything still buffered before the process exits."""
+    while _buffer:
+        try:
+            flush_notifications()
+        except Exception as e:
+            logger.error(f"Dropping {len(_buffer)} buffered notifications at exit: {e}")
+            return
+
+
+def enqueue_notification(request: NotificationRequest) -> None:
+    """
+    Queue a notification for creation by a worker.
+    
+    Critical notifications are sent straight away; all others wait up to
+    FLUSH_INTERVAL_SECONDS in the buffer and go out with the next batch.
+    
+    Args:
+        request: Notification request
+    """
+    if request.severity == NotificationSeverity.CRITICAL:
+        queue = _queue_for(request)
+        create_notification_task.apply_async(
+            args=(request.to_dict(),),
+            queue=queue,
+            routing_key=queue
+        )
+        logger.debug(f"Queued {request.type.value} notification for user {request.user_id} on {queue}")
+        return
+    
+    with _buffer_lock:
+        _buffer.append(request)
+        _schedule_flush()
@@ -1,8 +1,10 @@
 """
 Notification Triggers - Implements notification triggers for various trading events.
 """
+import functools
 import logging
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from sqlalchemy.orm import Session
@@ -10,16 +12,177 @@ from sqlalchemy.orm import Session
 from shared.models.notification import (
     NotificationRequest, NotificationType, NotificationSeverity, NotificationChannel
 )
-from shared.services.notification_service import get_notification_service
+from shared.services.notification_tasks import enqueue_notification
 
 logger = logging.getLogger(__name__)
 
+# Title prefix per trading mode; anything but paper is reported as live
+_MODE_LABEL = {"paper": "Paper", "live": "Live"}
+
+# Channel combinations shared by the trigger specs
+_CH_APP_ONLY = (NotificationChannel.IN_APP,)
+_CH_APP_EMAIL = (NotificationChannel.IN_APP, NotificationChannel.EMAIL)
+_CH_APP_SMS = (NotificationChannel.IN_APP, NotificationChannel.SMS)
+_CH_APP_EMAIL_SMS = (NotificationChannel.IN_APP, NotificationChannel.EMAIL, NotificationChannel.SMS)
+
+
+@dataclass(frozen=True, slots=True)
+class TriggerSpec:
+    """How to build the notification for one kind of trigger."""
+    title_tpl: str
+    msg_tpl: str
+    severity: NotificationSeverity
+    channels: Tuple[NotificationChannel, ...]
+
+
+_SPECS: Dict[NotificationType, TriggerSpec] = {
+    NotificationType.ORDER_EXECUTED: TriggerSpec(
+        "{mode} Order Executed",
+        "Your {side} order for {quantity} shares of {symbol} was executed at ₹{price:.2f}",
+        NotificationSeverity.INFO,
+        _CH_APP_EMAIL
+    ),
+    NotificationType.STRATEGY_ERROR: TriggerSpec(
+        "Strategy Error",
+        "Strategy '{strategy_name}' encountered an error: {error_message}",
+        NotificationSeverity.ERROR,
+        _CH_APP_EMAIL_SMS
+    ),
+    NotificationType.TRAILING_STOP_TRIGGERED: TriggerSpec(
+        "{mode} Trailing Stop Triggered",
+        "Trailing stop-loss triggered for {side} position in {symbol}. "
+        "Stop price: ₹{stop_price:.2f}, Current price: ₹{current_price:.2f}",
+        NotificationSeverity.WARNING,
+        _CH_APP_SMS
+    ),
+    NotificationType.INVESTOR_INVITATION: TriggerSpec(
+        "Investor Invitation",
+        "{inviter_name} has invited you to view their trading account '{account_name}'. "
+        "Click the link to accept: {invitation_link}",
+        NotificationSeverity.INFO,
+        _CH_APP_EMAIL
+    ),
+    NotificationType.ACCOUNT_ACCESS_GRANTED: TriggerSpec(
+        "Account Access Granted",
+        "You now have investor access to trading account '{account_name}' granted by {granted_by}.",
+        NotificationSeverity.INFO,
+        _CH_APP_EMAIL
+    ),
+    NotificationType.SESSION_TIMEOUT_WARNING: TriggerSpec(
+        "Session Timeout Warning",
+        "Your session will expire in {minutes_remaining} minutes due to inactivity. "
+        "Please refresh to stay logged in.",
+        NotificationSeverity.WARNING,
+        _CH_APP_ONLY
+    ),
+    NotificationType.ACCOUNT_LOCKED: TriggerSpec(
+        "Account Locked",
+        "Your account has been locked. Reason: {reason}",
+        NotificationSeverity.ERROR,
+        _CH_APP_EMAIL
+    ),
+    NotificationType.LOSS_LIMIT_BREACHED: TriggerSpec(
+        "{mode} Loss Limit Breached",
+        "Your {trading_mode} trading loss of ₹{current_loss:.2f} has exceeded the maximum limit of "
+        "₹{loss_limit:.2f}. All strategies have been paused. Please acknowledge and update your "
+        "limit to continue trading.",
+        NotificationSeverity.CRITICAL,
+        _CH_APP_EMAIL_SMS
+    ),
+    NotificationType.STRATEGY_PAUSED: TriggerSpec(
+        "{mode} Strategy Paused",
+        "Strategy '{strategy_name}' has been paused. Reason: {reason}",
+        NotificationSeverity.WARNING,
+        _CH_APP_EMAIL
+    ),
+    NotificationType.SYSTEM_ALERT: TriggerSpec(
+        "{alert_title}",
+        "{alert_message}",
+        NotificationSeverity.INFO,
+        _CH_APP_ONLY
+    ),
+}
+
+# Threshold alerts by alert type; anything but profit is a loss
+_THRESHOLD_SPECS: Dict[str, TriggerSpec] = {
+    "profit": TriggerSpec(
+        "{mode} Profit Threshold Reached",
+        "Your position in {symbol} has reached a profit of ₹{current_value:.2f} (threshold: ₹{threshold_value:.2f})",
+        NotificationSeverity.INFO,
+        _CH_APP_SMS
+    ),
+    "loss": TriggerSpec(
+        "{mode} Loss Threshold Reached",
+        "Your position in {symbol} has reached a loss of ₹{current_value:.2f} (threshold: ₹{threshold_value:.2f})",
+        NotificationSeverity.WARNING,
+        _CH_APP_SMS
+    ),
+}
+
+# Lost connections by connection type; anything but broker is market data
+_CONNECTION_LOST_SPECS: Dict[str, TriggerSpec] = {
+    "broker": TriggerSpec(
+        "Broker Connection Lost",
+        "Connection to broker '{connection_name}' has been lost. Attempting to reconnect...",
+        NotificationSeverity.ERROR,
+        _CH_APP_EMAIL
+    ),
+    "market_data": TriggerSpec(
+        "Market Data Connection Lost",
+        "Market data feed '{connection_name}' connection has been lost. Attempting to reconnect...",
+        NotificationSeverity.ERROR,
+        _CH_APP_EMAIL
+    ),
+}
+
 
 class NotificationTriggers:
-    """Handles triggering notifications for various trading events."""
+    """
+    Handles triggering notifications for various trading events.
     
-    def __init__(self):
-        self.notification_service = get_notification_service()
+    Triggers only build the request and queue it; a Celery worker running
+    shared.services.notification_tasks stores and delivers it.
+    """
+    
+    __slots__ = ()
+    
+    def _trigger(
+        self,
+        notification_type: NotificationType,
+        user_id: str,
+        metadata: Dict[str, Any],
+        spec: Optional[TriggerSpec] = None,
+        severity: Optional[NotificationSeverity] = None,
+        details: str = "",
+        **fields: Any
+    ) -> None:
+        """
+        Build a notification from its spec and queue it.
+        
+        Args:
+            notification_type: Notification type
+            user_id: User ID
+            metadata: Notification metadata; also the template fields
+            spec: Spec to use instead of the one registered for the type
+            severity: Severity to use instead of the spec's
+            details: Text appended to the formatted message
+            **fields: Template fields overriding the metadata values
+        """
+        spec = spec or _SPECS[notification_type]
+        context = {**metadata, **fields}
+        request = NotificationRequest(
+            user_id=user_id,
+            type=notification_type,
+            title=spec.title_tpl.format_map(context),
+            message=spec.msg_tpl.format_map(context) + details,
+            severity=severity or spec.severity,
+            channels=spec.channels,
+            metadata=metadata
+        )
+        
+        enqueue_notification(request)
+        # Lazy %-formatting: triggers fire per fill, and INFO is usually off
+        logger.info("Triggered %s notification for user %s", notification_type.value, user_id)
     
     def trigger_order_executed(
         self,
@@ -36,7 +199,7 @@ class NotificationTriggers:
         Trigger notification when an order is executed.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID
             order_id: Order ID
             symbol: Symbol
@@ -45,27 +208,20 @@ class NotificationTriggers:
             price: Execution price
             trading_mode: Trading mode (paper/live)
         """
-        mode_label = "Paper" if trading_mode == "paper" else "Live"
-        
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.ORDER_EXECUTED,
-            title=f"{mode_label} Order Executed",
-            message=f"Your {side.upper()} order for {quantity} shares of {symbol} was executed at ₹{price:.2f}",
-            severity=NotificationSeverity.INFO,
-            channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL],
-            metadata={
+        self._trigger(
+            NotificationType.ORDER_EXECUTED,
+            user_id,
+            {
                 'order_id': order_id,
                 'symbol': symbol,
                 'side': side,
                 'quantity': quantity,
                 'price': price,
                 'trading_mode': trading_mode
-            }
+            },
+            mode=_MODE_LABEL.get(trading_mode, "Live"),
+            side=side.upper()
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered order executed notification for user {user_id}")
     
     def trigger_strategy_error(
         self,
@@ -80,34 +236,24 @@ class NotificationTriggers:
         Trigger notification when a strategy generates an error.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID
             strategy_id: Strategy ID
             strategy_name: Strategy name
             error_message: Error message
             error_details: Detailed error information
         """
-        message = f"Strategy '{strategy_name}' encountered an error: {error_message}"
-        if error_details:
-            message += f"\n\nDetails: {error_details}"
-        
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.STRATEGY_ERROR,
-            title="Strategy Error",
-            message=message,
-            severity=NotificationSeverity.ERROR,
-            channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL, NotificationChannel.SMS],
-            metadata={
+        self._trigger(
+            NotificationType.STRATEGY_ERROR,
+            user_id,
+            {
                 'strategy_id': strategy_id,
                 'strategy_name': strategy_name,
                 'error_message': error_message,
                 'error_details': error_details
-            }
+            },
+            details=f"\n\nDetails: {error_details}" if error_details else ""
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered strategy error notification for user {user_id}")
     
     def trigger_threshold_alert(
         self,
@@ -123,7 +269,7 @@ class NotificationTriggers:
         Trigger notification when a position reaches a profit or loss threshold.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID
             alert_type: Type of alert (profit/loss)
             symbol: Symbol
@@ -131,35 +277,22 @@ class NotificationTriggers:
             threshold_value: Threshold value
             trading_mode: Trading mode (paper/live)
         """
-        mode_label = "Paper" if trading_mode == "paper" else "Live"
-        
-        if alert_type == "profit":
-            title = f"{mode_label} Profit Threshold Reached"
-            message = f"Your position in {symbol} has reached a profit of ₹{current_value:.2f} (threshold: ₹{threshold_value:.2f})"
-            severity = NotificationSeverity.INFO
-        else:
-            title = f"{mode_label} Loss Threshold Reached"
-            message = f"Your position in {symbol} has reached a loss of ₹{abs(current_value):.2f} (threshold: ₹{abs(threshold_value):.2f})"
-            severity = NotificationSeverity.WARNING
-        
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.THRESHOLD_ALERT,
-            title=title,
-            message=message,
-            severity=severity,
-            channels=[NotificationChannel.IN_APP, NotificationChannel.SMS],
-            metadata={
+        is_profit = alert_type == "profit"
+        self._trigger(
+            NotificationType.THRESHOLD_ALERT,
+            user_id,
+            {
                 'alert_type': alert_type,
                 'symbol': symbol,
                 'current_value': current_value,
                 'threshold_value': threshold_value,
                 'trading_mode': trading_mode
-            }
+            },
+            spec=_THRESHOLD_SPECS["profit"] if is_profit else _THRESHOLD_SPECS["loss"],
+            mode=_MODE_LABEL.get(trading_mode, "Live"),
+            current_value=current_value if is_profit else abs(current_value),
+            threshold_value=threshold_value if is_profit else abs(threshold_value)
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered threshold alert notification for user {user_id}")
     
     def trigger_connection_lost(
         self,
@@ -173,38 +306,23 @@ class NotificationTriggers:
         Trigger notification when broker or market data connection is lost.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID
             connection_type: Type of connection (broker/market_data)
             connection_name: Name of the connection
             error_message: Optional error message
         """
-        if connection_type == "broker":
-            title = "Broker Connection Lost"
-            message = f"Connection to broker '{connection_name}' has been lost. Attempting to reconnect..."
-        else:
-            title = "Market Data Connection Lost"
-            message = f"Market data feed '{connection_name}' connection has been lost. Attempting to reconnect..."
-        
-        if error_message:
-            message += f"\n\nError: {error_message}"
-        
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.CONNECTION_LOST,
-            title=title,
-            message=message,
-            severity=NotificationSeverity.ERROR,
-            channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL],
-            metadata={
+        self._trigger(
+            NotificationType.CONNECTION_LOST,
+            user_id,
+            {
                 'connection_type': connection_type,
                 'connection_name': connection_name,
                 'error_message': error_message
-            }
+            },
+            spec=_CONNECTION_LOST_SPECS["broker" if connection_type == "broker" else "market_data"],
+            details=f"\n\nError: {error_message}" if error_message else ""
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered connection lost notification for user {user_id}")
     
     def trigger_trailing_stop_triggered(
         self,
@@ -221,7 +339,7 @@ class NotificationTriggers:
         Trigger notification when trailing stop-loss is triggered.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID
             position_id: Position ID
             symbol: Symbol
@@ -230,27 +348,20 @@ class NotificationTriggers:
             current_price: Current price
             trading_mode: Trading mode (paper/live)
         """
-        mode_label = "Paper" if trading_mode == "paper" else "Live"
-        
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.TRAILING_STOP_TRIGGERED,
-            title=f"{mode_label} Trailing Stop Triggered",
-            message=f"Trailing stop-loss triggered for {side.upper()} position in {symbol}. Stop price: ₹{stop_price:.2f}, Current price: ₹{current_price:.2f}",
-            severity=NotificationSeverity.WARNING,
-            channels=[NotificationChannel.IN_APP, NotificationChannel.SMS],
-            metadata={
+        self._trigger(
+            NotificationType.TRAILING_STOP_TRIGGERED,
+            user_id,
+            {
                 'position_id': position_id,
                 'symbol': symbol,
                 'side': side,
                 'stop_price': stop_price,
                 'current_price': current_price,
                 'trading_mode': trading_mode
-            }
+            },
+            mode=_MODE_LABEL.get(trading_mode, "Live"),
+            side=side.upper()
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered trailing stop notification for user {user_id}")
     
     def trigger_investor_invitation(
         self,
@@ -264,28 +375,21 @@ class NotificationTriggers:
         Trigger notification when a user is invited as an investor.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID (invitee)
             inviter_name: Name of the person who sent the invitation
             account_name: Name of the account
             invitation_link: Link to accept invitation
         """
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.INVESTOR_INVITATION,
-            title="Investor Invitation",
-            message=f"{inviter_name} has invited you to view their trading account '{account_name}'. Click the link to accept: {invitation_link}",
-            severity=NotificationSeverity.INFO,
-            channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL],
-            metadata={
+        self._trigger(
+            NotificationType.INVESTOR_INVITATION,
+            user_id,
+            {
                 'inviter_name': inviter_name,
                 'account_name': account_name,
                 'invitation_link': invitation_link
             }
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered investor invitation notification for user {user_id}")
     
     def trigger_account_access_granted(
         self,
@@ -298,26 +402,19 @@ class NotificationTriggers:
         Trigger notification when investor access is granted to an account.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID (investor)
             account_name: Name of the account
             granted_by: Name of the person who granted access
         """
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.ACCOUNT_ACCESS_GRANTED,
-            title="Account Access Granted",
-            message=f"You now have investor access to trading account '{account_name}' granted by {granted_by}.",
-            severity=NotificationSeverity.INFO,
-            channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL],
-            metadata={
+        self._trigger(
+            NotificationType.ACCOUNT_ACCESS_GRANTED,
+            user_id,
+            {
                 'account_name': account_name,
                 'granted_by': granted_by
             }
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered account access granted notification for user {user_id}")
     
     def trigger_session_timeout_warning(
         self,
@@ -329,24 +426,17 @@ class NotificationTriggers:
         Trigger notification warning about upcoming session timeout.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID
             minutes_remaining: Minutes until session timeout
         """
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.SESSION_TIMEOUT_WARNING,
-            title="Session Timeout Warning",
-            message=f"Your session will expire in {minutes_remaining} minutes due to inactivity. Please refresh to stay logged in.",
-            severity=NotificationSeverity.WARNING,
-            channels=[NotificationChannel.IN_APP],
-            metadata={
+        self._trigger(
+            NotificationType.SESSION_TIMEOUT_WARNING,
+            user_id,
+            {
                 'minutes_remaining': minutes_remaining
             }
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered session timeout warning for user {user_id}")
     
     def trigger_account_locked(
         self,
@@ -359,30 +449,23 @@ class NotificationTriggers:
         Trigger notification when account is locked.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID
             reason: Reason for account lock
             unlock_time: Time when account will be automatically unlocked
         """
-        message = f"Your account has been locked. Reason: {reason}"
-        if unlock_time:
-            message += f"\n\nYour account will be automatically unlocked at {unlock_time.strftime('%Y-%m-%d %H:%M:%S')}."
-        
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.ACCOUNT_LOCKED,
-            title="Account Locked",
-            message=message,
-            severity=NotificationSeverity.ERROR,
-            channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL],
-            metadata={
+        self._trigger(
+            NotificationType.ACCOUNT_LOCKED,
+            user_id,
+            {
                 'reason': reason,
                 'unlock_time': unlock_time.isoformat() if unlock_time else None
-            }
+            },
+            details=(
+                f"\n\nYour account will be automatically unlocked at {unlock_time.strftime('%Y-%m-%d %H:%M:%S')}."
+                if unlock_time else ""
+            )
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered account locked notification for user {user_id}")
     
     def trigger_loss_limit_breached(
         self,
@@ -397,32 +480,26 @@ class NotificationTriggers:
         Trigger notification when maximum loss limit is breached.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID
             account_id: Account ID
             trading_mode: Trading mode (paper/live)
             current_loss: Current total loss
             loss_limit: Maximum loss limit
         """
-        mode_label = "Paper" if trading_mode == "paper" else "Live"
-        
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.LOSS_LIMIT_BREACHED,
-            title=f"{mode_label} Loss Limit Breached",
-            message=f"Your {trading_mode} trading loss of ₹{abs(current_loss):.2f} has exceeded the maximum limit of ₹{abs(loss_limit):.2f}. All strategies have been paused. Please acknowledge and update your limit to continue trading.",
-            severity=NotificationSeverity.CRITICAL,
-            channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL, NotificationChannel.SMS],
-            metadata={
+        self._trigger(
+            NotificationType.LOSS_LIMIT_BREACHED,
+            user_id,
+            {
                 'account_id': account_id,
                 'trading_mode': trading_mode,
                 'current_loss': current_loss,
                 'loss_limit': loss_limit
-            }
+            },
+            mode=_MODE_LABEL.get(trading_mode, "Live"),
+            current_loss=abs(current_loss),
+            loss_limit=abs(loss_limit)
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered loss limit breached notification for user {user_id}")
     
     def trigger_strategy_paused(
         self,
@@ -437,32 +514,24 @@ class NotificationTriggers:
         Trigger notification when a strategy is paused.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID
             strategy_id: Strategy ID
             strategy_name: Strategy name
             reason: Reason for pause
             trading_mode: Trading mode (paper/live)
         """
-        mode_label = "Paper" if trading_mode == "paper" else "Live"
-        
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.STRATEGY_PAUSED,
-            title=f"{mode_label} Strategy Paused",
-            message=f"Strategy '{strategy_name}' has been paused. Reason: {reason}",
-            severity=NotificationSeverity.WARNING,
-            channels=[NotificationChannel.IN_APP, NotificationChannel.EMAIL],
-            metadata={
+        self._trigger(
+            NotificationType.STRATEGY_PAUSED,
+            user_id,
+            {
                 'strategy_id': strategy_id,
                 'strategy_name': strategy_name,
                 'reason': reason,
                 'trading_mode': trading_mode
-            }
+            },
+            mode=_MODE_LABEL.get(trading_mode, "Live")
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered strategy paused notification for user {user_id}")
     
     def trigger_system_alert(
         self,
@@ -476,33 +545,23 @@ class NotificationTriggers:
         Trigger a generic system alert notification.
         
         Args:
-            db: Database session
+            db: Database session (unused; kept for existing callers)
             user_id: User ID
             alert_title: Alert title
             alert_message: Alert message
             severity: Alert severity
         """
-        request = NotificationRequest(
-            user_id=user_id,
-            type=NotificationType.SYSTEM_ALERT,
-            title=alert_title,
-            message=alert_message,
+        self._trigger(
+            NotificationType.SYSTEM_ALERT,
+            user_id,
+            {},
             severity=severity,
-            channels=[NotificationChannel.IN_APP],
-            metadata={}
+            alert_title=alert_title,
+            alert_message=alert_message
         )
-        
-        self.notification_service.create_notification(db, request)
-        logger.info(f"Triggered system alert notification for user {user_id}")
-
-
-# Global notification triggers instance
-_notification_triggers = None
 
 
+@functools.cache
 def get_notification_triggers() -> NotificationTriggers:
     """Get or create the global notification triggers instance."""
-    global _notification_triggers
-    if _notification_triggers is None:
-        _notification_triggers = NotificationTriggers()
-    return _notification_triggers
+    return NotificationTriggers()
@@ -4,18 +4,52 @@ and broker-specific symbol tokens.
 """
 import csv
 import logging
-from typing import Optional, List, Dict, Any
+import re
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Sequence
 from pathlib import Path
 
+import orjson
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
+from shared.database.bulk import bulk_upsert
 from shared.models.symbol_mapping import SymbolMapping, SymbolMappingCache
-from shared.redis.connection import get_redis_client
+from shared.redis.connection import get_redis_client, get_redis_manager
 
 
 logger = logging.getLogger(__name__)
 
+# Channel on which mapping changes are announced to other workers
+INVALIDATION_CHANNEL = "symbol_mappings:invalidate"
+
+# How long looked-up broker tokens stay in Redis
+_REDIS_TTL_SECONDS = 3600
+
+
+# How long a broker's "defaults loaded" flag is trusted before startup
+# checks the table again
+LOADED_FLAG_TTL_SECONDS = 7 * 86400
+
+
+def _redis_key(broker_name: str, symbol: str) -> str:
+    """Redis key for a cached standard symbol to broker token translation."""
+    return f"symbol_mapping:{broker_name}:{symbol}"
+
+
+def _reverse_redis_key(broker_name: str, broker_symbol: str) -> str:
+    """Redis key for a cached broker symbol or token to standard symbol translation."""
+    return f"symbol_mapping_rev:{broker_name}:{broker_symbol}"
+
+
+def _escape_glob(value: str) -> str:
+    """Escape Redis glob metacharacters so value matches only itself."""
+    return re.sub(r'([*?\[\]\\])', r'\\\1', value)
+
+
+def loaded_flag_key(broker_name: str) -> str:
+    """Redis key flagging that a broker's mappings are in the database."""
+    return f"symbol_mappings:loaded:{broker_name}"
+
 
 class SymbolMappingService:
     """Service for managing symbol mappings between standard and broker-specific formats."""
@@ -35,6 +69,7 @@ class SymbolMappingService:
             # Redis not initialized (e.g., in tests), continue without it
             self.redis_client = None
             logger.warning("Redis not available, symbol mapping will use in-memory cache only")
+        self._invalidation_listener = None
         self._load_cache_from_db()
     
     def _load_cache_from_db(self) -> None:
@@ -69,12 +104,12 @@ class SymbolMappingService:
                 return standard_symbol
         
         # Fallback to Redis
-        redis_key = f"symbol_mapping:{broker_name}:{broker_symbol}"
+        redis_key = _reverse_redis_key(broker_name, broker_symbol)
         try:
             if self.redis_client:
                 cached_value = self.redis_client.get(redis_key)
                 if cached_value:
-                    return cached_value.decode('utf-8')
+                    return cached_value
         except Exception as e:
             logger.warning(f"Redis lookup failed for {broker_symbol}: {e}")
         
@@ -92,7 +127,7 @@ class SymbolMappingService:
                 # Update Redis
                 if self.redis_client:
                     try:
-                        self.redis_client.setex(redis_key, 3600, mapping.standard_symbol)
+                        self.redis_client.setex(redis_key, _REDIS_TTL_SECONDS, mapping.standard_symbol)
                     except Exception as e:
                         logger.warning(f"Failed to cache in Redis: {e}")
                 return mapping.standard_symbol
@@ -118,12 +153,12 @@ class SymbolMappingService:
             return mapping.broker_token
         
         # Fallback to Redis
-        redis_key = f"symbol_mapping:{broker_name}:{standard_symbol}"
+        redis_key = _redis_key(broker_name, standard_symbol)
         try:
             if self.redis_client:
                 cached_value = self.redis_client.get(redis_key)
                 if cached_value:
-                    return cached_value.decode('utf-8')
+                    return cached_value
         except Exception as e:
             logger.warning(f"Redis lookup failed for {standard_symbol}: {e}")
         
@@ -140,7 +175,7 @@ class SymbolMappingService:
                 # Update Redis
                 if self.redis_client:
                     try:
-                        self.redis_client.setex(redis_key, 3600, mapping.broker_token)
+                        self.redis_client.setex(redis_key, _REDIS_TTL_SECONDS, mapping.broker_token)
                     except Exception as e:
                         logger.warning(f"Failed to cache in Redis: {e}")
                 return mapping.broker_token
@@ -217,68 +252,70 @@ class SymbolMappingService:
                 "failed": 0
             }
         
-        loaded_count = 0
         failed_count = 0
         errors = []
+        required_fields = [
+            'standard_symbol', 'broker_symbol', 'broker_token',
+            'exchange', 'instrument_type', 'lot_size', 'tick_size'
+        ]
+        # Later rows for the same symbol win, as they did when rows were
+        # written one at a time
+        rows: Dict[str, Dict[str, Any]] = {}
         
         try:
             with open(csv_file_path, 'r') as csvfile:
                 reader = csv.DictReader(csvfile)
+                now = datetime.utcnow()
                 
                 for row in reader:
+                    if not all(field in row for field in required_fields):
+                        failed_count += 1
+                        errors.append(f"Missing required fields in row: {row}")
+                        continue
+                    
                     try:
-                        # Validate required fields
-                        required_fields = [
-                            'standard_symbol', 'broker_symbol', 'broker_token',
-                            'exchange', 'instrument_type', 'lot_size', 'tick_size'
-                        ]
-                        
-                        if not all(field in row for field in required_fields):
-                            failed_count += 1
-                            errors.append(f"Missing required fields in row: {row}")
-                            continue
-                        
-                        # Create or update mapping
-                        mapping = self.db.query(SymbolMapping).filter(
-                            SymbolMapping.broker_name == broker_name,
-                            SymbolMapping.standard_symbol == row['standard_symbol']
-                        ).first()
-                        
-                        if mapping:
-                            # Update existing mapping
-                            mapping.broker_symbol = row['broker_symbol']
-                            mapping.broker_token = row['broker_token']
-                            mapping.exchange = row['exchange']
-                            mapping.instrument_type = row['instrument_type']
-                            mapping.lot_size = int(row['lot_size'])
-                            mapping.tick_size = float(row['tick_size'])
-                        else:
-                            # Create new mapping
-                            mapping = SymbolMapping(
-                                standard_symbol=row['standard_symbol'],
-                                broker_name=broker_name,
-                                broker_symbol=row['broker_symbol'],
-                                broker_token=row['broker_token'],
-                                exchange=row['exchange'],
-                                instrument_type=row['instrument_type'],
-                                lot_size=int(row['lot_size']),
-                                tick_size=float(row['tick_size'])
-                            )
-                            self.db.add(mapping)
-                        
-                        self.db.commit()
-                        
-                        # Update cache
-                        self.cache.set_mapping(broker_name, row['standard_symbol'], mapping)
-                        
-                        loaded_count += 1
-                        
-                    except (ValueError, IntegrityError) as e:
-                        self.db.rollback()
+                        rows[row['standard_symbol']] = {
+                            'standard_symbol': row['standard_symbol'],
+                            'broker_name': broker_name,
+                            'broker_symbol': row['broker_symbol'],
+                            'broker_token': row['broker_token'],
+                            'exchange': row['exchange'],
+                            'instrument_type': row['instrument_type'],
+                            'lot_size': int(row['lot_size']),
+                            'tick_size': float(row['tick_size']),
+                            'created_at': now,
+                            'updated_at': now,
+                        }
+                    except (TypeError, ValueError) as e:
                         failed_count += 1
                         errors.append(f"Failed to load row {row.get('standard_symbol', 'unknown')}: {str(e)}")
                         logger.error(f"Failed to load mapping: {e}")
             
+            # One multi-row upsert per batch instead of a SELECT, a write
+            # and a commit per row
+            bulk_upsert(
+                self.db,
+                SymbolMapping.__table__,
+                list(rows.values()),
+                conflict_columns=('broker_name', 'standard_symbol'),
+                update_columns=(
+                    'broker_symbol', 'broker_token', 'exchange',
+                    'instrument_type', 'lot_size', 'tick_size', 'updated_at'
+                )
+            )
+            self.db.commit()
+            
+            # Refresh the broker's cache from the stored rows, overwriting any
+            # stale instances already in the session
+            if rows:
+                mappings = self.db.query(SymbolMapping).filter(
+                    SymbolMapping.broker_name == broker_name
+                ).populate_existing().all()
+                for mapping in mappings:
+                    self.cache.set_mapping(broker_name, mapping.standard_symbol, mapping)
+                self._publish_bulk_invalidation(broker_name, list(rows))
+            
+            loaded_count = len(rows)
             logger.info(f"Loaded {loaded_count} mappings, {failed_count} failed")
             
             return {
@@ -289,11 +326,12 @@ class SymbolMappingService:
             }
             
         except Exception as e:
+            self.db.rollback()
             logger.error(f"Failed to load CSV file: {e}")
             return {
                 "success": False,
                 "error": str(e),
-                "loaded": loaded_count,
+                "loaded": 0,
                 "failed": failed_count
             }
     
@@ -337,18 +375,12 @@ class SymbolMappingService:
                 self.db.delete(mapping)
                 self.db.commit()
                 
-                # Remove from cache
-                broker_mappings = self.cache.mappings.get(broker_name, {})
-                if standard_symbol in broker_mappings:
-                    del broker_mappings[standard_symbol]
-                
-                # Remove from Redis
-                if self.redis_client:
-                    try:
-                        redis_key = f"symbol_mapping:{broker_name}:{standard_symbol}"
-                        self.redis_client.delete(redis_key)
-                    except Exception as e:
-                        logger.warning(f"Failed to delete from Redis: {e}")
+                # Remove from cache, Redis and other workers' caches
+                self.cache.remove_mapping(broker_name, standard_symbol)
+                self._publish_invalidation(
+                    broker_name, standard_symbol,
+                    broker_symbols=(mapping.broker_symbol, mapping.broker_token)
+                )
                 
                 logger.info(f"Deleted mapping: {broker_name} - {standard_symbol}")
                 return True
@@ -376,8 +408,9 @@ class SymbolMappingService:
             ).delete()
             self.db.commit()
             
-            # Clear from cache
+            # Clear from cache and other workers' caches
             self.cache.clear_broker(broker_name)
+            self._publish_invalidation(broker_name)
             
             logger.info(f"Cleared all mappings for broker: {broker_name}")
             return True
@@ -386,3 +419,145 @@ class SymbolMappingService:
             self.db.rollback()
             logger.error(f"Failed to clear broker mappings: {e}")
             return False
+    
+    def _publish_invalidation(
+        self,
+        broker_name: str,
+        standard_symbol: Optional[str] = None,
+        broker_symbols: Sequence[str] = ()
+    ) -> None:
+        """
+        Drop a changed mapping from Redis and tell other workers to evict it.
+        
+        Args:
+            broker_name: Name of the broker
+            standard_symbol: Changed symbol, or None when the whole broker changed
+            broker_symbols: Broker symbol and token of the changed mapping,
+                whose reverse lookups are dropped too
+        """
+        if not self.redis_client:
+            return
+        
+        try:
+            if standard_symbol is not None:
+                self.redis_client.delete(
+                    _redis_key(broker_name, standard_symbol),
+                    *(_reverse_redis_key(broker_name, symbol) for symbol in broker_symbols)
+                )
+            else:
+                # The broker's mappings were cleared: drop every cached
+                # translation and let startup reload them
+                self._delete_broker_keys(broker_name)
+                self.redis_client.delete(loaded_flag_key(broker_name))
+            self.redis_client.publish(
+                INVALIDATION_CHANNEL,
+                orjson.dumps({'broker_name': broker_name, 'standard_symbol': standard_symbol})
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish symbol mapping invalidation: {e}")
+    
+    def _delete_broker_keys(self, broker_name: str, reverse_only: bool = False) -> None:
+        """
+        Delete a broker's cached translations from Redis.
+        
+        Keys are found with SCAN, so this is meant for rare broker-wide
+        changes, not per-lookup paths.
+        
+        Args:
+            broker_name: Name of the broker
+            reverse_only: Only delete broker symbol/token to standard symbol keys
+        """
+        broker = _escape_glob(broker_name)
+        patterns = [f"symbol_mapping_rev:{broker}:*"]
+        if not reverse_only:
+            patterns.append(f"symbol_mapping:{broker}:*")
+        
+        for pattern in patterns:
+            keys = []
+            for key in self.redis_client.scan_iter(match=pattern, count=1000):
+                keys.append(key)
+                if len(keys) == 1000:
+                    self.redis_client.delete(*keys)
+                    keys = []
+            if keys:
+                self.redis_client.delete(*keys)
+    
+    def _publish_bulk_invalidation(self, broker_name: str, standard_symbols: List[str]) -> None:
+        """
+        Drop many changed mappings from Redis and have other workers evict the broker.
+        
+        One broker-wide message replaces a message per symbol; other workers
+        refill their caches on demand. The changed rows' previous broker
+        symbols are unknown, so all of the broker's reverse lookups are
+        dropped.
+        
+        Args:
+            broker_name: Name of the broker
+            standard_symbols: Changed symbols
+        """
+        if not self.redis_client:
+            return
+        
+        try:
+            self._delete_broker_keys(broker_name, reverse_only=True)
+            pipe = self.redis_client.pipeline(transaction=False)
+            for start in range(0, len(standard_symbols), 1000):
+                pipe.delete(*(
+                    _redis_key(broker_name, symbol)
+                    for symbol in standard_symbols[start:start + 1000]
+                ))
+            pipe.publish(
+                INVALIDATION_CHANNEL,
+                orjson.dumps({'broker_name': broker_name, 'standard_symbol': None})
+            )
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to publish symbol mapping invalidation: {e}")
+    
+    def _on_invalidation(self, message: Dict[str, Any]) -> None:
+        """Evict mappings named in an invalidation message from the local cache."""
+        try:
+            payload = orjson.loads(message['data'])
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed symbol mapping invalidation: {e}")
+            return
+        
+        broker_name = payload.get('broker_name')
+        standard_symbol = payload.get('standard_symbol')
+        if standard_symbol is None:
+            self.cache.clear_broker(broker_name)
+        else:
+            self.cache.remove_mapping(broker_name, standard_symbol)
+    
+    def start_invalidation_listener(self) -> bool:
+        """
+        Subscribe to mapping invalidations published by other workers.
+        
+        Meant for long-lived processes that hold one service instance; the
+        subscription shares the process-wide Redis listener thread until
+        stop_invalidation_listener is called.
+        
+        Returns:
+            True if the listener is running, False if Redis is unavailable
+        """
+        if self._invalidation_listener is not None:
+            return True
+        if not self.redis_client:
+            return False
+        
+        try:
+            self._invalidation_listener = get_redis_manager().subscribe(
+                INVALIDATION_CHANNEL, self._on_invalidation
+            )
+        except Exception as e:
+            logger.warning(f"Failed to subscribe to symbol mapping invalidations: {e}")
+            return False
+        
+        logger.info("Listening for symbol mapping invalidations")
+        return True
+    
+    def stop_invalidation_listener(self) -> None:
+        """Stop listening for invalidations, if subscribed."""
+        if self._invalidation_listener is not None:
+            self._invalidation_listener()
+            self._invalidation_listener = None
@@ -4,13 +4,31 @@ import os
 import base64
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 from typing import Optional
 
 
+# Leading byte of AES-GCM ciphertexts. Legacy Fernet tokens start with
+# base64 text, so this byte never begins one.
+_AESGCM_FORMAT = b'\x02'
+_NONCE_SIZE = 12
+
+# HKDF label for the AES-GCM key. The configured key is also Fernet's
+# signing and encryption key, so AES-GCM gets its own derived key.
+_AESGCM_KEY_INFO = b'velox-credential-encryption:aes-256-gcm'
+
+
 class CredentialEncryption:
-    """AES-256 encryption for broker credentials."""
+    """
+    AES-256-GCM encryption for broker credentials.
+    
+    Ciphertexts are base64(format byte || nonce || ciphertext || tag), under
+    a key derived from the configured key with HKDF-SHA256. Values written
+    by the previous Fernet scheme remain decryptable.
+    """
     
     def __init__(self, encryption_key: Optional[str] = None):
         """
@@ -24,7 +42,14 @@ class CredentialEncryption:
             if not encryption_key:
                 raise ValueError("ENCRYPTION_KEY environment variable not set")
         
-        self.fernet = Fernet(encryption_key.encode() if isinstance(encryption_key, str) else encryption_key)
+        key = encryption_key.encode() if isinstance(encryption_key, str) else encryption_key
+        self.fernet = Fernet(key)
+        self.aesgcm = AESGCM(HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=_AESGCM_KEY_INFO
+        ).derive(base64.urlsafe_b64decode(key)))
     
     @staticmethod
     def generate_key() -> str:
@@ -71,8 +96,9 @@ class CredentialEncryption:
         Returns:
             Base64-encoded encrypted string
         """
-        encrypted = self.fernet.encrypt(plaintext.encode())
-        return base64.urlsafe_b64encode(encrypted).decode()
+        nonce = os.urandom(_NONCE_SIZE)
+        encrypted = self.aesgcm.encrypt(nonce, plaintext.encode(), None)
+        return base64.urlsafe_b64encode(_AESGCM_FORMAT + nonce + encrypted).decode()
     
     def decrypt(self, ciphertext: str) -> str:
         """
@@ -89,7 +115,11 @@ class CredentialEncryption:
         """
         try:
             decoded = base64.urlsafe_b64decode(ciphertext.encode())
-            decrypted = self.fernet.decrypt(decoded)
+            if decoded[:1] == _AESGCM_FORMAT:
+                nonce = decoded[1:1 + _NONCE_SIZE]
+                decrypted = self.aesgcm.decrypt(nonce, decoded[1 + _NONCE_SIZE:], None)
+            else:
+                decrypted = self.fernet.decrypt(decoded)
             return decrypted.decode()
         except Exception as e:
             raise ValueError(f"Decryption failed: {str(e)}")
@@ -0,0 +1,46 @@
+"""
+Identifier generation utilities.
+"""
+import os
+import time
+import uuid
+from functools import lru_cache
+
+_VERSION_MASK = 0xF << 76
+_VARIANT_MASK = 0x3 << 62
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+    
+    The leading 48 bits hold the Unix timestamp in milliseconds and the
+    rest is random, so new primary keys land at the right-hand edge of the
+    B-tree index instead of at random pages.
+    
+    Returns:
+        UUID version 7
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = (value & ~_VERSION_MASK) | (0x7 << 76)
+    value = (value & ~_VARIANT_MASK) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
+@lru_cache(maxsize=4096)
+def uuid_str(value: uuid.UUID) -> str:
+    """
+    Get the string form of a UUID, shared across calls.
+    
+    Foreign keys such as account IDs repeat across thousands of rows;
+    caching their string form lets every data object reuse one string
+    instead of allocating a new 36-character copy per row.
+    
+    Args:
+        value: UUID to format
+        
+    Returns:
+        Canonical string form of the UUID
+    """
+    return str(value)
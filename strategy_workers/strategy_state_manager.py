@@ -51,8 +51,10 @@ class StrategyStateManager:
                 "custom_state": state.custom_state
             }
             
+            pipe = self.redis.pipeline(transaction=False)
+            
             # Save to Redis with 24-hour expiration
-            self.redis.setex(
+            pipe.setex(
                 key,
                 86400,  # 24 hours
                 json.dumps(state_dict)
@@ -60,9 +62,10 @@ class StrategyStateManager:
             
             # Add to active strategies set if running
             if state.status == StrategyStatus.RUNNING:
-                self.redis.sadd(self.active_strategies_key, state.strategy_id)
+                pipe.sadd(self.active_strategies_key, state.strategy_id)
             else:
-                self.redis.srem(self.active_strategies_key, state.strategy_id)
+                pipe.srem(self.active_strategies_key, state.strategy_id)
+            pipe.execute()
             
             logger.debug(f"Saved state for strategy {state.strategy_id}")
             
@@ -118,8 +121,10 @@ class StrategyStateManager:
         """
         try:
             key = f"{self.state_prefix}{strategy_id}"
-            self.redis.delete(key)
-            self.redis.srem(self.active_strategies_key, strategy_id)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.delete(key)
+            pipe.srem(self.active_strategies_key, strategy_id)
+            pipe.execute()
             logger.debug(f"Deleted state for strategy {strategy_id}")
             
         except Exception as e:
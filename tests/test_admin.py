@@ -2,6 +2,8 @@
 Unit tests for admin dashboard and monitoring functionality.
 Tests admin data aggregation, access control, and user management.
 """
+import os
+import signal
 import pytest
 import uuid
 from datetime import datetime, timedelta
@@ -411,5 +413,63 @@ class TestUserManagement:
         assert trader_user.failed_login_attempts == 0
 
 
+class TestMonitoringProcess:
+    """Test the monitoring process entry point."""
+    
+    def test_main_collects_metrics_and_stops_on_sigterm(self):
+        """Test main() connects to its services, collects once and exits on SIGTERM."""
+        from shared.database import connection as db_connection
+        from shared.redis import connection as redis_connection
+        from shared.services import monitoring_service, monitoring_task
+        
+        redis_client = MagicMock()
+        # Breach clock: "just started" for every threshold check
+        redis_client.pipeline.return_value.execute.return_value = [True, None]
+        
+        def info():
+            # The first collection cycle is done; shut the process down
+            os.kill(os.getpid(), signal.SIGTERM)
+            return {'used_memory': 0}
+        redis_client.info.side_effect = info
+        
+        redis_manager = MagicMock()
+        redis_manager.client = redis_client
+        db_manager = MagicMock()
+        db_manager.get_pool_status.return_value = {'size': 5, 'checked_out': 1, 'overflow': 0}
+        
+        with patch.object(redis_connection, '_redis_manager', None), \
+             patch.object(redis_connection, 'RedisManager', return_value=redis_manager), \
+             patch.object(db_connection, '_db_manager', None), \
+             patch.object(db_connection, 'DatabaseManager', return_value=db_manager), \
+             patch.object(monitoring_service, '_monitoring_service', None), \
+             patch.object(monitoring_task, '_monitoring_task', None), \
+             patch.object(monitoring_task, 'setup_logging'):
+            monitoring_task.main()
+            task = monitoring_task._monitoring_task
+        
+        redis_manager.initialize.assert_called_once()
+        db_manager.initialize.assert_called_once()
+        redis_client.info.assert_called_once()
+        db_manager.get_pool_status.assert_called()
+        assert task.running is False
+
+
+class TestMetricThresholds:
+    """Test metric threshold breach tracking."""
+    
+    def test_recovered_metric_clears_breach_started_elsewhere(self):
+        """Test a metric under its threshold clears the breach clock even if another process set it."""
+        from shared.services.monitoring_service import MonitoringService
+        
+        with patch('shared.services.monitoring_service.get_redis_client') as get_redis_client:
+            service = MonitoringService()
+        pipe = MagicMock()
+        
+        assert service._check_threshold('cpu_percent', 10.0, pipe=pipe) is None
+        
+        pipe.delete.assert_called_once_with('metric_breach:cpu_percent')
+        get_redis_client.return_value.delete.assert_not_called()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
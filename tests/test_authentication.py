@@ -373,6 +373,47 @@ class TestSessionManagement:
         # Validate session should fail
         validated_user = auth_service.validate_session(token)
         assert validated_user is None
+    
+    def test_session_stores_token_digest(self, auth_service, db_session):
+        """Test sessions store a SHA-256 digest rather than the raw token."""
+        import hashlib
+        
+        auth_service.register(
+            email="test@example.com",
+            password="SecurePass123!"
+        )
+        user, token = auth_service.login(
+            email="test@example.com",
+            password="SecurePass123!"
+        )
+        
+        session = db_session.query(SessionModel).filter(SessionModel.token == token).first()
+        assert session.token == hashlib.sha256(token.encode()).digest()
+    
+    def test_cleanup_expired_sessions_in_batches(self, auth_service, db_session):
+        """Test expired sessions are pruned across several batches."""
+        user = auth_service.register(
+            email="test@example.com",
+            password="SecurePass123!"
+        )
+        now = datetime.utcnow()
+        for i in range(5):
+            db_session.add(SessionModel(
+                token=f"expired-{i}",
+                user_id=user.id,
+                expires_at=now - timedelta(hours=1),
+                last_activity=now
+            ))
+        db_session.add(SessionModel(
+            token="live",
+            user_id=user.id,
+            expires_at=now + timedelta(hours=1),
+            last_activity=now
+        ))
+        db_session.commit()
+        
+        assert auth_service.cleanup_expired_sessions(batch_size=2) == 5
+        assert db_session.query(SessionModel).count() == 1
 
 
 class TestJWTTokenValidation:
@@ -1,6 +1,8 @@
 """
 Unit tests for backtesting engine.
 """
+import json
+import uuid
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, MagicMock, patch
@@ -10,7 +12,7 @@ from sqlalchemy.orm import sessionmaker
 from shared.database.connection import Base
 from shared.models.backtest import (
     Backtest, BacktestConfig, BacktestTrade, EquityPoint,
-    PerformanceMetrics, BacktestStatus
+    PerformanceMetrics, BacktestResult, BacktestStatus
 )
 from strategy_workers.strategy_interface import (
     IStrategy, StrategyConfig, MultiTimeframeData, Signal, Candle
@@ -159,6 +161,20 @@ class TestBacktestConfig:
         backtest_config.slippage = 0.15  # 15% is too high
         with pytest.raises(ValueError, match="Slippage must be between 0 and 0.1"):
             backtest_config.validate()
+    
+    def test_negative_commission_raises_error(self, backtest_config):
+        """Test negative commission raises error."""
+        backtest_config.commission = -0.01
+        with pytest.raises(ValueError, match="Commission must be between 0 and 0.1"):
+            backtest_config.validate()
+    
+    def test_first_failing_check_is_reported(self, backtest_config):
+        """Test that the earliest check wins when several fail."""
+        backtest_config.initial_capital = 0
+        backtest_config.commission = 0.5
+        backtest_config.timeframes = []
+        with pytest.raises(ValueError, match="At least one timeframe is required"):
+            backtest_config.validate()
 
 
 class TestMultiTimeframeDataSynchronizer:
@@ -418,5 +434,76 @@ class TestMetricsCalculator:
         assert metrics.win_rate == 0.0
 
 
+class TestBacktestSerialization:
+    """Test backtest result serialization."""
+    
+    @pytest.fixture
+    def backtest_result(self, backtest_config):
+        trade = BacktestTrade(
+            entry_date=datetime(2024, 1, 1, 10, 0),
+            exit_date=datetime(2024, 1, 1, 11, 0, 0, 250000),
+            symbol='TEST', side='long',
+            entry_price=100.0, exit_price=110.0, quantity=10,
+            pnl=100.0, pnl_percent=10.0, commission=0.5,
+            holding_time_seconds=3600.25
+        )
+        equity_curve = [
+            EquityPoint(timestamp=datetime(2024, 1, 1, 9, i), equity=100000.0 + i, drawdown=0.1 * i)
+            for i in range(5)
+        ]
+        metrics = MetricsCalculator.calculate_metrics(
+            trades=[trade],
+            equity_curve=equity_curve,
+            initial_capital=backtest_config.initial_capital,
+            start_date=backtest_config.start_date,
+            end_date=backtest_config.end_date
+        )
+        return BacktestResult(
+            id='test-backtest-id',
+            config=backtest_config,
+            metrics=metrics,
+            trades=[trade],
+            equity_curve=equity_curve,
+            completed_at=datetime(2024, 1, 2),
+            status=BacktestStatus.COMPLETED
+        )
+    
+    def test_to_json_matches_to_dict(self, backtest_result):
+        """Test that JSON output is the same document as to_dict()."""
+        assert json.loads(backtest_result.to_json()) == backtest_result.to_dict()
+    
+    def test_from_dicts_matches_from_dict(self, backtest_result):
+        """Test that bulk parsing yields the same objects as per-row parsing."""
+        data = backtest_result.to_dict()
+        
+        assert BacktestTrade.from_dicts(data['trades']) == [
+            BacktestTrade.from_dict(t) for t in data['trades']
+        ]
+        assert EquityPoint.from_dicts(data['equity_curve']) == [
+            EquityPoint.from_dict(p) for p in data['equity_curve']
+        ]
+        assert BacktestTrade.from_dicts([]) == []
+    
+    def test_store_results_round_trip(self, backtest_result):
+        """Test that results stored on the ORM row load back unchanged."""
+        data = backtest_result.to_dict()
+        backtest = Backtest(
+            strategy_id=uuid.uuid4(),
+            account_id=uuid.uuid4(),
+            config=data['config'],
+            status=BacktestStatus.COMPLETED,
+            completed_at=backtest_result.completed_at
+        )
+        backtest.store_results(
+            backtest_result.metrics, backtest_result.trades, backtest_result.equity_curve
+        )
+        
+        assert set(backtest.metrics) == {'metrics'}
+        loaded = BacktestResult.from_orm(backtest)
+        assert loaded.trades == backtest_result.trades
+        assert loaded.equity_curve == backtest_result.equity_curve
+        assert loaded.metrics == backtest_result.metrics
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
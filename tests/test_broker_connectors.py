@@ -209,6 +209,27 @@ class TestCredentialEncryption:
         with pytest.raises(ValueError):
             encryption2.decrypt(encrypted)
     
+    def test_decrypts_legacy_fernet_ciphertext(self):
+        """Test values encrypted with the previous Fernet scheme still decrypt."""
+        import base64
+        from cryptography.fernet import Fernet
+        
+        key = CredentialEncryption.generate_key()
+        legacy = base64.urlsafe_b64encode(Fernet(key.encode()).encrypt(b"old_secret")).decode()
+        
+        assert CredentialEncryption(key).decrypt(legacy) == "old_secret"
+    
+    def test_tampered_ciphertext_rejected(self):
+        """Test modified ciphertext fails authentication."""
+        import base64
+        
+        encryption = CredentialEncryption(CredentialEncryption.generate_key())
+        raw = bytearray(base64.urlsafe_b64decode(encryption.encrypt("test_secret")))
+        raw[-1] ^= 0x01
+        
+        with pytest.raises(ValueError):
+            encryption.decrypt(base64.urlsafe_b64encode(bytes(raw)).decode())
+    
     def test_key_derivation_from_password(self):
         """Test key derivation from password."""
         password = "my_secure_password"
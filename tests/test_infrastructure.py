@@ -1,8 +1,12 @@
 """
 Test infrastructure setup and configuration.
 """
+import time
+import uuid
+
 import pytest
-from shared.config import get_settings
+from shared.config import Settings, get_settings
+from shared.utils.ids import uuid7
 
 
 def test_settings_load():
@@ -60,3 +64,64 @@ def test_redis_configuration():
     assert settings.redis_max_connections > 0
     assert settings.redis_socket_timeout > 0
     assert settings.redis_socket_connect_timeout > 0
+
+
+def test_settings_from_env_coerces_types():
+    """Test that environment strings are coerced to field types."""
+    settings = Settings.from_env({
+        "DB_PORT": "6543",
+        "debug": "true",
+        "REDIS_PASSWORD": "secret",
+    })
+    assert settings.db_port == 6543
+    assert settings.debug is True
+    assert settings.redis_password == "secret"
+    assert settings.db_host == "localhost"
+
+
+def test_settings_from_env_rejects_invalid_values():
+    """Test that malformed environment values raise."""
+    with pytest.raises(ValueError):
+        Settings.from_env({"DEBUG": "maybe"})
+    with pytest.raises(ValueError):
+        Settings.from_env({"DB_PORT": "not-a-port"})
+
+
+def test_uuid7_is_time_ordered():
+    """Test that generated IDs are version 7 and sort by creation time."""
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert first.version == 7
+    assert first.variant == uuid.RFC_4122
+    assert first < second
+
+
+def test_small_int_enum_round_trip():
+    """Test that enum columns store declaration-order codes."""
+    from shared.database.types import SmallIntEnum
+    from shared.models.order import OrderStatus
+    column_type = SmallIntEnum(OrderStatus)
+    assert column_type.process_bind_param(OrderStatus.PENDING, None) == 0
+    assert column_type.process_bind_param("filled", None) == 3
+    assert column_type.process_result_value(3, None) is OrderStatus.FILLED
+    assert column_type.process_bind_param(None, None) is None
+
+
+def test_paise_round_trip():
+    """Test that money columns store whole paise and return rupees."""
+    from decimal import Decimal
+    from shared.database.types import Paise
+    column_type = Paise()
+    assert column_type.process_bind_param(101.35, None) == 10135
+    assert column_type.process_bind_param(Decimal('0.005'), None) == 0
+    assert column_type.process_result_value(10135, None) == 101.35
+    assert Paise(asdecimal=True).process_result_value(10135, None) == Decimal('101.35')
+
+
+def test_uuid_str_reuses_strings():
+    """Test that repeated UUIDs format to the same string object."""
+    from shared.utils.ids import uuid_str
+    account_id = uuid.uuid4()
+    assert uuid_str(account_id) == str(account_id)
+    assert uuid_str(uuid.UUID(str(account_id))) is uuid_str(account_id)
@@ -2,22 +2,29 @@
 Unit tests for notification service.
 Tests notification delivery through different channels, trigger logic, and preferences.
 """
+import json
 import pytest
 import uuid
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import sessionmaker
 
 from shared.database.connection import Base
-from shared.models import User, UserRole, Notification
+from shared.models import User, UserRole
 from shared.models.notification import (
     NotificationData, NotificationRequest, NotificationType,
     NotificationSeverity, NotificationChannel, NotificationChannelConfig,
-    NotificationPreferences
+    NotificationPreferences, COPY_THRESHOLD
 )
 from shared.services.notification_service import NotificationService
 from shared.services.notification_triggers import NotificationTriggers
+from shared.services.notification_tasks import (
+    NOTIFICATIONS_QUEUE, URGENT_NOTIFICATIONS_QUEUE,
+    create_notification_task, create_notifications_task,
+    enqueue_notification, flush_notifications
+)
 from shared.utils.password import hash_password
 
 
@@ -92,6 +99,62 @@ class TestNotificationService:
         assert notification.title == "Order Executed"
         assert notification.severity == NotificationSeverity.INFO
     
+    def test_bulk_create_notifications(self, db_session, test_user, notification_service):
+        """Test creating a fan-out of notifications with one insert and commit."""
+        requests = [
+            NotificationRequest(
+                user_id=str(uuid.uuid4()),
+                type=NotificationType.SYSTEM_ALERT,
+                title="System Alert: cpu_percent",
+                message="CPU usage is 95.00%",
+                severity=NotificationSeverity.WARNING,
+                channels=[NotificationChannel.IN_APP]
+            )
+            for _ in range(3)
+        ]
+        
+        with patch.object(notification_service, '_deliver_in_app') as mock_in_app:
+            notifications = notification_service.bulk_create_notifications(db_session, requests)
+        
+        db_session.execute.assert_called_once()
+        db_session.commit.assert_called_once()
+        assert [n.user_id for n in notifications] == [r.user_id for r in requests]
+        assert len({n.id for n in notifications}) == 3
+        assert mock_in_app.call_count == 3
+    
+    def test_bulk_create_notifications_copies_large_batches(self, db_session, notification_service):
+        """Test that large batches are loaded with COPY on PostgreSQL."""
+        db_session.get_bind.return_value.dialect = postgresql.dialect()
+        connection = db_session.connection.return_value = MagicMock()
+        connection.dialect = postgresql.dialect()
+        cursor = connection.connection.cursor.return_value.__enter__.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, buf: copied.append((sql, buf.read()))
+        requests = [
+            NotificationRequest(
+                user_id=str(uuid.uuid4()),
+                type=NotificationType.ORDER_EXECUTED,
+                title="Paper Order Executed",
+                message=f"Order\t{i}\nfilled",
+                severity=NotificationSeverity.INFO,
+                channels=[]
+            )
+            for i in range(COPY_THRESHOLD + 1)
+        ]
+        
+        notifications = notification_service.bulk_create_notifications(db_session, requests)
+        
+        db_session.execute.assert_not_called()
+        [(sql, data)] = copied
+        assert sql.startswith('COPY notifications (user_id, type, title, message, severity, created_at, id)')
+        lines = data.splitlines()
+        assert len(lines) == len(requests)
+        fields = lines[0].split('\t')
+        assert fields[0] == requests[0].user_id
+        assert fields[1] == '0'
+        assert fields[3] == 'Order\\t0\\nfilled'
+        assert fields[6] == notifications[0].id
+    
     def test_get_notification_history(self, db_session, test_user, notification_service):
         """Test retrieving notification history."""
         # Create multiple notifications
@@ -268,6 +331,38 @@ class TestNotificationDelivery:
         # Verify notifications were added to batch
         assert len(notification_service._notification_batch) > 0
     
+    def test_process_batches_delivers_only_due_batches(self, db_session, test_user, notification_service):
+        """Test that batches are flushed by deadline, earliest first."""
+        assert notification_service.next_batch_deadline() is None
+        
+        for i in range(2):
+            request = NotificationRequest(
+                user_id=str(test_user.id),
+                type=NotificationType.SYSTEM_ALERT,
+                title=f"Info {i}",
+                message=f"Info message {i}",
+                severity=NotificationSeverity.INFO,
+                channels=[NotificationChannel.EMAIL]
+            )
+            with patch('shared.services.notification_service.push_notification', create=True):
+                notification_service.create_notification(db_session, request)
+        
+        deadline = notification_service.next_batch_deadline()
+        assert deadline is not None
+        
+        with patch.object(notification_service, '_deliver_batched_email') as mock_email:
+            notification_service.process_batches(db_session)
+            mock_email.assert_not_called()
+            
+            with patch('shared.services.notification_service.time.monotonic', return_value=deadline):
+                notification_service.process_batches(db_session)
+            
+            mock_email.assert_called_once()
+            assert len(mock_email.call_args[0][2]) == 2
+        
+        assert notification_service.next_batch_deadline() is None
+        assert not notification_service._notification_batch
+    
     def test_immediate_delivery_for_critical(self, db_session, test_user, notification_service):
         """Test that critical notifications are delivered immediately without batching."""
         request = NotificationRequest(
@@ -290,140 +385,214 @@ class TestNotificationDelivery:
 class TestNotificationTriggers:
     """Test notification trigger logic for various events."""
     
-    def test_trigger_order_executed(self, db_session, test_user, notification_triggers):
+    @staticmethod
+    def _queued_request(mock_enqueue) -> NotificationRequest:
+        """Get the single request a trigger queued."""
+        mock_enqueue.assert_called_once()
+        return mock_enqueue.call_args[0][0]
+    
+    @patch('shared.services.notification_triggers.enqueue_notification')
+    def test_trigger_order_executed(self, mock_enqueue, db_session, test_user, notification_triggers):
         """Test order executed notification trigger."""
-        with patch('shared.services.notification_service.push_notification'):
-            notification_triggers.trigger_order_executed(
-                db=db_session,
-                user_id=str(test_user.id),
-                order_id=str(uuid.uuid4()),
-                symbol="RELIANCE",
-                side="buy",
-                quantity=10,
-                price=2500.50,
-                trading_mode="paper"
-            )
-        
-        # Verify notification was created
-        notifications = db_session.query(Notification).filter(
-            Notification.user_id == test_user.id,
-            Notification.type == NotificationType.ORDER_EXECUTED
-        ).all()
+        notification_triggers.trigger_order_executed(
+            db=db_session,
+            user_id=str(test_user.id),
+            order_id=str(uuid.uuid4()),
+            symbol="RELIANCE",
+            side="buy",
+            quantity=10,
+            price=2500.50,
+            trading_mode="paper"
+        )
         
-        assert len(notifications) == 1
-        assert "RELIANCE" in notifications[0].message
-        assert "Paper" in notifications[0].title
+        request = self._queued_request(mock_enqueue)
+        assert request.type == NotificationType.ORDER_EXECUTED
+        assert "RELIANCE" in request.message
+        assert "Paper" in request.title
+        db_session.add.assert_not_called()
     
-    def test_trigger_strategy_error(self, db_session, test_user, notification_triggers):
+    @patch('shared.services.notification_triggers.enqueue_notification')
+    def test_trigger_strategy_error(self, mock_enqueue, db_session, test_user, notification_triggers):
         """Test strategy error notification trigger."""
-        with patch('shared.services.notification_service.push_notification'):
-            notification_triggers.trigger_strategy_error(
-                db=db_session,
-                user_id=str(test_user.id),
-                strategy_id=str(uuid.uuid4()),
-                strategy_name="MA Crossover",
-                error_message="Division by zero",
-                error_details="Error in indicator calculation"
-            )
-        
-        # Verify notification was created
-        notifications = db_session.query(Notification).filter(
-            Notification.user_id == test_user.id,
-            Notification.type == NotificationType.STRATEGY_ERROR
-        ).all()
+        notification_triggers.trigger_strategy_error(
+            db=db_session,
+            user_id=str(test_user.id),
+            strategy_id=str(uuid.uuid4()),
+            strategy_name="MA Crossover",
+            error_message="Division by zero",
+            error_details="Error in indicator calculation"
+        )
         
-        assert len(notifications) == 1
-        assert notifications[0].severity == NotificationSeverity.ERROR
-        assert "MA Crossover" in notifications[0].message
+        request = self._queued_request(mock_enqueue)
+        assert request.type == NotificationType.STRATEGY_ERROR
+        assert request.severity == NotificationSeverity.ERROR
+        assert "MA Crossover" in request.message
     
-    def test_trigger_threshold_alert(self, db_session, test_user, notification_triggers):
+    @patch('shared.services.notification_triggers.enqueue_notification')
+    def test_trigger_threshold_alert(self, mock_enqueue, db_session, test_user, notification_triggers):
         """Test threshold alert notification trigger."""
-        with patch('shared.services.notification_service.push_notification'):
-            notification_triggers.trigger_threshold_alert(
-                db=db_session,
-                user_id=str(test_user.id),
-                alert_type="loss",
-                symbol="TCS",
-                current_value=-5000.0,
-                threshold_value=-5000.0,
-                trading_mode="live"
-            )
-        
-        # Verify notification was created
-        notifications = db_session.query(Notification).filter(
-            Notification.user_id == test_user.id,
-            Notification.type == NotificationType.THRESHOLD_ALERT
-        ).all()
+        notification_triggers.trigger_threshold_alert(
+            db=db_session,
+            user_id=str(test_user.id),
+            alert_type="loss",
+            symbol="TCS",
+            current_value=-5000.0,
+            threshold_value=-5000.0,
+            trading_mode="live"
+        )
         
-        assert len(notifications) == 1
-        assert "Loss Threshold" in notifications[0].title
-        assert "TCS" in notifications[0].message
+        request = self._queued_request(mock_enqueue)
+        assert request.type == NotificationType.THRESHOLD_ALERT
+        assert "Loss Threshold" in request.title
+        assert "TCS" in request.message
     
-    def test_trigger_connection_lost(self, db_session, test_user, notification_triggers):
+    @patch('shared.services.notification_triggers.enqueue_notification')
+    def test_trigger_connection_lost(self, mock_enqueue, db_session, test_user, notification_triggers):
         """Test connection lost notification trigger."""
-        with patch('shared.services.notification_service.push_notification'):
-            notification_triggers.trigger_connection_lost(
-                db=db_session,
-                user_id=str(test_user.id),
-                connection_type="broker",
-                connection_name="Angel One",
-                error_message="Connection timeout"
-            )
-        
-        # Verify notification was created
-        notifications = db_session.query(Notification).filter(
-            Notification.user_id == test_user.id,
-            Notification.type == NotificationType.CONNECTION_LOST
-        ).all()
+        notification_triggers.trigger_connection_lost(
+            db=db_session,
+            user_id=str(test_user.id),
+            connection_type="broker",
+            connection_name="Angel One",
+            error_message="Connection timeout"
+        )
         
-        assert len(notifications) == 1
-        assert "Angel One" in notifications[0].message
+        request = self._queued_request(mock_enqueue)
+        assert request.type == NotificationType.CONNECTION_LOST
+        assert "Angel One" in request.message
     
-    def test_trigger_trailing_stop_triggered(self, db_session, test_user, notification_triggers):
+    @patch('shared.services.notification_triggers.enqueue_notification')
+    def test_trigger_trailing_stop_triggered(self, mock_enqueue, db_session, test_user, notification_triggers):
         """Test trailing stop triggered notification."""
-        with patch('shared.services.notification_service.push_notification'):
-            notification_triggers.trigger_trailing_stop_triggered(
-                db=db_session,
+        notification_triggers.trigger_trailing_stop_triggered(
+            db=db_session,
+            user_id=str(test_user.id),
+            position_id=str(uuid.uuid4()),
+            symbol="INFY",
+            side="long",
+            stop_price=1450.0,
+            current_price=1445.0,
+            trading_mode="live"
+        )
+        
+        request = self._queued_request(mock_enqueue)
+        assert request.type == NotificationType.TRAILING_STOP_TRIGGERED
+        assert "INFY" in request.message
+        assert request.severity == NotificationSeverity.WARNING
+    
+    @patch('shared.services.notification_triggers.enqueue_notification')
+    def test_trigger_loss_limit_breached(self, mock_enqueue, db_session, test_user, notification_triggers):
+        """Test loss limit breached notification trigger."""
+        notification_triggers.trigger_loss_limit_breached(
+            db=db_session,
+            user_id=str(test_user.id),
+            account_id=str(uuid.uuid4()),
+            trading_mode="live",
+            current_loss=-10500.0,
+            loss_limit=-10000.0
+        )
+        
+        request = self._queued_request(mock_enqueue)
+        assert request.type == NotificationType.LOSS_LIMIT_BREACHED
+        assert request.severity == NotificationSeverity.CRITICAL
+        assert "10500" in request.message
+
+
+class TestNotificationTasks:
+    """Test queueing notifications for Celery workers."""
+    
+    def test_request_round_trips_through_payload(self, test_user):
+        """Test that a request survives JSON serialization as a task payload."""
+        request = NotificationRequest(
+            user_id=str(test_user.id),
+            type=NotificationType.ORDER_EXECUTED,
+            title="Paper Order Executed",
+            message="Your BUY order for 10 shares of RELIANCE was executed",
+            severity=NotificationSeverity.INFO,
+            channels=(NotificationChannel.IN_APP, NotificationChannel.EMAIL),
+            metadata={'symbol': 'RELIANCE', 'quantity': 10}
+        )
+        
+        payload = json.loads(json.dumps(request.to_dict()))
+        
+        assert NotificationRequest.from_dict(payload) == request
+    
+    @pytest.mark.parametrize("severity, queue", [
+        (NotificationSeverity.INFO, NOTIFICATIONS_QUEUE),
+        (NotificationSeverity.WARNING, NOTIFICATIONS_QUEUE),
+        (NotificationSeverity.ERROR, URGENT_NOTIFICATIONS_QUEUE),
+    ])
+    def test_enqueue_buffers_and_routes_by_severity(self, severity, queue, test_user):
+        """Test that buffered requests are flushed as a batch to their queue."""
+        requests = [
+            NotificationRequest(
                 user_id=str(test_user.id),
-                position_id=str(uuid.uuid4()),
-                symbol="INFY",
-                side="long",
-                stop_price=1450.0,
-                current_price=1445.0,
-                trading_mode="live"
+                type=NotificationType.SYSTEM_ALERT,
+                title="Alert",
+                message=f"Message {i}",
+                severity=severity
             )
+            for i in range(3)
+        ]
+        
+        with patch('shared.services.notification_tasks._schedule_flush'), \
+                patch.object(create_notifications_task, 'apply_async') as mock_apply:
+            for request in requests:
+                enqueue_notification(request)
+            mock_apply.assert_not_called()
+            
+            assert flush_notifications() == 3
         
-        # Verify notification was created
-        notifications = db_session.query(Notification).filter(
-            Notification.user_id == test_user.id,
-            Notification.type == NotificationType.TRAILING_STOP_TRIGGERED
-        ).all()
-        
-        assert len(notifications) == 1
-        assert "INFY" in notifications[0].message
-        assert notifications[0].severity == NotificationSeverity.WARNING
+        mock_apply.assert_called_once_with(
+            args=([request.to_dict() for request in requests],), queue=queue, routing_key=queue
+        )
     
-    def test_trigger_loss_limit_breached(self, db_session, test_user, notification_triggers):
-        """Test loss limit breached notification trigger."""
-        with patch('shared.services.notification_service.push_notification'):
-            notification_triggers.trigger_loss_limit_breached(
-                db=db_session,
+    def test_flush_keeps_requests_when_broker_fails(self, test_user):
+        """Test that a failed flush puts the batch back in the buffer."""
+        requests = [
+            NotificationRequest(
                 user_id=str(test_user.id),
-                account_id=str(uuid.uuid4()),
-                trading_mode="live",
-                current_loss=-10500.0,
-                loss_limit=-10000.0
+                type=NotificationType.ORDER_EXECUTED,
+                title="Paper Order Executed",
+                message=f"Message {i}",
+                severity=NotificationSeverity.INFO
             )
+            for i in range(3)
+        ]
         
-        # Verify notification was created
-        notifications = db_session.query(Notification).filter(
-            Notification.user_id == test_user.id,
-            Notification.type == NotificationType.LOSS_LIMIT_BREACHED
-        ).all()
+        with patch('shared.services.notification_tasks._schedule_flush'), \
+                patch.object(create_notifications_task, 'apply_async') as mock_apply:
+            for request in requests:
+                enqueue_notification(request)
+            
+            mock_apply.side_effect = ConnectionError("broker down")
+            with pytest.raises(ConnectionError):
+                flush_notifications()
+            
+            mock_apply.side_effect = None
+            assert flush_notifications() == 3
         
-        assert len(notifications) == 1
-        assert notifications[0].severity == NotificationSeverity.CRITICAL
-        assert "10500" in notifications[0].message
+        assert mock_apply.call_args.kwargs['args'] == ([request.to_dict() for request in requests],)
+    
+    def test_enqueue_sends_critical_immediately(self, test_user):
+        """Test that critical notifications skip the buffer."""
+        request = NotificationRequest(
+            user_id=str(test_user.id),
+            type=NotificationType.LOSS_LIMIT_BREACHED,
+            title="Loss Limit Breached",
+            message="Message",
+            severity=NotificationSeverity.CRITICAL
+        )
+        
+        with patch.object(create_notification_task, 'apply_async') as mock_apply:
+            enqueue_notification(request)
+        
+        mock_apply.assert_called_once_with(
+            args=(request.to_dict(),),
+            queue=URGENT_NOTIFICATIONS_QUEUE,
+            routing_key=URGENT_NOTIFICATIONS_QUEUE
+        )
+        assert flush_notifications() == 0
 
 
 class TestNotificationPreferences:
@@ -865,3 +865,38 @@ class TestIntegration:
             new_limit=Decimal('80000.00')
         )
         assert result.is_breached is False
+
+
+class TestRiskDataSerialization:
+    """Test JSON encoding of risk data classes."""
+    
+    def test_dump_json_encodes_decimals_and_datetimes(self):
+        """Test Decimals become floats and datetimes ISO strings."""
+        import json
+        from shared.models.risk_data import RiskLimitsData, dump_json
+        
+        account_id = uuid.uuid4()
+        updated_at = datetime(2024, 1, 15, 10, 30)
+        risk_limits = RiskLimitsData(
+            account_id=account_id,
+            trading_mode='paper',
+            max_loss_limit=Decimal('50000.50'),
+            current_loss=Decimal('1250.25'),
+            is_breached=False,
+            breached_at=None,
+            acknowledged=False,
+            updated_at=updated_at
+        )
+        
+        payload = json.loads(dump_json({'success': True, 'data': risk_limits}))
+        
+        assert payload['data'] == {
+            'account_id': str(account_id),
+            'trading_mode': 'paper',
+            'max_loss_limit': 50000.5,
+            'current_loss': 1250.25,
+            'is_breached': False,
+            'breached_at': None,
+            'acknowledged': False,
+            'updated_at': updated_at.isoformat()
+        }
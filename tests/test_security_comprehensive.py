@@ -676,6 +676,20 @@ class TestBrokerCredentialEncryption:
         assert 'api_secret' not in broker_response
         assert 'encrypted_api_key' not in broker_response
         assert 'encrypted_api_secret' not in broker_response
+    
+    def test_aesgcm_key_is_derived_not_the_fernet_key(self):
+        """Test AES-GCM does not reuse the raw Fernet key."""
+        import base64
+        from cryptography.exceptions import InvalidTag
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        
+        key = CredentialEncryption.generate_key()
+        encryptor = CredentialEncryption(key)
+        decoded = base64.urlsafe_b64decode(encryptor.encrypt("test_api_key_12345"))
+        
+        assert encryptor.decrypt(base64.urlsafe_b64encode(decoded).decode()) == "test_api_key_12345"
+        with pytest.raises(InvalidTag):
+            AESGCM(base64.urlsafe_b64decode(key)).decrypt(decoded[1:13], decoded[13:], None)
 
 
 class TestSessionManagement:
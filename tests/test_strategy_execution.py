@@ -150,16 +150,15 @@ class TestStrategyStateManager:
             last_update=datetime.utcnow()
         )
         
-        # Mock Redis setex
-        redis_mock.setex = Mock()
-        redis_mock.sadd = Mock()
+        pipe = redis_mock.pipeline.return_value
         
         # Save state
         state_manager.save_state(state)
         
-        # Verify Redis was called
-        assert redis_mock.setex.called
-        assert redis_mock.sadd.called
+        # Verify the writes were batched on one pipeline
+        assert pipe.setex.called
+        assert pipe.sadd.called
+        assert pipe.execute.call_count == 1
     
     def test_update_status(self, state_manager, redis_mock):
         """Test updating strategy status"""
@@ -6,6 +6,7 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
+from unittest.mock import MagicMock
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -17,7 +18,7 @@ from shared.services.symbol_mapping_service import SymbolMappingService
 @pytest.fixture
 def db_session():
     """Create an in-memory SQLite database for testing."""
-    from sqlalchemy import Table, Column, Integer, String, Numeric, DateTime, MetaData
+    from sqlalchemy import Table, Column, Integer, String, Numeric, DateTime, MetaData, Index
     
     engine = create_engine('sqlite:///:memory:')
     metadata = MetaData()
@@ -37,7 +38,8 @@ def db_session():
         Column('lot_size', Integer, nullable=False, default=1),
         Column('tick_size', Numeric(10, 4), nullable=False, default=0.05),
         Column('created_at', DateTime, nullable=False),
-        Column('updated_at', DateTime, nullable=False)
+        Column('updated_at', DateTime, nullable=False),
+        Index('idx_symbol_mappings_broker', 'broker_name', 'standard_symbol', unique=True)
     )
     
     metadata.create_all(engine)
@@ -247,6 +249,28 @@ RELIANCE,RELIANCE-EQ,9999,NSE,EQ,1,0.05
             os.unlink(temp_path)
 
 
+    def test_load_csv_duplicate_symbol_last_row_wins(self, symbol_service):
+        """Test that a symbol repeated in the CSV keeps its last row."""
+        csv_content = """standard_symbol,broker_symbol,broker_token,exchange,instrument_type,lot_size,tick_size
+INFY,INFY-EQ,1594,NSE,EQ,1,0.05
+INFY,INFY-EQ,1595,NSE,EQ,1,0.05
+"""
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_content)
+            temp_path = f.name
+        
+        try:
+            result = symbol_service.load_mappings_from_csv("Angel One", temp_path)
+            
+            assert result['success'] is True
+            assert result['loaded'] == 1
+            assert symbol_service.get_broker_symbol("Angel One", "INFY") == "1595"
+        
+        finally:
+            os.unlink(temp_path)
+
+
 class TestMappingManagement:
     """Test mapping management operations."""
     
@@ -291,6 +315,49 @@ class TestMappingManagement:
         # Verify other broker mappings still exist
         upstox_mappings = symbol_service.get_all_mappings("Upstox")
         assert len(upstox_mappings) == 1
+    
+    def test_delete_mapping_drops_redis_keys(self, symbol_service, sample_mappings):
+        """Test that deleting a mapping drops its forward and reverse Redis keys."""
+        symbol_service.redis_client = MagicMock()
+        
+        symbol_service.delete_mapping("Angel One", "RELIANCE")
+        
+        symbol_service.redis_client.delete.assert_called_once_with(
+            "symbol_mapping:Angel One:RELIANCE",
+            "symbol_mapping_rev:Angel One:RELIANCE-EQ",
+            "symbol_mapping_rev:Angel One:2885"
+        )
+    
+    def test_clear_broker_mappings_drops_redis_keys(self, symbol_service, sample_mappings):
+        """Test that clearing a broker drops all of its cached Redis translations."""
+        symbol_service.redis_client = MagicMock()
+        symbol_service.redis_client.scan_iter.side_effect = lambda match, count: {
+            "symbol_mapping_rev:Angel One:*": ["symbol_mapping_rev:Angel One:2885"],
+            "symbol_mapping:Angel One:*": ["symbol_mapping:Angel One:RELIANCE"],
+        }[match]
+        
+        symbol_service.clear_broker_mappings("Angel One")
+        
+        deleted = [c.args for c in symbol_service.redis_client.delete.call_args_list]
+        assert ("symbol_mapping_rev:Angel One:2885",) in deleted
+        assert ("symbol_mapping:Angel One:RELIANCE",) in deleted
+        assert ("symbol_mappings:loaded:Angel One",) in deleted
+    
+    def test_invalidation_message_evicts_cached_mapping(self, symbol_service, sample_mappings):
+        """Test that invalidations from other workers evict local cache entries."""
+        symbol_service.get_broker_symbol("Angel One", "RELIANCE")
+        symbol_service.get_broker_symbol("Angel One", "TCS")
+        
+        symbol_service._on_invalidation(
+            {'data': '{"broker_name": "Angel One", "standard_symbol": "RELIANCE"}'}
+        )
+        assert symbol_service.cache.get_mapping("Angel One", "RELIANCE") is None
+        assert symbol_service.cache.get_mapping("Angel One", "TCS") is not None
+        
+        symbol_service._on_invalidation(
+            {'data': '{"broker_name": "Angel One", "standard_symbol": null}'}
+        )
+        assert symbol_service.cache.get_broker_mappings("Angel One") == {}
 
 
 class TestSymbolMappingCache:
@@ -409,3 +476,24 @@ class TestSymbolMappingCache:
         
         assert cache.get_mapping("Broker1", "TEST1") is None
         assert cache.get_mapping("Broker2", "TEST2") is not None
+    
+    def test_cache_remove_mapping(self):
+        """Test removing a single mapping from cache."""
+        cache = SymbolMappingCache()
+        mapping = SymbolMapping(
+            standard_symbol="TEST",
+            broker_name="TestBroker",
+            broker_symbol="TEST-EQ",
+            broker_token="123",
+            exchange="NSE",
+            instrument_type="EQ",
+            lot_size=1,
+            tick_size=0.05
+        )
+        
+        cache.set_mapping("TestBroker", "TEST", mapping)
+        cache.remove_mapping("TestBroker", "TEST")
+        cache.remove_mapping("TestBroker", "MISSING")
+        
+        assert cache.get_mapping("TestBroker", "TEST") is None
+        assert cache.get_broker_mappings("TestBroker") == {}
@@ -231,15 +231,17 @@ def _load_unread_notifications(user_id: str, limit: int = 50) -> List[Dict[str,
     Returns:
         List of notification dictionaries
     """
-    from sqlalchemy.orm import Session
+    from sqlalchemy.orm import Session, undefer
     from shared.database.connection import get_db_session
     from shared.models import Notification
     
     try:
         with get_db_session() as db:
-            notifications = db.query(Notification).filter(
-            Notification.user_id == user_id,
-            Notification.read_at.is_(None)
+            notifications = db.query(Notification).options(
+                undefer(Notification.message)
+            ).filter(
+                Notification.user_id == user_id,
+                Notification.read_at.is_(None)
             ).order_by(Notification.created_at.desc()).limit(limit).all()
             
             return [
@@ -327,26 +329,20 @@ def _mark_all_notifications_read(user_id: str) -> int:
 
 def _get_unread_count(user_id: str) -> int:
     """
-    Get count of unread notifications for a user.
+    Get count of unread notifications for a user's badge.
     
     Args:
         user_id: User ID
         
     Returns:
-        Number of unread notifications
+        Number of unread notifications, capped at UNREAD_BADGE_CAP
     """
-    from sqlalchemy.orm import Session
     from shared.database.connection import get_db_session
-    from shared.models import Notification
+    from shared.services.notification_service import get_notification_service
     
     try:
         with get_db_session() as db:
-            count = db.query(Notification).filter(
-                Notification.user_id == user_id,
-                Notification.read_at.is_(None)
-            ).count()
-            
-            return count
+            return get_notification_service().get_unread_count_capped(db, user_id)
         
     except Exception as e:
         logger.error(f"Error getting unread count: {e}")